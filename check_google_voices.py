@@ -1,7 +1,25 @@
-import translator_core as core
+import ast
+import importlib.util
+import pathlib
+
+# Read GOOGLE_VOICES straight from the source so translator_core (and its
+# numpy/openai/logging setup) is never imported just to count a list.
+def load_google_voices():
+    spec = importlib.util.find_spec("translator_core")
+    if spec is None or spec.origin is None:
+        raise ImportError("translator_core not found")
+    tree = ast.parse(pathlib.Path(spec.origin).read_text(encoding="utf-8"))
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(t, ast.Name) and t.id == "GOOGLE_VOICES" for t in node.targets
+        ):
+            return ast.literal_eval(node.value)
+    raise AttributeError("GOOGLE_VOICES")
+
 try:
-    print(f"Google Voices found: {len(core.GOOGLE_VOICES)}")
-    print(f"Sample: {core.GOOGLE_VOICES[0]}")
+    voices = load_google_voices()
+    print(f"Google Voices found: {len(voices)}")
+    print(f"Sample: {voices[0]}")
 except AttributeError:
     print("Error: GOOGLE_VOICES not found in translator_core")
 except Exception as e:
@@ -17,44 +17,152 @@ The script will:
 import os
 import sys
 import platform
+import string
 import subprocess
+import tempfile
+from functools import lru_cache
 from pathlib import Path
 
 
+# --- Launcher templates ---
+# Every shortcut hands off to launcher.py; the command line is shared so the
+# per-platform templates only differ in their container format.
+APP_DESCRIPTION = "GoGospelNow Real-Time Preaching Translator"
+LAUNCH_COMMAND = string.Template('"$python" "$launcher"')
+
+DESKTOP_ENTRY = string.Template("""[Desktop Entry]
+Version=1.0
+Type=Application
+Name=GoGospelNow Translator
+Comment=Real-Time Preaching Translator
+Exec=$command
+Path=$project
+Icon=$icon
+Terminal=false
+Categories=Audio;AudioVideo;Utility;
+StartupNotify=true
+""")
+
+MACOS_LAUNCHER = string.Template("""#!/bin/bash
+cd "$project"
+exec $command
+""")
+
+SHORTCUT_VBS = string.Template('''
+Set WshShell = CreateObject("WScript.Shell")
+Set shortcut = WshShell.CreateShortcut("$shortcut")
+shortcut.TargetPath = "$python"
+shortcut.Arguments = """$launcher"""
+shortcut.WorkingDirectory = "$project"
+shortcut.Description = "$description"
+shortcut.WindowStyle = 7
+$icon_line
+shortcut.Save
+WScript.Echo "Shortcut created successfully!"
+''')
+
+
+@lru_cache(maxsize=1)
+def _system():
+    """Return the platform name, resolved once per run."""
+    return platform.system()
+
+
+@lru_cache(maxsize=1)
 def get_project_root():
     """Get the absolute path to the project root directory."""
     return Path(__file__).parent.resolve()
 
 
+@lru_cache(maxsize=1)
+def _xdg_user_dirs():
+    """Parse ~/.config/user-dirs.dirs (or $XDG_CONFIG_HOME) once into a dict."""
+    config_home = os.environ.get("XDG_CONFIG_HOME") or str(Path.home() / ".config")
+    dirs = {}
+    try:
+        with open(Path(config_home) / "user-dirs.dirs", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#") or "=" not in line:
+                    continue
+                key, value = line.split("=", 1)
+                value = value.strip().strip('"').replace("$HOME", str(Path.home()))
+                dirs[key.strip()] = value
+    except OSError:
+        pass
+    return dirs
+
+
+@lru_cache(maxsize=1)
 def get_desktop_path():
     """Get the path to the user's Desktop folder."""
-    system = platform.system()
+    system = _system()
     
     if system == "Windows":
-        # Try multiple methods to get Desktop path
+        # Try multiple methods to get Desktop path (one stat, EAFP)
         desktop = Path(os.environ.get("USERPROFILE", "")) / "Desktop"
-        if not desktop.exists():
-            desktop = Path(os.environ.get("HOMEDRIVE", "C:")) / os.environ.get("HOMEPATH", "\\Users\\Default") / "Desktop"
-        return desktop
+        try:
+            os.stat(desktop)
+            return desktop
+        except OSError:
+            return Path(os.environ.get("HOMEDRIVE", "C:")) / os.environ.get("HOMEPATH", "\\Users\\Default") / "Desktop"
     
     elif system == "Darwin":  # macOS
         return Path.home() / "Desktop"
     
     else:  # Linux and others
-        # Check XDG user dirs first
-        xdg_desktop = os.environ.get("XDG_DESKTOP_DIR")
+        # Check XDG user dirs first (environment, then user-dirs.dirs)
+        xdg_desktop = os.environ.get("XDG_DESKTOP_DIR") or _xdg_user_dirs().get("XDG_DESKTOP_DIR")
         if xdg_desktop:
             return Path(xdg_desktop)
         return Path.home() / "Desktop"
 
 
+def _emit(path, content, mode=0o644):
+    """Write content to path atomically, setting the mode at creation time.
+
+    Data goes to a sibling .tmp file which is then os.replace()d over the
+    target, so a re-run never exposes a partially written launcher.
+    """
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    data = content.encode("utf-8")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+    try:
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def get_launcher_python(project_root: Path, windowed: bool = False) -> Path:
+    """Interpreter the shortcut should run launcher.py with (venv preferred)."""
+    if _system() == "Windows":
+        name = "pythonw.exe" if windowed else "python.exe"
+        candidate = project_root / "venv" / "Scripts" / name
+        fallback = Path(sys.executable).with_name(name)
+    else:
+        candidate = project_root / "venv" / "bin" / "python3"
+        fallback = Path(sys.executable)
+    return candidate if candidate.exists() else fallback
+
+
 def create_windows_shortcut(project_root: Path, desktop: Path) -> bool:
     """
-    Create a Windows .lnk shortcut using VBScript (no external dependencies).
-    The shortcut will open the browser automatically after starting the server.
+    Create a Windows .lnk shortcut via pywin32 when available, otherwise VBScript.
+    The shortcut runs launcher.py, which starts the server and opens the browser.
     """
     shortcut_path = desktop / "GoGospelNow Translator.lnk"
-    launch_script = project_root / "launch.bat"
+    # Shortcuts must keep the .lnk suffix, so the temp name goes before it
+    tmp_shortcut = shortcut_path.with_name(shortcut_path.stem + ".tmp.lnk")
     icon_path = project_root / "icon.ico"
     
     # Check if icon exists
@@ -63,101 +171,80 @@ def create_windows_shortcut(project_root: Path, desktop: Path) -> bool:
         print("   Shortcut will be created without a custom icon.")
         icon_path = None
     
-    # Create a wrapper batch file that opens browser after launch
-    wrapper_bat = project_root / "launch_with_browser.bat"
-    wrapper_content = f'''@echo off
-cd /d "{project_root}"
-call venv\\Scripts\\activate.bat
-
-REM Start the Python server in a minimized window
-start /min "GoGospelNow Server" python main.py
-
-REM Wait for server to start
-timeout /t 4 /nobreak > nul
-
-REM Try to open in Chrome, Edge, or Chromium (Firefox has compatibility issues)
-REM Check for Chrome first
-where chrome >nul 2>&1
-if %errorlevel% equ 0 (
-    start chrome "http://localhost:7860?__theme=dark"
-    goto :done
-)
-
-REM Check common Chrome installation paths
-if exist "C:\\Program Files\\Google\\Chrome\\Application\\chrome.exe" (
-    start "" "C:\\Program Files\\Google\\Chrome\\Application\\chrome.exe" "http://localhost:7860?__theme=dark"
-    goto :done
-)
-if exist "C:\\Program Files (x86)\\Google\\Chrome\\Application\\chrome.exe" (
-    start "" "C:\\Program Files (x86)\\Google\\Chrome\\Application\\chrome.exe" "http://localhost:7860?__theme=dark"
-    goto :done
-)
-
-REM Try Microsoft Edge (Chromium-based, works well)
-where msedge >nul 2>&1
-if %errorlevel% equ 0 (
-    start msedge "http://localhost:7860?__theme=dark"
-    goto :done
-)
-if exist "C:\\Program Files (x86)\\Microsoft\\Edge\\Application\\msedge.exe" (
-    start "" "C:\\Program Files (x86)\\Microsoft\\Edge\\Application\\msedge.exe" "http://localhost:7860?__theme=dark"
-    goto :done
-)
-
-REM Fallback to default browser (may be Firefox, but at least it opens something)
-start "" "http://localhost:7860?__theme=dark"
-
-:done
-'''
+    # The shortcut runs launcher.py directly with a console-less interpreter
+    python_exe = get_launcher_python(project_root, windowed=True)
+    launcher = project_root / "launcher.py"
     
+    # Prefer an in-process COM call (pywin32) over spawning the script host
     try:
-        with open(wrapper_bat, 'w') as f:
-            f.write(wrapper_content)
-        print(f"✓ Created launcher script: {wrapper_bat}")
-    except Exception as e:
-        print(f"✗ Failed to create launcher script: {e}")
-        return False
-    
-    # VBScript to create the shortcut with icon
+        import win32com.client
+    except ImportError:
+        win32com = None
+
+    if win32com is not None:
+        try:
+            shell = win32com.client.Dispatch("WScript.Shell")
+            shortcut = shell.CreateShortCut(str(tmp_shortcut))
+            shortcut.TargetPath = str(python_exe)
+            shortcut.Arguments = f'"{launcher}"'
+            shortcut.WorkingDirectory = str(project_root)
+            shortcut.Description = APP_DESCRIPTION
+            shortcut.WindowStyle = 7
+            if icon_path:
+                shortcut.IconLocation = str(icon_path)
+            shortcut.Save()
+            os.replace(tmp_shortcut, shortcut_path)
+            print(f"✓ Created desktop shortcut: {shortcut_path}")
+            return True
+        except Exception as e:
+            print(f"⚠️  COM shortcut creation failed ({e}), falling back to VBScript")
+
+    # VBScript to create the shortcut with icon (no external dependencies)
     icon_line = f'shortcut.IconLocation = "{icon_path}"' if icon_path else ''
-    vbs_script = f'''
-Set WshShell = CreateObject("WScript.Shell")
-Set shortcut = WshShell.CreateShortcut("{shortcut_path}")
-shortcut.TargetPath = "{wrapper_bat}"
-shortcut.WorkingDirectory = "{project_root}"
-shortcut.Description = "GoGospelNow Real-Time Preaching Translator"
-shortcut.WindowStyle = 7
-{icon_line}
-shortcut.Save
-WScript.Echo "Shortcut created successfully!"
-'''
+    vbs_script = SHORTCUT_VBS.substitute(
+        shortcut=tmp_shortcut,
+        python=python_exe,
+        launcher=launcher,
+        project=project_root,
+        description=APP_DESCRIPTION,
+        icon_line=icon_line,
+    )
     
-    # Write VBS to temp file and execute
-    vbs_path = project_root / "create_shortcut.vbs"
+    # Write VBS to a temp file outside the project and always remove it.
+    # cscript has no stdin script mode, so a file is unavoidable.
+    vbs_path = None
     try:
-        with open(vbs_path, 'w') as f:
+        fd, vbs_name = tempfile.mkstemp(suffix=".vbs", prefix="gogospelnow_")
+        vbs_path = Path(vbs_name)
+        with os.fdopen(fd, 'w') as f:
             f.write(vbs_script)
         
         # Execute the VBScript
         result = subprocess.run(
             ["cscript", "//nologo", str(vbs_path)],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             cwd=str(project_root)
         )
         
         if result.returncode == 0:
+            os.replace(tmp_shortcut, shortcut_path)
             print(f"✓ Created desktop shortcut: {shortcut_path}")
-            # Clean up VBS file
-            vbs_path.unlink()
             return True
         else:
-            print(f"✗ VBScript error: {result.stderr}")
+            # Only decode stderr when there is something to report
+            print(f"✗ VBScript error: {result.stderr.decode('mbcs', errors='replace')}")
             return False
             
     except Exception as e:
         print(f"✗ Failed to create Windows shortcut: {e}")
         return False
+    finally:
+        if vbs_path is not None:
+            try:
+                vbs_path.unlink()
+            except OSError:
+                pass
 
 
 def create_linux_desktop_file(project_root: Path, desktop: Path) -> bool:
@@ -165,7 +252,6 @@ def create_linux_desktop_file(project_root: Path, desktop: Path) -> bool:
     Create a Linux .desktop file for the application.
     """
     shortcut_path = desktop / "gogospelnow.desktop"
-    start_script = project_root / "start_translator.sh"
     
     # Check for icon - prefer SVG, fall back to PNG
     icon_svg = project_root / "listener-app" / "icon.svg"
@@ -178,78 +264,27 @@ def create_linux_desktop_file(project_root: Path, desktop: Path) -> bool:
         icon_path = icon_png  # Will show warning but won't break
         print(f"⚠️  Icon file not found. Desktop shortcut will use default icon.")
     
-    # Create a wrapper script that also opens the browser
-    wrapper_script = project_root / "launch_with_browser.sh"
-    wrapper_content = f'''#!/bin/bash
-cd "{project_root}"
-
-# Activate virtual environment and start server in background
-source venv/bin/activate
-python3 main.py &
-SERVER_PID=$!
-
-# Wait for server to start
-sleep 4
-
-# Open browser - prefer Chrome/Chromium (Firefox has compatibility issues)
-URL="http://localhost:7860?__theme=dark"
-
-if command -v google-chrome &> /dev/null; then
-    google-chrome "$URL" &
-elif command -v google-chrome-stable &> /dev/null; then
-    google-chrome-stable "$URL" &
-elif command -v chromium &> /dev/null; then
-    chromium "$URL" &
-elif command -v chromium-browser &> /dev/null; then
-    chromium-browser "$URL" &
-elif command -v brave-browser &> /dev/null; then
-    brave-browser "$URL" &
-elif command -v xdg-open &> /dev/null; then
-    # Fallback to system default (may be Firefox)
-    xdg-open "$URL"
-else
-    echo "Please open your browser to: $URL"
-fi
-
-# Wait for server process
-wait $SERVER_PID
-'''
-    
-    try:
-        with open(wrapper_script, 'w') as f:
-            f.write(wrapper_content)
-        os.chmod(wrapper_script, 0o755)
-        print(f"✓ Created launcher script: {wrapper_script}")
-    except Exception as e:
-        print(f"✗ Failed to create launcher script: {e}")
-        return False
+    # The desktop entry runs launcher.py directly (no wrapper shell script)
+    python_exe = get_launcher_python(project_root)
+    launcher = project_root / "launcher.py"
     
     # .desktop file content
-    desktop_content = f'''[Desktop Entry]
-Version=1.0
-Type=Application
-Name=GoGospelNow Translator
-Comment=Real-Time Preaching Translator
-Exec="{wrapper_script}"
-Icon={icon_path}
-Terminal=false
-Categories=Audio;AudioVideo;Utility;
-StartupNotify=true
-'''
+    desktop_content = DESKTOP_ENTRY.substitute(
+        command=LAUNCH_COMMAND.substitute(python=python_exe, launcher=launcher),
+        project=project_root,
+        icon=icon_path,
+    )
     
     try:
-        with open(shortcut_path, 'w') as f:
-            f.write(desktop_content)
-        os.chmod(shortcut_path, 0o755)
+        _emit(shortcut_path, desktop_content, 0o755)
         print(f"✓ Created desktop shortcut: {shortcut_path}")
         
         # Also copy to applications folder for app menu
-        applications_dir = Path.home() / ".local" / "share" / "applications"
+        data_home = os.environ.get("XDG_DATA_HOME") or (Path.home() / ".local" / "share")
+        applications_dir = Path(data_home) / "applications"
         if applications_dir.exists():
             app_shortcut = applications_dir / "gogospelnow.desktop"
-            with open(app_shortcut, 'w') as f:
-                f.write(desktop_content)
-            os.chmod(app_shortcut, 0o755)
+            _emit(app_shortcut, desktop_content, 0o755)
             print(f"✓ Added to applications menu: {app_shortcut}")
         
         return True
@@ -283,45 +318,17 @@ def create_macos_command(project_root: Path, desktop: Path) -> bool:
     
     # Create the launcher script inside the app bundle
     launcher_script = macos_dir / app_name
-    launcher_content = f'''#!/bin/bash
-cd "{project_root}"
-
-# Activate virtual environment and start server in background
-source venv/bin/activate
-python3 main.py &
-SERVER_PID=$!
-
-# Wait for server to start
-sleep 4
-
-# Open browser - prefer Chrome or Safari (Firefox has compatibility issues)
-URL="http://localhost:7860?__theme=dark"
-
-# Check for Chrome first
-if [ -d "/Applications/Google Chrome.app" ]; then
-    open -a "Google Chrome" "$URL"
-# Then try Safari (works well on macOS)
-elif [ -d "/Applications/Safari.app" ]; then
-    open -a "Safari" "$URL"
-# Try Chromium
-elif [ -d "/Applications/Chromium.app" ]; then
-    open -a "Chromium" "$URL"
-# Try Brave
-elif [ -d "/Applications/Brave Browser.app" ]; then
-    open -a "Brave Browser" "$URL"
-# Fallback to system default
-else
-    open "$URL"
-fi
-
-# Wait for server process
-wait $SERVER_PID
-'''
+    # The bundle executable only hands off to launcher.py (no shell logic)
+    launcher_content = MACOS_LAUNCHER.substitute(
+        project=project_root,
+        command=LAUNCH_COMMAND.substitute(
+            python=get_launcher_python(project_root),
+            launcher=project_root / "launcher.py",
+        ),
+    )
     
     try:
-        with open(launcher_script, 'w') as f:
-            f.write(launcher_content)
-        os.chmod(launcher_script, 0o755)
+        _emit(launcher_script, launcher_content, 0o755)
         print(f"✓ Created launcher script")
     except Exception as e:
         print(f"✗ Failed to create launcher script: {e}")
@@ -416,8 +423,7 @@ wait $SERVER_PID
 '''
     
     try:
-        with open(info_plist, 'w') as f:
-            f.write(plist_content)
+        _emit(info_plist, plist_content)
         print(f"✓ Created Info.plist")
     except Exception as e:
         print(f"✗ Failed to create Info.plist: {e}")
@@ -442,7 +448,7 @@ def main():
     
     project_root = get_project_root()
     desktop = get_desktop_path()
-    system = platform.system()
+    system = _system()
     
     print(f"📁 Project directory: {project_root}")
     print(f"🖥️  Desktop directory: {desktop}")
@@ -450,26 +456,19 @@ def main():
     print()
     
     # Verify project structure
-    if system == "Windows":
-        required_file = project_root / "launch.bat"
-    else:
-        required_file = project_root / "start_translator.sh"
-    
-    if not required_file.exists():
-        print(f"⚠️  Warning: {required_file.name} not found. The launcher may not work correctly.")
+    if not (project_root / "launcher.py").exists():
+        print("⚠️  Warning: launcher.py not found. The launcher may not work correctly.")
     
     if not (project_root / "main.py").exists():
         print("✗ Error: main.py not found. Are you running this from the project directory?")
         sys.exit(1)
     
-    if not desktop.exists():
-        print(f"⚠️  Desktop folder not found at {desktop}")
-        try:
-            desktop.mkdir(parents=True, exist_ok=True)
-            print(f"  Created: {desktop}")
-        except Exception as e:
-            print(f"✗ Could not create desktop folder: {e}")
-            sys.exit(1)
+    # mkdir with exist_ok is a no-op when the folder is already there
+    try:
+        desktop.mkdir(parents=True, exist_ok=True)
+    except Exception as e:
+        print(f"✗ Could not create desktop folder at {desktop}: {e}")
+        sys.exit(1)
     
     print("Creating launcher...")
     print()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+GoGospelNow Launcher
+
+Starts the translator server, waits until it accepts connections and then
+opens the UI in a Chromium-based browser (Firefox has compatibility issues).
+Desktop shortcuts created by install_launcher.py point directly at this file,
+so launching needs no intermediate batch/shell script.
+
+Usage:
+    python launcher.py
+"""
+
+import os
+import sys
+import shutil
+import socket
+import subprocess
+import time
+import webbrowser
+from pathlib import Path
+
+HOST = "127.0.0.1"
+PORT = 7860
+URL = f"http://localhost:{PORT}?__theme=dark"
+
+# Browser preference order per platform (first match wins)
+WINDOWS_BROWSERS = [
+    "chrome",
+    "msedge",
+    "chromium",
+    r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+    r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+    r"C:\Program Files (x86)\Microsoft\Edge\Application\msedge.exe",
+]
+LINUX_BROWSERS = [
+    "google-chrome",
+    "google-chrome-stable",
+    "chromium",
+    "chromium-browser",
+    "brave-browser",
+]
+MACOS_APPS = ["Google Chrome", "Safari", "Chromium", "Brave Browser"]
+
+
+def get_project_root():
+    """Get the absolute path to the project root directory."""
+    return Path(__file__).parent.resolve()
+
+
+def get_server_python(project_root: Path) -> str:
+    """Prefer the project's venv interpreter, fall back to the current one."""
+    if sys.platform == "win32":
+        candidate = project_root / "venv" / "Scripts" / "python.exe"
+    else:
+        candidate = project_root / "venv" / "bin" / "python3"
+    if candidate.exists():
+        return str(candidate)
+    # pythonw has no console; the server should get a regular interpreter
+    exe = Path(sys.executable)
+    if exe.name.lower() == "pythonw.exe":
+        return str(exe.with_name("python.exe"))
+    return sys.executable
+
+
+def start_server(project_root: Path) -> subprocess.Popen:
+    """Start main.py; on Windows in its own minimized console window."""
+    kwargs = {"cwd": str(project_root)}
+    if sys.platform == "win32":
+        startupinfo = subprocess.STARTUPINFO()
+        startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+        startupinfo.wShowWindow = 7  # SW_SHOWMINNOACTIVE
+        kwargs["startupinfo"] = startupinfo
+        kwargs["creationflags"] = subprocess.CREATE_NEW_CONSOLE
+    return subprocess.Popen([get_server_python(project_root), "main.py"], **kwargs)
+
+
+def wait_for_server(proc=None, timeout=30.0) -> bool:
+    """Poll the server port until it accepts a connection or timeout expires."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc is not None and proc.poll() is not None:
+            return False  # Server exited during startup
+        try:
+            with socket.create_connection((HOST, PORT), timeout=0.1):
+                return True
+        except OSError:
+            time.sleep(0.1)
+    return False
+
+
+def open_browser(url: str = URL) -> bool:
+    """Open url in the first available preferred browser, else the default one."""
+    try:
+        if sys.platform == "win32":
+            for name in WINDOWS_BROWSERS:
+                exe = shutil.which(name) or (name if os.path.isfile(name) else None)
+                if exe:
+                    subprocess.Popen([exe, url])
+                    return True
+        elif sys.platform == "darwin":
+            for app in MACOS_APPS:
+                if os.path.isdir(f"/Applications/{app}.app"):
+                    subprocess.Popen(["open", "-a", app, url])
+                    return True
+        else:
+            for name in LINUX_BROWSERS:
+                exe = shutil.which(name)
+                if exe:
+                    subprocess.Popen([exe, url])
+                    return True
+    except OSError as e:
+        print(f"⚠️  Could not start preferred browser: {e}")
+
+    # Fallback to system default (may be Firefox, but at least it opens something)
+    if webbrowser.open(url):
+        return True
+    print(f"Please open your browser to: {url}")
+    return False
+
+
+def main():
+    project_root = get_project_root()
+    proc = start_server(project_root)
+
+    if wait_for_server(proc):
+        open_browser()
+    elif proc.poll() is not None:
+        print("✗ Server exited before it was ready.")
+        sys.exit(proc.returncode or 1)
+    else:
+        print("⚠️  Server is taking longer than expected; opening browser anyway.")
+        open_browser()
+
+    try:
+        sys.exit(proc.wait())
+    except KeyboardInterrupt:
+        proc.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,9 @@ import os
 import sys
 import subprocess
 import re
+import ctypes
+import socket
+import traceback
 import numpy as np
 import sounddevice as sd
 import queue
@@ -13,19 +16,36 @@ import asyncio
 import time
 import datetime
 import json
-import glob
+from collections import deque, namedtuple
+from functools import lru_cache
+from types import MappingProxyType
 from concurrent.futures import ThreadPoolExecutor
 import gradio as gr
 from fastapi import FastAPI
 from fastapi.responses import FileResponse
 # from faster_whisper import WhisperModel  # Moved to lazy load
-from scipy.signal import resample
-import threadpoolctl
+from math import gcd
+from scipy.signal import firwin, upfirdn
 try:
     from screeninfo import get_monitors
 except ImportError:
     get_monitors = None
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    import orjson  # Installed with gradio; stdlib json is the fallback
+except ImportError:
+    orjson = None
+
+try:
+    import soxr  # Installed with librosa; scipy polyphase is the fallback
+except ImportError:
+    soxr = None
+
 try:
     import tkinter as tk
 except Exception:
@@ -36,7 +56,6 @@ import translator_core as core
 import pyperclip  # Cross-platform clipboard support
 
 # --- Global Variables & Queues ---
-audio_queue = queue.Queue()
 stop_event = threading.Event()
 recording_thread = None
 whisper_model = None
@@ -49,9 +68,10 @@ translation_display_manager = None
 shutdown_event = threading.Event()
 uvicorn_server = None  # Will hold reference to uvicorn server for graceful shutdown
 
-# CPU optimization: Set thread limits
-os.environ["OMP_NUM_THREADS"] = "2"
-os.environ["MKL_NUM_THREADS"] = "2"
+# CPU threads for Whisper (ctranslate2) when the user hasn't chosen a value.
+# Leave a couple of cores for audio capture, the UI and translation.
+MAX_CPU_THREADS = 12  # Upper bound of the CPU Threads slider and every loader
+DEFAULT_CPU_THREADS = max(2, min(MAX_CPU_THREADS, (os.cpu_count() or 4) - 2))
 
 
 def get_pref_value(key, default, *, min_value=None, max_value=None, cast_type=None):
@@ -72,36 +92,57 @@ def get_pref_value(key, default, *, min_value=None, max_value=None, cast_type=No
         value = min(max_value, value)
     return value
 
+def get_cpu_threads():
+    """The CPU Threads preference, clamped to the slider's range."""
+    return get_pref_value("cpu_threads", DEFAULT_CPU_THREADS, min_value=1, max_value=MAX_CPU_THREADS, cast_type=int)
+
 # --- Cleanup old temp files ---
 def cleanup_temp_files():
+    """Remove stale TTS audio files and log a single summary line."""
+    removed = 0
+    
     # Clean up root temp files
-    temp_files = glob.glob("temp_tts_output_*.mp3")
-    for f in temp_files:
-        try:
-            os.remove(f)
-            core.log_message(f"Removed old temp file: {f}", "INFO")
-        except OSError as e:
-            core.log_message(f"Error removing file {f}: {e}", "ERROR")
+    try:
+        with os.scandir(".") as entries:
+            for entry in entries:
+                if entry.name.startswith("temp_tts_output_") and entry.name.endswith(".mp3"):
+                    try:
+                        os.remove(entry.path)
+                        removed += 1
+                    except OSError as e:
+                        core.log_message(f"Error removing file {entry.path}: {e}", "ERROR")
+    except OSError as e:
+        core.log_message(f"Error scanning for temp files: {e}", "ERROR")
     
     # Clean up temp_audio directory (keep files younger than 5 minutes)
-    if os.path.exists("temp_audio"):
-        now = time.time()
-        for f in glob.glob(os.path.join("temp_audio", "tts_*.mp3")):
-            try:
-                if os.stat(f).st_mtime < now - 300: # 5 minutes
-                    os.remove(f)
-                    # core.log_message(f"Removed old audio file: {f}", "DEBUG")
-            except OSError as e:
-                core.log_message(f"Error removing file {f}: {e}", "ERROR")
+    cutoff = time.time() - 300
+    try:
+        with os.scandir("temp_audio") as entries:
+            for entry in entries:
+                if not (entry.name.startswith("tts_") and entry.name.endswith(".mp3")):
+                    continue
+                try:
+                    if entry.stat().st_mtime < cutoff:
+                        os.remove(entry.path)
+                        removed += 1
+                except OSError as e:
+                    core.log_message(f"Error removing file {entry.path}: {e}", "ERROR")
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        core.log_message(f"Error scanning temp_audio: {e}", "ERROR")
+    
+    if removed:
+        core.log_message(f"Removed {removed} old temp audio file(s)", "INFO")
 
-# Run cleanup at startup
-# cleanup_temp_files()  # Moved to initialize_background_tasks
+# Cleanup runs on the background thread started in __main__ (startup pass included)
 
 # Schedule periodic cleanup
 def periodic_cleanup():
+    """Clean up once right away, then every minute, off the startup path."""
     while True:
-        time.sleep(60)
         cleanup_temp_files()
+        time.sleep(60)
 
 # cleanup_thread = threading.Thread(target=periodic_cleanup, daemon=True)
 # cleanup_thread.start()  # Moved to initialize_background_tasks
@@ -109,7 +150,6 @@ def periodic_cleanup():
 # --- Get Local IP Address for Listener Connection ---
 def get_local_ip():
     """Get the local IP address of this computer for listener connections."""
-    import socket
     try:
         # Create a socket and connect to external address to find local IP
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
@@ -156,6 +196,12 @@ V_ALIGN_TO_ANCHOR = {
     "Middle": "",
     "Bottom": "s",
 }
+# (horizontal, vertical) choice -> Tk (anchor, justify) for the display label
+ALIGN_TABLE = MappingProxyType({
+    (h, v): (f"{V_ALIGN_TO_ANCHOR[v]}{H_ALIGN_TO_ANCHOR[h]}" or "center", H_ALIGN_TO_JUSTIFY[h])
+    for h in ALIGN_HORIZONTAL_CHOICES
+    for v in ALIGN_VERTICAL_CHOICES
+})
 
 DEFAULT_TRANSLATION_DISPLAY_PREFS = {
     "display_font_family": DISPLAY_FONT_CHOICES[0],
@@ -184,6 +230,36 @@ RUNTIME_PARAMS = {
     "overlap_s": 0.4           # Maintain tail audio to avoid clipping words
 }
 
+# End-of-speech windows get this much synthetic silence ("hush") appended before
+# Whisper sees them, so the real pause we wait for can be that much shorter.
+HUSH_PAD_S = 0.2
+MIN_END_SILENCE_S = 0.2
+
+# check_audio_queue runs every poll tick, so the timing values it needs are
+# derived from RUNTIME_PARAMS once and only rebuilt when the settings change.
+TimingConfig = namedtuple(
+    "TimingConfig", ["min_silence_s", "end_silence_s", "min_speech_size", "max_speech_size", "overlap_size"]
+)
+
+def build_timing_config():
+    """Snapshot RUNTIME_PARAMS into the sample counts check_audio_queue compares against."""
+    min_silence_s = float(RUNTIME_PARAMS.get("min_silence_s", 0.6))
+    return TimingConfig(
+        min_silence_s=min_silence_s,
+        end_silence_s=max(MIN_END_SILENCE_S, min_silence_s - HUSH_PAD_S),
+        min_speech_size=int(core.TARGET_RATE * float(RUNTIME_PARAMS.get("min_speech_s", 1.0))),
+        max_speech_size=int(core.TARGET_RATE * float(RUNTIME_PARAMS.get("max_speech_s", 10.0))),
+        overlap_size=int(core.TARGET_RATE * float(RUNTIME_PARAMS.get("overlap_s", 0.5))),
+    )
+
+def refresh_timing_config():
+    """Rebuild the cached timing snapshot after RUNTIME_PARAMS changes."""
+    global timing_config
+    timing_config = build_timing_config()
+    return timing_config
+
+timing_config = build_timing_config()
+
 DEFAULT_TRANSLATION_WORKERS = 4
 
 # Quick preset definitions for timing and VAD
@@ -216,7 +292,64 @@ PRESETS = {
         "vad": False,
     },
 }
-available_ollama_models = [] # core.fetch_available_models(current_settings=current_settings) # Moved to UI init
+
+# Presets understood by "Apply & Save All Settings". They override the timing
+# sliders and no-speech threshold but leave the user's VAD checkbox alone.
+APPLY_PRESETS = {
+    "CPU Optimized": {"block_ms": 50, "overlap_ms": 400, "min_silence_ms": 1000, "min_speech_ms": 1800, "max_speech_s": 6.0, "no_speech": 0.8},
+    "Balanced": {"block_ms": 30, "overlap_ms": 500, "min_silence_ms": 800, "min_speech_ms": 1500, "max_speech_s": 8.0, "no_speech": 0.7},
+    "Quality Focused": {"block_ms": 20, "overlap_ms": 600, "min_silence_ms": 600, "min_speech_ms": 1000, "max_speech_s": 12.0, "no_speech": 0.6},
+}
+
+# Values from the Apply form, coerced once; field names are the user_preferences keys
+AppliedSettings = namedtuple("AppliedSettings", [
+    "block_duration_ms", "overlap_ms", "min_silence_ms", "min_speech_ms", "max_speech_s",
+    "no_speech_threshold", "vad_filter", "cpu_threads", "processing_batch_size",
+    "translation_workers", "buffer_duration_s", "speech_energy_threshold",
+    "compute_device", "compute_type", "whisper_model_size",
+])
+
+# --- Translation Model List Cache ---
+# Settings that decide which models a provider offers (API keys, custom endpoint)
+TRANSLATION_CREDENTIAL_KEYS = ('openai_api_key', 'groq_api_key', 'grok_api_key', 'mistral_api_key',
+                               'custom_openai_url', 'custom_openai_key')
+
+class ModelListUnavailable(Exception):
+    """The provider's model list could not be fetched; lru_cache does not keep raises."""
+
+@lru_cache(maxsize=8)
+def _fetch_models_cached(provider, server_url, credentials):
+    """Live model list for one provider/server/credential set; cleared by refresh_available_models()."""
+    settings = dict(current_settings or core.load_settings())
+    settings.update(zip(TRANSLATION_CREDENTIAL_KEYS, credentials))
+    settings["translation_provider"] = provider
+    models = core.fetch_provider_models(server_url=server_url, current_settings=settings)
+    if not models:
+        raise ModelListUnavailable(provider)
+    return tuple(models)
+
+def get_available_models(settings=None):
+    """Cached model list for the provider and server in settings.
+
+    Only successful fetches are cached, so a server that was down is retried
+    next time instead of pinning the fallback list.
+    """
+    settings = settings or current_settings or {}
+    provider = settings.get("translation_provider", "Ollama")
+    server_url = settings.get("translation_server", core.DEFAULT_SETTINGS["translation_server"])
+    credentials = tuple(settings.get(key, "") for key in TRANSLATION_CREDENTIAL_KEYS)
+    try:
+        return list(_fetch_models_cached(provider, server_url, credentials))
+    except ModelListUnavailable:
+        core.log_message(f"Using fallback model list for {provider}")
+        return core.fallback_models(provider)
+
+def refresh_available_models(settings=None):
+    """Drop cached model lists (new server URL or API keys) and fetch again."""
+    _fetch_models_cached.cache_clear()
+    return get_available_models(settings)
+
+
 input_devices = []
 output_devices = []
 selected_output_device_name = None
@@ -235,7 +368,7 @@ def load_user_preferences():
     """Load user preferences from file or return defaults."""
     try:
         if os.path.exists(USER_PREFERENCES_FILE):
-            with open(USER_PREFERENCES_FILE, "r") as f:
+            with open(USER_PREFERENCES_FILE, "r", encoding="utf-8") as f:
                 prefs = json.load(f)
                 core.log_message(f"Loaded user preferences from {USER_PREFERENCES_FILE}")
                 return prefs
@@ -252,77 +385,151 @@ def load_user_preferences():
         "voice": "em_alex"
     }
 
+# Values derived from user_preferences that the audio tick reads; cleared
+# whenever preferences are changed or saved
+_prefs_cache = {}
+
+def invalidate_prefs_cache():
+    _prefs_cache.clear()
+
+def get_live_audio_prefs():
+    """Return (speech_energy_threshold, input_gain) for check_audio_queue, cached."""
+    cached = _prefs_cache.get("live_audio")
+    if cached is None:
+        min_energy = get_pref_value(
+            "speech_energy_threshold",
+            0.0008,
+            min_value=0.0001,
+            max_value=0.01,
+            cast_type=float
+        )
+        input_gain = get_pref_value("input_gain", 1.0, cast_type=float)
+        cached = _prefs_cache["live_audio"] = (min_energy, input_gain)
+    return cached
+
+def _json_default(obj):
+    """Serialize numpy scalars/arrays; anything else unknown becomes a string."""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    return str(obj)
+
+_pref_write_timer = None
+_pref_write_lock = threading.Lock()
+_persisted_prefs = {}  # Last preferences read from or written to disk
+
+def _write_user_preferences(prefs):
+    """Serialize prefs to a temp file and swap it in, so a crash never leaves half a file."""
+    if orjson is not None:
+        data = orjson.dumps(
+            prefs,
+            default=_json_default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2,
+        )
+    else:
+        data = json.dumps(prefs, default=_json_default, indent=2).encode("utf-8")
+    tmp_path = USER_PREFERENCES_FILE + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, USER_PREFERENCES_FILE)
+
+def _cancel_pending_preferences_write():
+    global _pref_write_timer
+    with _pref_write_lock:
+        if _pref_write_timer is not None:
+            _pref_write_timer.cancel()
+            _pref_write_timer = None
+
 def save_user_preferences(prefs):
     """Save user preferences to file."""
+    global _persisted_prefs
+    invalidate_prefs_cache()
+    _cancel_pending_preferences_write()  # This write supersedes any debounced one
     try:
-        # Ensure everything is JSON-serializable (no numpy types, etc.)
-        def sanitize_for_json(obj):
-            import numpy as _np
-            if isinstance(obj, (str, bool)) or obj is None:
-                return obj
-            if isinstance(obj, (int, float)):
-                return obj
-            if isinstance(obj, _np.generic):
-                # Convert numpy scalar to Python scalar
-                return obj.item()
-            if isinstance(obj, (list, tuple)):
-                return [sanitize_for_json(x) for x in obj]
-            if isinstance(obj, dict):
-                return {str(k): sanitize_for_json(v) for k, v in obj.items()}
-            # Fallback to string for unknown types
-            try:
-                return json.loads(json.dumps(obj))
-            except Exception:
-                return str(obj)
-
-        sanitized = sanitize_for_json(prefs)
-        with open(USER_PREFERENCES_FILE, "w") as f:
-            json.dump(sanitized, f, indent=2)
+        snapshot = dict(prefs)
+        _write_user_preferences(snapshot)
+        _persisted_prefs = snapshot
         core.log_message(f"Saved user preferences to {USER_PREFERENCES_FILE}")
         return True
     except Exception as e:
         core.log_message(f"Error saving user preferences: {e}", "ERROR")
         return False
 
+def save_user_preferences_debounced(prefs, delay=0.5):
+    """Coalesce rapid UI changes into one preferences write after `delay` seconds of quiet."""
+    global _pref_write_timer
+    invalidate_prefs_cache()
+    with _pref_write_lock:
+        if _pref_write_timer is not None:
+            _pref_write_timer.cancel()
+        _pref_write_timer = threading.Timer(delay, save_user_preferences, args=(prefs,))
+        _pref_write_timer.daemon = True
+        _pref_write_timer.start()
+
 # Load user preferences
 user_preferences = load_user_preferences()
+_persisted_prefs = dict(user_preferences)
 
+def update_user_preferences(changes, delay=0.5):
+    """Merge changes into user_preferences and schedule a write if they now differ from disk.
 
-def get_translation_display_config():
-    """Return sanitized translation display preferences."""
-    def _normalize_color_value(value, default_hex):
-        if not value:
-            return default_hex
-        value = str(value).strip()
-        if value.startswith("#"):
-            hex_digits = value.lstrip("#")
-            if len(hex_digits) == 3:
-                hex_digits = "".join(ch * 2 for ch in hex_digits)
-            if len(hex_digits) == 6 and all(c in "0123456789abcdefABCDEF" for c in hex_digits):
-                return f"#{hex_digits.lower()}"
-            return default_hex
-        match = re.match(r"rgba?\(([^)]+)\)", value)
-        if match:
-            parts = [p.strip() for p in match.group(1).split(",")]
-            def _channel(token):
-                if token.endswith("%"):
-                    try:
-                        return max(0, min(255, round(float(token[:-1]) * 2.55)))
-                    except ValueError:
-                        return None
-                try:
-                    val = float(token)
-                except ValueError:
-                    return None
-                if val <= 1.0:
-                    val *= 255
-                return max(0, min(255, round(val)))
-            if len(parts) >= 3:
-                channels = [_channel(parts[i]) for i in range(3)]
-                if all(c is not None for c in channels):
-                    return "#" + "".join(f"{c:02x}" for c in channels)
+    Comparing against the last persisted state (not just the incoming keys) also
+    picks up edits that update_pref callbacks made in memory only.
+    """
+    user_preferences.update(changes)
+    invalidate_prefs_cache()
+    if user_preferences == _persisted_prefs:
+        return False
+    save_user_preferences_debounced(user_preferences, delay)
+    return True
+
+
+_HEX_COLOR_RE = re.compile(r"[0-9a-fA-F]{6}")
+_RGBA_COLOR_RE = re.compile(r"rgba?\(([^)]+)\)")
+
+def _color_channel(token):
+    """One rgb() channel as 0-255: percentages, 0-1 fractions or plain values."""
+    if token.endswith("%"):
+        try:
+            return max(0, min(255, round(float(token[:-1]) * 2.55)))
+        except ValueError:
+            return None
+    try:
+        val = float(token)
+    except ValueError:
+        return None
+    if val <= 1.0:
+        val *= 255
+    return max(0, min(255, round(val)))
+
+def _normalize_color_value(value, default_hex):
+    """Normalize #rgb, #rrggbb or rgb()/rgba() strings to lowercase #rrggbb."""
+    if not value:
+        return default_hex
+    return _parse_color(str(value).strip(), default_hex)
+
+@lru_cache(maxsize=64)
+def _parse_color(value, default_hex):
+    # Only a handful of distinct colors ever reach here; parse each once
+    if value.startswith("#"):
+        hex_digits = value.lstrip("#")
+        if len(hex_digits) == 3:
+            hex_digits = "".join(ch * 2 for ch in hex_digits)
+        if _HEX_COLOR_RE.fullmatch(hex_digits):
+            return f"#{hex_digits.lower()}"
         return default_hex
+    match = _RGBA_COLOR_RE.match(value)
+    if match:
+        parts = [p.strip() for p in match.group(1).split(",")]
+        if len(parts) >= 3:
+            channels = [_color_channel(parts[i]) for i in range(3)]
+            if all(c is not None for c in channels):
+                return "#" + "".join(f"{c:02x}" for c in channels)
+    return default_hex
 
+def get_translation_display_config():
+    """Return sanitized translation display preferences."""
     def _coerce_int(value, default):
         try:
             return int(float(value))
@@ -363,12 +570,33 @@ def get_translation_display_config():
     return config
 
 
+# --- Monitor List Cache ---
+# Launch, Save and the Display tab all enumerate monitors; on Windows each
+# enumeration is an EnumDisplayMonitors call, so reuse the list briefly.
+MONITOR_CACHE_TTL = 5.0
+_monitor_cache = {"time": 0.0, "monitors": None}
+
+def cached_monitors(ttl=MONITOR_CACHE_TTL):
+    """screeninfo's monitor list, re-enumerated at most once per ttl seconds."""
+    now = time.monotonic()
+    if _monitor_cache["monitors"] is None or now - _monitor_cache["time"] > ttl:
+        _monitor_cache["monitors"] = list(get_monitors())
+        _monitor_cache["time"] = now
+    return _monitor_cache["monitors"]
+
+# Texts waiting for a stalled display beyond this are dropped, oldest first
+DISPLAY_OUTBOX_MAX_TEXTS = 32
+
+
 class TranslationDisplayManager:
     """Manage a dedicated process running a tkinter window for translations."""
 
     def __init__(self):
         self._process = None
-        self._queue = None
+        self._conn = None  # Send end of a one-way pipe to the display process
+        # Only the sender thread writes to the pipe, so a stalled display never blocks callers
+        self._outbox = deque()
+        self._outbox_ready = threading.Condition()
         self._lock = threading.Lock()
         self._latest_text = ""
         self._config = get_translation_display_config()
@@ -384,7 +612,48 @@ class TranslationDisplayManager:
             except Exception:
                 pass
             self._process = None
-            self._queue = None
+            self._close_conn()
+
+    def _close_conn(self):
+        with self._outbox_ready:
+            conn, self._conn = self._conn, None
+            self._outbox.clear()
+            self._outbox_ready.notify_all()
+        if conn is not None:
+            try:
+                conn.close()
+            except OSError:
+                pass
+
+    def _start_sender(self):
+        threading.Thread(target=self._sender_loop, args=(self._conn,), daemon=True).start()
+
+    def _sender_loop(self, conn):
+        """Forward queued messages to the pipe until it closes or is replaced."""
+        while True:
+            with self._outbox_ready:
+                while not self._outbox and self._conn is conn:
+                    self._outbox_ready.wait()
+                if self._conn is not conn:
+                    return
+                item = self._outbox.popleft()
+            try:
+                conn.send(item)
+            except (OSError, ValueError):
+                return
+
+    def _send(self, item):
+        """Queue one (type, payload) message without blocking; False if no display is attached."""
+        with self._outbox_ready:
+            if self._conn is None:
+                return False
+            if item[0] == "text":
+                pending = [i for i, (kind, _) in enumerate(self._outbox) if kind == "text"]
+                if len(pending) >= DISPLAY_OUTBOX_MAX_TEXTS:
+                    del self._outbox[pending[0]]  # Drop rather than freeze
+            self._outbox.append(item)
+            self._outbox_ready.notify()
+        return True
 
     def launch(self, config=None):
         # Helper to log to display_debug.txt from main process
@@ -408,7 +677,7 @@ class TranslationDisplayManager:
             monitor_name = "primary monitor"
             if get_monitors:
                 try:
-                    monitors = get_monitors()
+                    monitors = cached_monitors()
                     log_main(f"screeninfo returned {len(monitors)} monitors")
                     # Pass ALL monitor info to subprocess so 'm' key cycling works
                     all_monitors = []
@@ -442,7 +711,6 @@ class TranslationDisplayManager:
                         log_main(f"Monitor index {idx} out of range (have {len(monitors)} monitors)")
                 except Exception as e:
                     log_main(f"Monitor resolution failed: {e}")
-                    import traceback
                     log_main(f"Traceback: {traceback.format_exc()}")
             else:
                 log_main("screeninfo.get_monitors NOT available in main process!")
@@ -450,20 +718,23 @@ class TranslationDisplayManager:
             log_main(f"Final config keys: {list(self._config.keys())}")
             
             if self.is_running():
-                self._queue.put(("config", self._config))
-                self._queue.put(("text", self._latest_text))
+                self._send(("config", self._config))
+                self._send(("text", self._latest_text))
                 return True, "Translation display already running – updated its settings."
 
-            self._queue = mp.Queue()
+            # Single producer, single consumer: a pipe skips mp.Queue's feeder thread and lock
+            recv_conn, self._conn = mp.Pipe(duplex=False)
+            self._start_sender()
             self._process = mp.Process(
                 target=translation_display_process_main,
-                args=(self._queue, self._config.copy(), self._latest_text),
+                args=(recv_conn, self._config.copy(), self._latest_text),
                 daemon=True,
             )
             self._process.start()
+            recv_conn.close()  # The child holds its own copy
             if self._process.is_alive():
                 return True, f"Launching translation display on {monitor_name}... (may take a few seconds)"
-            self._queue = None
+            self._close_conn()
             self._process = None
             return False, "Failed to launch display."
 
@@ -472,42 +743,54 @@ class TranslationDisplayManager:
             self._cleanup_dead_process()
             if not self.is_running():
                 return True, "Translation display is not running."
-            if self._queue:
-                self._queue.put(("close", None))
+            self._send(("close", None))
             self._process.join(timeout=5)
             if self._process.is_alive():
                 self._process.terminate()
             self._process = None
-            self._queue = None
+            self._close_conn()
             return True, "Closing translation display."
 
     def update_text(self, text):
-        self._latest_text = text or ""
-        if self.is_running() and self._queue:
-            try:
-                # Use non-blocking put to avoid freezing main process if display is busy/hung
-                self._queue.put_nowait(("text", self._latest_text))
-            except queue.Full:
-                pass  # Drop frame rather than freeze
+        text = text or ""
+        if text == self._latest_text:
+            return  # The display already shows it
+        self._latest_text = text
+        if self.is_running():
+            self._send(("text", text))
 
     def apply_config(self, config):
         self._config = config.copy()
-        if self.is_running() and self._queue:
-            try:
-                # Use timeout to avoid indefinite blocking
-                self._queue.put(("config", self._config), block=True, timeout=0.5)
-            except queue.Full:
-                pass
+        if self.is_running():
+            self._send(("config", self._config))
 
 
-def translation_display_process_main(cmd_queue, initial_config, initial_text):
+def translation_display_process_main(cmd_conn, initial_config, initial_text):
     # Enable DPI awareness on Windows to fix coordinate issues
+    win_set_pos = None
     if sys.platform == "win32":
         try:
-            import ctypes
             ctypes.windll.shcore.SetProcessDpiAwareness(1)
         except Exception:
             pass
+        # Resolve the positioning calls once, with fixed prototypes, for apply_config
+        try:
+            from ctypes import wintypes
+            user32 = ctypes.WinDLL("user32", use_last_error=True)
+            get_parent = user32.GetParent
+            get_parent.argtypes = [wintypes.HWND]
+            get_parent.restype = wintypes.HWND
+            set_window_pos = user32.SetWindowPos
+            set_window_pos.argtypes = [wintypes.HWND, wintypes.HWND, ctypes.c_int, ctypes.c_int,
+                                       ctypes.c_int, ctypes.c_int, wintypes.UINT]
+            set_window_pos.restype = wintypes.BOOL
+
+            def win_set_pos(x, y, w, h):
+                """SetWindowPos on the Tk frame window: HWND_TOP, SWP_SHOWWINDOW."""
+                hwnd = get_parent(root.winfo_id()) or root.winfo_id()
+                return set_window_pos(hwnd, None, int(x), int(y), int(w), int(h), 0x0040)
+        except Exception:
+            win_set_pos = None
 
     try:
         import tkinter as tk_process
@@ -540,7 +823,10 @@ def translation_display_process_main(cmd_queue, initial_config, initial_text):
         "history": [],
         "last_update_time": None,
         "pending_clear": False,
-        "current_monitor_idx": int(initial_config.get("display_monitor", 0))
+        "current_monitor_idx": int(initial_config.get("display_monitor", 0)),
+        "applied_config": None,  # Copy of the last config apply_config ran with
+        "geometry": None,  # Last geometry string pushed to the window manager
+        "pending_resize_id": None,  # root.after id of the debounced resize handler
     }
     
     log_debug(f"Initial config: {state['config']}")
@@ -550,11 +836,9 @@ def translation_display_process_main(cmd_queue, initial_config, initial_text):
         state["last_update_time"] = None
 
     def compute_alignment(cfg):
-        h = cfg.get("display_horizontal_align", "Center")
-        v = cfg.get("display_vertical_align", "Middle")
-        anchor = f"{V_ALIGN_TO_ANCHOR.get(v, '')}{H_ALIGN_TO_ANCHOR.get(h, '')}"
-        justify = H_ALIGN_TO_JUSTIFY.get(h, "center")
-        return (anchor or "center", justify)
+        # Config values are validated against the choice lists before they get here
+        key = (cfg.get("display_horizontal_align", "Center"), cfg.get("display_vertical_align", "Middle"))
+        return ALIGN_TABLE.get(key, ("center", "center"))
 
     anchor, justify = compute_alignment(state["config"])
 
@@ -651,52 +935,43 @@ def translation_display_process_main(cmd_queue, initial_config, initial_text):
         geometry = f"{w}x{h}+{final_x}+{final_y}"
         log_debug(f"Applying Geometry: {geometry}")
 
-        # 1. Standard Tkinter Geometry
-        if sys.platform.startswith("linux"):
-            # On Linux, many window managers ignore geometry calls if the window 
-            # is decorated and then transitions to undecorated. Setting override 
-            # FIRST ensures it bypasses the WM placement logic immediately.
-            root.overrideredirect(True)
-            root.geometry(geometry)
-            root.update()
-        else:
-            root.overrideredirect(False) # Turn off to set position
-            root.geometry(geometry)
-            root.update()
-            root.overrideredirect(True)  # Turn back on
+        # Repositioning toggles overrideredirect (visible flicker) and calls the
+        # WM / Windows API twice, so only do it when the geometry actually changed
+        if geometry != state["geometry"]:
+            state["geometry"] = geometry
+            # 1. Standard Tkinter Geometry
+            if sys.platform.startswith("linux"):
+                # On Linux, many window managers ignore geometry calls if the window 
+                # is decorated and then transitions to undecorated. Setting override 
+                # FIRST ensures it bypasses the WM placement logic immediately.
+                root.overrideredirect(True)
+                root.geometry(geometry)
+                root.update()
+            else:
+                root.overrideredirect(False) # Turn off to set position
+                root.geometry(geometry)
+                root.update()
+                root.overrideredirect(True)  # Turn back on
         
-        # 2. Windows API Force Positioning (The "Nuclear Option")
-        if sys.platform == "win32":
-            try:
-                import ctypes
-                user32 = ctypes.windll.user32
-                # SWP_NOSIZE=1, SWP_NOZORDER=4, SWP_SHOWWINDOW=0x0040
-                hwnd = user32.GetParent(root.winfo_id())
-                if hwnd == 0:
-                    hwnd = root.winfo_id()
-                
-                log_debug(f"Calling SetWindowPos on HWND {hwnd} -> {final_x}, {final_y}")
-                
-                # SetWindowPos(hwnd, hWndInsertAfter, x, y, cx, cy, uFlags)
-                # HWND_TOP = 0
-                user32.SetWindowPos(hwnd, 0, int(final_x), int(final_y), int(w), int(h), 0x0040)
-            except Exception as e:
-                log_debug(f"Windows API positioning failed: {e}")
-
-        # 3. Delayed Re-application
-        def force_geometry():
-            root.geometry(geometry)
-            root.lift()
-            # Try Windows API again after delay
-            if sys.platform == "win32":
+            # 2. Windows API Force Positioning (The "Nuclear Option")
+            if win_set_pos is not None:
                 try:
-                    import ctypes
-                    user32 = ctypes.windll.user32
-                    hwnd = user32.GetParent(root.winfo_id()) or root.winfo_id()
-                    user32.SetWindowPos(hwnd, 0, int(final_x), int(final_y), int(w), int(h), 0x0040)
-                except Exception:
-                    pass
-        root.after(200, force_geometry)
+                    log_debug(f"Calling SetWindowPos -> {final_x}, {final_y}")
+                    win_set_pos(final_x, final_y, w, h)
+                except Exception as e:
+                    log_debug(f"Windows API positioning failed: {e}")
+
+            # 3. Delayed Re-application
+            def force_geometry():
+                root.geometry(geometry)
+                root.lift()
+                # Try Windows API again after delay
+                if win_set_pos is not None:
+                    try:
+                        win_set_pos(final_x, final_y, w, h)
+                    except Exception:
+                        pass
+            root.after(200, force_geometry)
         
         # Handle transparency
         bg_color = cfg["display_bg_color"]
@@ -730,15 +1005,20 @@ def translation_display_process_main(cmd_queue, initial_config, initial_text):
         state["history"] = state["history"][-max_items:]
         render_history()
         bring_to_front()
+        state["applied_config"] = dict(cfg)
 
     # Capture click to focus window (Fix for 'm' key not working)
     def on_click(event):
         root.focus_force()
     root.bind("<Button-1>", on_click)
 
+    # Window-side close requests are picked up by the next poll_queue tick
+    def request_close():
+        state["close_requested"] = True
+
     # Add right-click menu to close the window
     context_menu = tk_process.Menu(root, tearoff=0)
-    context_menu.add_command(label="Close Display", command=lambda: cmd_queue.put(("close", None)))
+    context_menu.add_command(label="Close Display", command=request_close)
     
     def show_context_menu(event):
         try:
@@ -751,7 +1031,7 @@ def translation_display_process_main(cmd_queue, initial_config, initial_text):
         root.bind("<Button-2>", show_context_menu)
 
     # Allow closing with Escape key
-    root.bind("<Escape>", lambda e: cmd_queue.put(("close", None)))
+    root.bind("<Escape>", lambda e: request_close())
     
     # Manual Monitor Cycle Binding ('m') - Uses pre-passed monitor data from main process
     def cycle_monitor(event):
@@ -780,7 +1060,7 @@ def translation_display_process_main(cmd_queue, initial_config, initial_text):
     # Add a subtle floating Close button (X) in top-right - hidden by default, appears on hover
     # Also bind Escape key to close for keyboard control during worship
     def close_display():
-        cmd_queue.put(("close", None))
+        request_close()
     
     root.bind("<Escape>", lambda e: close_display())
     
@@ -821,47 +1101,60 @@ def translation_display_process_main(cmd_queue, initial_config, initial_text):
     render_history()
 
     def handle_close_from_window():
-        cmd_queue.put(("close", None))
+        request_close()
 
     root.protocol("WM_DELETE_WINDOW", handle_close_from_window)
 
+    def apply_resize(new_width, new_height):
+        state["pending_resize_id"] = None
+        # Update wraplength based on actual window width to fix transcript display on resize/maximize
+        label.configure(wraplength=max(100, new_width - 60))
+        # Store the new dimensions in config for persistence
+        state["config"]["display_window_width"] = new_width
+        state["config"]["display_window_height"] = new_height
+
     def on_window_configure(event):
         """Handle window resize/maximize events to update text wrapping dynamically."""
         if event.widget == root:
-            new_width = event.width
-            new_height = event.height
-            # Update wraplength based on actual window width to fix transcript display on resize/maximize
-            label.configure(wraplength=max(100, new_width - 60))
-            # Store the new dimensions in config for persistence
-            state["config"]["display_window_width"] = new_width
-            state["config"]["display_window_height"] = new_height
+            # A drag-resize fires this per pixel; only the last size within 80 ms is applied
+            if state.get("pending_resize_id"):
+                root.after_cancel(state["pending_resize_id"])
+            state["pending_resize_id"] = root.after(80, apply_resize, event.width, event.height)
 
     # Bind the configure event to handle window resize/maximize
     root.bind("<Configure>", on_window_configure)
 
     def poll_queue():
-        import time
+        if state.get("close_requested"):
+            root.destroy()
+            return
+        # Drain everything pending, then apply it once: only the newest config
+        # matters, and several texts need a single re-render
+        texts = []
+        latest_config = None
         try:
-            while True:
-                item_type, payload = cmd_queue.get_nowait()
+            while cmd_conn.poll():
+                item_type, payload = cmd_conn.recv()
                 if item_type == "text":
                     if payload:
-                        # Update timestamp when new text arrives
-                        state["last_update_time"] = time.time()
-                        state["history"].append(payload)
-                        max_items = max(1, int(state["config"].get("display_history_size", 1)))
-                        state["history"] = state["history"][-max_items:]
-                        render_history()
+                        texts.append(payload)
                 elif item_type == "config":
-                    state["config"] = payload.copy()
-                    apply_config(state["config"])
+                    latest_config = payload
                 elif item_type == "close":
                     root.destroy()
                     return
-        except queue.Empty:
-            pass
         except (EOFError, OSError):
             return
+
+        if latest_config is not None and latest_config != state["applied_config"]:
+            state["config"] = latest_config.copy()
+            apply_config(state["config"])
+        if texts:
+            # Update timestamp when new text arrives
+            state["last_update_time"] = time.time()
+            max_items = max(1, int(state["config"].get("display_history_size", 1)))
+            state["history"] = (state["history"] + texts)[-max_items:]
+            render_history()
         
         # Check if we should clear old text based on hold_seconds setting
         # This runs independently of the transcription pipeline
@@ -928,40 +1221,135 @@ def update_listener_data(transcription=None, translation=None, audio_url=None):
     latest_listener_data["timestamp"] = time.time()
 
 # --- Circular Audio Buffer Class for CPU Optimization ---
+class AudioRing:
+    """Single-producer/single-consumer ring of preallocated float32 slots.
+
+    Replaces queue.Queue between the sounddevice callback and the consumer:
+    put() only copies into the next slot and bumps an int (no lock, no
+    per-block allocation in the real-time thread). The consumer drains all
+    pending slots at once under its own lock into a preallocated output
+    buffer, so steady-state polling allocates nothing on either side.
+    """
+    def __init__(self, num_slots=1024, slot_size=1024):
+        self.num_slots = num_slots
+        self.slot_size = slot_size
+        self.slots = np.zeros((num_slots, slot_size), dtype=np.float32)
+        self.lengths = np.zeros(num_slots, dtype=np.int32)
+        self.head = 0  # Next slot to write (producer only)
+        self.tail = 0  # Next slot to read (consumer only)
+        self.dropped = 0
+        self._lock = threading.Lock()
+        # Set by the producer when it writes audio that isn't at TARGET_RATE
+        self.resampler = None
+        # Sized to the whole ring, so a full drain always fits
+        self._out = np.empty(num_slots * slot_size, dtype=np.float32)
+        
+    def put(self, data):
+        """Producer side: copy data into free slots (drops it if the ring is full)."""
+        for start in range(0, len(data), self.slot_size):
+            if self.head - self.tail >= self.num_slots:
+                self.dropped += 1
+                return
+            part = data[start:start + self.slot_size]
+            idx = self.head % self.num_slots
+            self.slots[idx, :len(part)] = part
+            self.lengths[idx] = len(part)
+            self.head += 1  # Publish only after the slot is written
+            
+    def empty(self):
+        return self.head == self.tail
+        
+    def drain(self):
+        """Consumer side: return all pending audio as one contiguous array.
+
+        The result is a view of the ring's output buffer and is only valid
+        until the next drain(); copy it if it has to outlive the tick.
+        """
+        with self._lock:
+            head = self.head
+            tail = self.tail
+            n = 0
+            for pos in range(tail, head):
+                idx = pos % self.num_slots
+                length = self.lengths[idx]
+                self._out[n:n + length] = self.slots[idx, :length]
+                n += length
+            out = self._out[:n]
+            self.tail = head
+        if self.dropped:
+            core.log_message(f"Audio ring overrun: dropped {self.dropped} blocks", "WARNING")
+            self.dropped = 0
+        return out
+        
+    def clear(self):
+        with self._lock:
+            self.tail = self.head
+
+
+audio_queue = AudioRing()
+
+
+def _ring_write(buffer, chunk, write_pos, data_size, max_size):
+    """Copy chunk into the ring buffer; returns (write_pos, data_size)."""
+    chunk_size = chunk.shape[0]
+    
+    if chunk_size >= max_size:
+        # If chunk is larger than buffer, just keep the end
+        buffer[:] = chunk[chunk_size - max_size:]
+        return 0, max_size
+        
+    # Check if we need to wrap around
+    if write_pos + chunk_size <= max_size:
+        buffer[write_pos:write_pos + chunk_size] = chunk
+        write_pos += chunk_size
+    else:
+        # Wrap around
+        first_part = max_size - write_pos
+        buffer[write_pos:] = chunk[:first_part]
+        buffer[:chunk_size - first_part] = chunk[first_part:]
+        write_pos = chunk_size - first_part
+        
+    return write_pos, min(data_size + chunk_size, max_size)
+
+
+# Compile the ring write with Numba when available (optional dependency) so
+# add_audio is a pair of memcpys without interpreter overhead. Warm it up at
+# import time so the first real-time block doesn't pay the JIT cost.
+if njit is not None:
+    try:
+        _ring_write_jit = njit(cache=True, nogil=True)(_ring_write)
+        _ring_write_jit(np.zeros(2, dtype=np.float32), np.zeros(1, dtype=np.float32), 0, 0, 2)
+        _ring_write = _ring_write_jit
+    except Exception as e:
+        core.log_message(f"Numba ring buffer kernel unavailable, using numpy: {e}", "WARNING")
+
+
 class CircularAudioBuffer:
     """Efficient circular buffer to avoid numpy concatenation overhead."""
     def __init__(self, max_duration_seconds=30):
         self.max_size = int(core.TARGET_RATE * max_duration_seconds)
-        self.buffer = np.zeros(self.max_size, dtype=np.float32)
+        # Backing array; buffer is a view of its first max_size samples so
+        # resize() can shrink (or grow back) without reallocating
+        self._storage = np.zeros(self.max_size, dtype=np.float32)
+        self.buffer = self._storage
         self.write_pos = 0
         self.data_size = 0
+        self.total_written = 0  # Samples ever added; not reset by clear()
         
     def add_audio(self, audio_chunk):
         """Add audio chunk to buffer efficiently."""
-        chunk_size = len(audio_chunk)
-        
-        if chunk_size >= self.max_size:
-            # If chunk is larger than buffer, just keep the end
-            self.buffer[:] = audio_chunk[-self.max_size:]
-            self.write_pos = 0
-            self.data_size = self.max_size
-            return
-            
-        # Check if we need to wrap around
-        if self.write_pos + chunk_size <= self.max_size:
-            self.buffer[self.write_pos:self.write_pos + chunk_size] = audio_chunk
-            self.write_pos += chunk_size
-        else:
-            # Wrap around
-            first_part = self.max_size - self.write_pos
-            self.buffer[self.write_pos:] = audio_chunk[:first_part]
-            self.buffer[:chunk_size - first_part] = audio_chunk[first_part:]
-            self.write_pos = chunk_size - first_part
-            
-        self.data_size = min(self.data_size + chunk_size, self.max_size)
+        self.write_pos, self.data_size = _ring_write(
+            self.buffer, audio_chunk, self.write_pos, self.data_size, self.max_size
+        )
+        self.total_written += len(audio_chunk)
     
     def get_audio(self, duration_seconds=None):
-        """Get audio from buffer as contiguous array."""
+        """Get the most recent audio from the buffer.
+
+        Returns a view (no copy) when the samples are contiguous;
+        only a true wrap-around needs a two-slice concatenate. Views are valid
+        until the next add_audio/clear, so copy them if they must outlive that.
+        """
         if duration_seconds is None:
             samples_needed = self.data_size
         else:
@@ -970,93 +1358,235 @@ class CircularAudioBuffer:
         if samples_needed == 0:
             return np.array([], dtype=np.float32)
             
-        if samples_needed <= self.data_size and self.write_pos >= samples_needed:
-            # Simple case: data is contiguous before write_pos
-            return self.buffer[self.write_pos - samples_needed:self.write_pos].copy()
+        if self.write_pos >= samples_needed:
+            # Common case: data is contiguous before write_pos
+            return self.buffer[self.write_pos - samples_needed:self.write_pos]
+        elif self.write_pos == 0:
+            # Buffer full and write_pos wrapped exactly to the start
+            return self.buffer[self.max_size - samples_needed:]
         else:
-            # Need to handle wrap-around
-            result = np.zeros(samples_needed, dtype=np.float32)
-            if self.data_size < self.max_size:
-                # Buffer not full yet
-                result[:] = self.buffer[:samples_needed]
-            else:
-                # Buffer is full, need to reconstruct order
-                if self.write_pos == 0:
-                    result[:] = self.buffer[-samples_needed:]
-                else:
-                    first_part = min(samples_needed, self.max_size - self.write_pos)
-                    result[:first_part] = self.buffer[self.write_pos:self.write_pos + first_part]
-                    if samples_needed > first_part:
-                        remaining = samples_needed - first_part
-                        result[first_part:] = self.buffer[:remaining]
-            return result
+            # Wrap-around: tail of the buffer followed by its head
+            start = self.max_size - (samples_needed - self.write_pos)
+            return np.concatenate((self.buffer[start:], self.buffer[:self.write_pos]))
     
+    def snapshot(self, duration_seconds=None):
+        """Like get_audio, but returns an owned copy for consumers on other threads.
+
+        A wrap-around read is already a fresh array, so at most one copy is made.
+        """
+        audio = self.get_audio(duration_seconds)
+        return audio.copy() if audio.base is not None else audio
+
     def clear(self):
         """Clear the buffer."""
         self.write_pos = 0
         self.data_size = 0
         
+    def resize(self, max_duration_seconds, keep_seconds=2):
+        """Change capacity in place, carrying over at most keep_seconds of the newest audio.
+
+        Shrinking, or growing back within the largest size used so far, reuses
+        the backing array; only growing past it allocates. total_written keeps counting.
+        """
+        new_size = int(core.TARGET_RATE * max_duration_seconds)
+        if new_size == self.max_size:
+            return
+        keep = min(self.data_size, new_size, int(core.TARGET_RATE * keep_seconds))
+        # The newest `keep` samples end at write_pos and may wrap around the old end
+        head = min(keep, self.write_pos)
+        wrap = keep - head
+        newest = self.buffer[self.write_pos - head:self.write_pos]
+        older = self.buffer[self.max_size - wrap:self.max_size]
+        if new_size > self._storage.size:
+            self._storage = np.zeros(new_size, dtype=np.float32)
+            np.copyto(self._storage[:wrap], older)
+            np.copyto(self._storage[wrap:keep], newest)
+        else:
+            # In place: only the wrapped part can be overwritten before it is read
+            older = older.copy() if wrap else older
+            np.copyto(self._storage[wrap:keep], newest)
+            np.copyto(self._storage[:wrap], older)
+        self.buffer = self._storage[:new_size]
+        self.max_size = new_size
+        self.write_pos = keep % new_size
+        self.data_size = keep
+
+    def keep_tail(self, n_samples):
+        """Drop all but the newest n_samples in place.
+
+        The ring already ends at write_pos, so shrinking data_size is enough.
+        """
+        self.data_size = max(0, min(int(n_samples), self.data_size))
+
     def get_overlap(self, overlap_seconds):
         """Get overlap audio for continuity."""
         overlap_samples = int(core.TARGET_RATE * overlap_seconds)
         return self.get_audio(overlap_seconds) if overlap_samples <= self.data_size else np.array([], dtype=np.float32)
 
 # --- Whisper Model Singleton ---
-def get_whisper_model():
-    """Get or create the global Whisper model instance with hardware detection."""
-    global whisper_model
-    if whisper_model is None:
-        # Lazy import to avoid loading heavy libs in subprocesses
-        from faster_whisper import WhisperModel
-        # Get hardware preferences
-        device_pref = user_preferences.get("compute_device", "CPU Only")
-        compute_type = user_preferences.get("compute_type", "int8")
-        
-        # Determine device - simplified to avoid GPU detection hanging
-        if device_pref == "CPU Only":
-            device = "cpu"
-        elif device_pref == "CUDA GPU":
-            device = "cuda"
-        elif device_pref == "Metal GPU (Apple)":
-            device = "auto"  # Let faster-whisper handle Metal detection
-        else:  # Default to CPU for stability
-            device = "cpu"
-        
-        core.log_message(f"Loading Whisper model ({core.WHISPER_MODEL_SIZE}) on {device} with {compute_type}...")
-        
-        try:
-            whisper_model = WhisperModel(
-                core.WHISPER_MODEL_SIZE, 
-                device=device, 
-                compute_type=compute_type,
-                num_workers=1 if device == "cpu" else 4,  # More workers for GPU
-                download_root=None,
-                local_files_only=False
-            )
-            actual_device = getattr(whisper_model.model, 'device', 'unknown')
-            core.log_message(f"Whisper model loaded on {actual_device} with {compute_type} precision.")
-        except Exception as e:
-            core.log_message(f"Failed to load on {device}, falling back to CPU: {e}", "WARNING")
-            whisper_model = WhisperModel(
-                core.WHISPER_MODEL_SIZE, 
-                device="cpu", 
-                compute_type="int8",
-                num_workers=1
-            )
-            core.log_message("Whisper model loaded on CPU fallback.")
+WHISPER_GPU_BATCH_SIZE = 8
+# One shared model serves every caller; CTranslate2 workers bound how many
+# transcribe() calls run at once: the live transcription worker plus one
+# upload/microphone request. Extra workers would only reserve idle threads.
+# Each worker gets its own pool of cpu_threads, so the pref is split across them.
+WHISPER_NUM_WORKERS = 2
+
+def wrap_batched_pipeline(model, batch_size=WHISPER_GPU_BATCH_SIZE):
+    """Wrap a GPU WhisperModel in faster-whisper's BatchedInferencePipeline.
+
+    Segments of a window are then decoded as one batch; older faster-whisper
+    releases without the pipeline keep using the plain model.
+    """
+    try:
+        from faster_whisper import BatchedInferencePipeline
+    except ImportError:
+        core.log_message("BatchedInferencePipeline not available in this faster-whisper version.", "DEBUG")
+        return model
+    try:
+        pipeline = BatchedInferencePipeline(model=model)
+        core.WHISPER_BATCH_SIZE = batch_size
+        core.log_message(f"Using batched Whisper inference (batch_size={batch_size}).")
+        return pipeline
+    except Exception as e:
+        core.log_message(f"Could not enable batched Whisper inference: {e}", "WARNING")
+        return model
+
+def whisper_device(model):
+    """Device a loaded WhisperModel (or its batched pipeline wrapper) runs on."""
+    inner = getattr(model, "model", None)
+    if inner is not None and not hasattr(inner, "device"):
+        inner = getattr(inner, "model", None)  # BatchedInferencePipeline -> WhisperModel -> CT2
+    return getattr(inner, "device", "unknown")
+
+def resolve_whisper_device(device_pref):
+    """Map the Device dropdown to a CTranslate2 device string."""
+    # Simplified to avoid GPU detection hanging
+    if device_pref == "CUDA GPU":
+        return "cuda"
+    if device_pref == "Metal GPU (Apple)":
+        return "auto"  # Let faster-whisper handle Metal detection
+    return "cpu"  # "CPU Only" and anything unknown: CPU for stability
+
+def resolve_compute_type(device, compute_type):
+    """Map the Precision dropdown to the CTranslate2 compute type actually used on device."""
+    if device == "cuda" and compute_type == "int8":
+        return "int8_float16"  # int8 weights, float16 tensor-core math: half the weight traffic
+    if device == "cpu" and compute_type == "float16":
+        return "int8"  # CPU kernels have no float16 path
+    return compute_type
+
+_loaded_model_sig = None  # whisper_model_signature() the current model was loaded with
+
+def whisper_model_signature():
+    """The preferences that decide which Whisper model gets loaded, and with how many threads."""
+    return (
+        user_preferences.get("compute_device", "CPU Only"),
+        user_preferences.get("compute_type", "int8"),
+        str(core.WHISPER_MODEL_SIZE),
+        # CTranslate2 only takes its thread count at construction
+        get_cpu_threads(),
+    )
+
+def whisper_reload_needed():
+    """True if no model is loaded or the compute preferences changed since it was."""
+    return whisper_model is None or _loaded_model_sig != whisper_model_signature()
+
+def warm_up_whisper(model):
+    """Decode one second of silence so CTranslate2 picks its kernels before the first real window."""
+    try:
+        start = time.perf_counter()
+        segments, _ = model.transcribe(
+            np.zeros(core.TARGET_RATE, dtype=np.float32),
+            language="en",  # Skip language detection
+            beam_size=1,
+            condition_on_previous_text=False,
+            vad_filter=False,
+        )
+        for _ in segments:  # Segments are decoded lazily
+            pass
+        core.log_message(f"Whisper warm-up took {time.perf_counter() - start:.2f}s", "DEBUG")
+    except Exception as e:
+        core.log_message(f"Whisper warm-up skipped: {e}", "DEBUG")
+
+# Loads and swaps happen under this lock, so concurrent callers never build two models
+_whisper_load_lock = threading.RLock()
+
+def _load_whisper_model():
+    """Build a Whisper model from the current preferences; returns (model, signature)."""
+    sig = whisper_model_signature()
+    # Lazy import to avoid loading heavy libs in subprocesses
+    from faster_whisper import WhisperModel
+    # Get hardware preferences
+    device_pref = user_preferences.get("compute_device", "CPU Only")
+    compute_type = user_preferences.get("compute_type", "int8")
+    
+    device = resolve_whisper_device(device_pref)
+    compute_type = resolve_compute_type(device, compute_type)
+    cpu_threads = get_cpu_threads()
+    # Keep the total across workers within the thread budget instead of multiplying it
+    cpu_threads = max(1, cpu_threads // WHISPER_NUM_WORKERS)
+    
+    core.log_message(f"Loading Whisper model ({core.WHISPER_MODEL_SIZE}) on {device} with {compute_type}...")
     
-    return whisper_model
+    try:
+        model = WhisperModel(
+            core.WHISPER_MODEL_SIZE, 
+            device=device, 
+            compute_type=compute_type,
+            cpu_threads=cpu_threads,
+            num_workers=WHISPER_NUM_WORKERS,
+            download_root=None,
+            local_files_only=False
+        )
+        actual_device = getattr(model.model, 'device', 'unknown')
+        core.log_message(f"Whisper model loaded on {actual_device} with {compute_type} precision.")
+        warm_up_whisper(model)
+        core.WHISPER_BATCH_SIZE = 0
+        if device != "cpu":
+            model = wrap_batched_pipeline(model)
+    except Exception as e:
+        core.log_message(f"Failed to load on {device}, falling back to CPU: {e}", "WARNING")
+        model = WhisperModel(
+            core.WHISPER_MODEL_SIZE, 
+            device="cpu", 
+            compute_type="int8",
+            cpu_threads=cpu_threads,
+            num_workers=WHISPER_NUM_WORKERS
+        )
+        core.WHISPER_BATCH_SIZE = 0
+        core.log_message("Whisper model loaded on CPU fallback.")
+        warm_up_whisper(model)
+    return model, sig
+
+def get_whisper_model(blocking=True):
+    """Get or create the global Whisper model instance with hardware detection.
+
+    With blocking=False, returns None instead of waiting while another thread loads it.
+    """
+    global whisper_model, _loaded_model_sig
+    model = whisper_model
+    if model is not None:
+        return model
+    if not _whisper_load_lock.acquire(blocking=blocking):
+        return None
+    try:
+        if whisper_model is None:
+            # Published only once the load succeeded
+            whisper_model, _loaded_model_sig = _load_whisper_model()
+        return whisper_model
+    finally:
+        _whisper_load_lock.release()
 
 def reload_whisper_model(force=False):
     """Force Whisper model to reload e.g. after compute setting changes."""
-    global whisper_model
-    if force and whisper_model is not None:
-        try:
-            del whisper_model
-        except Exception:
-            pass
-    whisper_model = None
-    return get_whisper_model()
+    global whisper_model, _loaded_model_sig
+    with _whisper_load_lock:
+        if not force and not whisper_reload_needed():
+            return whisper_model
+        # Drop the old model first so the device never holds two at once
+        whisper_model = None
+        _loaded_model_sig = None
+        return get_whisper_model()
 
 def restart_recording_if_needed(was_recording):
     """Restart continuous recording if it was active before a reload."""
@@ -1072,24 +1602,175 @@ def restart_recording_if_needed(was_recording):
 def is_recording_active():
     return recording_thread is not None and recording_thread.is_alive()
 
+# Apply reloads run here so the click returns while CTranslate2 loads the model;
+# one worker keeps at most one reload in flight.
+_reload_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="whisper-reload")
+_pending_reload = None
+_pending_reload_lock = threading.Lock()
+
+def current_whisper_precision():
+    """Compute type the saved Device/Precision preferences resolve to."""
+    device = resolve_whisper_device(user_preferences.get("compute_device", "CPU Only"))
+    return resolve_compute_type(device, user_preferences.get("compute_type", "int8"))
+
+def _reload_whisper_and_resume():
+    """Reload Whisper, pausing recording around it; returns a status line."""
+    # Preferences are read when the reload runs, so a queued request picks up later changes
+    if not whisper_reload_needed():
+        return "✅ Whisper model already matches the saved settings"
+    precision = current_whisper_precision()
+    was_recording = is_recording_active()
+    if was_recording:
+        stop_continuous_recording(clear_intent=False)
+    try:
+        new_model = reload_whisper_model(force=True)
+    except Exception as e:
+        core.log_message(f"Failed to reload Whisper model: {e}", "WARNING")
+        return f"❌ Failed to reload Whisper model: {e}"
+    actual_device = whisper_device(new_model)
+    core.log_message(f"Whisper model reloaded: size={core.WHISPER_MODEL_SIZE}, device={actual_device}, precision={precision}")
+    restart_recording_if_needed(was_recording)
+    return f"✅ Whisper model reloaded on {actual_device} + {precision}"
+
+def start_whisper_reload():
+    """Queue a background Whisper reload; poll with whisper_reload_result().
+
+    Requests made while one is still queued share it; while one is loading, a
+    single follow-up is queued to catch settings changed after it started.
+    """
+    global _pending_reload
+    with _pending_reload_lock:
+        pending = _pending_reload
+        if pending is not None and not pending.done() and not pending.running():
+            return pending
+        _pending_reload = _reload_executor.submit(_reload_whisper_and_resume)
+        return _pending_reload
+
+def whisper_reload_result():
+    """Status line of the finished background reload, or None while idle or still loading."""
+    global _pending_reload
+    if _pending_reload is None or not _pending_reload.done():
+        return None
+    fut, _pending_reload = _pending_reload, None
+    try:
+        return fut.result()
+    except Exception as e:
+        return f"❌ Failed to reload Whisper model: {e}"
+
 # --- Efficient Audio Resampling ---
+# Polyphase FIR taps per (orig_sr, target_sr); the session rate pair rarely changes
+_RESAMPLER_CACHE = {}
+
+
+def _get_resampler(orig_sr, target_sr):
+    """Return cached (up, down, taps, n_pre_remove) for a rate pair.
+
+    Uses the same Kaiser FIR design as scipy.signal.resample_poly so output
+    matches it exactly, but the taps are only designed once per ratio.
+    """
+    key = (orig_sr, target_sr)
+    cached = _RESAMPLER_CACHE.get(key)
+    if cached is not None:
+        return cached
+    
+    # Reduce to the smallest integer ratio (e.g. 48000->16000 is up=1, down=3)
+    g = gcd(orig_sr, target_sr)
+    up = target_sr // g
+    down = orig_sr // g
+    max_rate = max(up, down)
+    half_len = 10 * max_rate
+    h = firwin(2 * half_len + 1, 1.0 / max_rate, window=('kaiser', 8.0)) * up
+    # Pre-pad so the filter delay lands on an output sample boundary, plus a
+    # little post-padding so the output always covers the requested length
+    n_pre_pad = down - half_len % down
+    n_pre_remove = (half_len + n_pre_pad) // down
+    h = np.concatenate([np.zeros(n_pre_pad), h, np.zeros(down)]).astype(np.float32)
+    
+    cached = (up, down, h, n_pre_remove)
+    _RESAMPLER_CACHE[key] = cached
+    return cached
+
+
 def efficient_resample(audio, orig_sr, target_sr):
-    """CPU-efficient audio resampling using scipy."""
+    """CPU-efficient audio resampling using a cached polyphase FIR (scipy.upfirdn)."""
     if orig_sr == target_sr:
         return audio
     
-    # Calculate new length
-    new_length = int(len(audio) * target_sr / orig_sr)
-    
-    # Use scipy resample (faster than librosa on CPU)
     try:
-        resampled = resample(audio, new_length)
-        return resampled.astype(np.float32)
+        up, down, h, n_pre_remove = _get_resampler(int(orig_sr), int(target_sr))
+        n_out = -(-len(audio) * up // down)  # ceil(len * up / down)
+        resampled = upfirdn(h, audio, up=up, down=down)
+        return resampled[n_pre_remove:n_pre_remove + n_out].astype(np.float32, copy=False)
     except Exception as e:
-        core.log_message(f"Scipy resampling failed: {e}, falling back to simple interpolation", "WARNING")
-        # Simple linear interpolation fallback
-        indices = np.linspace(0, len(audio) - 1, new_length)
-        return np.interp(indices, np.arange(len(audio)), audio).astype(np.float32)
+        # No unfiltered fallback: aliased audio would quietly degrade Whisper
+        core.log_message(f"Resampling {orig_sr}Hz -> {target_sr}Hz failed: {e}", "ERROR")
+        raise
+
+class StreamingResampler:
+    """Stateful polyphase resampler for block-wise audio streams.
+
+    Keeps just enough input history between calls that consecutive blocks
+    are filtered as one continuous signal (no per-block edge transients).
+    The concatenated output equals efficient_resample() of the whole stream.
+    """
+    def __init__(self, orig_sr, target_sr):
+        self.up, self.down, self.h, n_pre_remove = _get_resampler(int(orig_sr), int(target_sr))
+        self._history = np.zeros(0, dtype=np.float32)
+        self._base = 0  # Absolute input index of _history[0]; kept a multiple of down
+        self._next_out = n_pre_remove  # Absolute index of the next output sample
+        
+    def process(self, block):
+        """Feed one input block; returns the output samples that are now final."""
+        up, down = self.up, self.down
+        x = np.concatenate((self._history, block)) if len(self._history) else block
+        end = self._base + len(x)
+        last_out = (end * up - 1) // down
+        if last_out < self._next_out:
+            self._history = x.copy() if x is block else x
+            return np.zeros(0, dtype=np.float32)
+        
+        # _base is a multiple of down, so upfirdn's output grid lines up with
+        # the absolute output grid at this offset
+        offset = self._base * up // down
+        y = upfirdn(self.h, x, up=up, down=down)
+        out = y[self._next_out - offset:last_out - offset + 1]
+        self._next_out = last_out + 1
+        
+        # Drop input no longer reachable by the filter for future outputs.
+        # Copy the tail if it still aliases the caller's block (which may be a
+        # reused scratch buffer).
+        keep_from = (self._next_out * down - (len(self.h) - 1)) // up
+        new_base = max(self._base, keep_from // down * down)
+        self._history = x[new_base - self._base:]
+        if x is block:
+            self._history = self._history.copy()
+        self._base = new_base
+        return out.astype(np.float32, copy=False)
+
+
+class SoxrStreamingResampler:
+    """StreamingResampler equivalent backed by libsoxr's SIMD stream resampler."""
+    QUALITY = "HQ"  # ~3x faster than upfirdn here; QQ is cubic interpolation with little anti-aliasing
+    
+    def __init__(self, orig_sr, target_sr):
+        self._stream = soxr.ResampleStream(
+            int(orig_sr), int(target_sr), 1, dtype="float32", quality=self.QUALITY
+        )
+        
+    def process(self, block):
+        """Feed one input block; returns the output samples that are now final."""
+        return self._stream.resample_chunk(np.ascontiguousarray(block, dtype=np.float32))
+
+
+def make_stream_resampler(orig_sr, target_sr):
+    """Return the fastest available stateful resampler for a capture stream."""
+    if soxr is not None:
+        try:
+            return SoxrStreamingResampler(orig_sr, target_sr)
+        except Exception as e:
+            core.log_message(f"soxr resampler unavailable, using scipy polyphase: {e}", "WARNING")
+    return StreamingResampler(orig_sr, target_sr)
+
 
 # Apply persisted timing/VAD preferences at startup (if present)
 try:
@@ -1112,19 +1793,25 @@ try:
             core.NO_SPEECH_THRESHOLD = float(user_preferences["no_speech_threshold"])
         if hasattr(core, "VAD_FILTER") and "vad_filter" in user_preferences:
             core.VAD_FILTER = bool(user_preferences["vad_filter"])
+        refresh_timing_config()
         core.log_message(f"Applied saved preferences to runtime: whisper_model={getattr(core,'WHISPER_MODEL_SIZE',None)}, timing={RUNTIME_PARAMS}, no_speech={getattr(core,'NO_SPEECH_THRESHOLD',None)}, vad={getattr(core,'VAD_FILTER',None)}")
 except Exception as e:
     core.log_message(f"Failed to apply saved timing/VAD preferences: {e}", "WARNING")
 
 # --- Async Processing Variables ---
 async_loop = None
-tts_queue = queue.Queue()
+# One queued utterance for the TTS worker
+TtsJob = namedtuple("TtsJob", "text voice settings output_device_idx")
+TTS_QUEUE_MAX = 4  # Pending utterances; older ones are dropped so speech can't fall far behind
+tts_queue = queue.Queue(maxsize=TTS_QUEUE_MAX)
 tts_thread = None
 tts_stop_event = threading.Event()
 translation_executor = None
 translation_results_queue = queue.Queue()
 transcription_sequence = 0
 last_displayed_transcription_id = 0
+# Highest id whose translation came back at all (including failed or empty ones)
+last_completed_transcription_id = 0
 
 def get_translation_worker_count():
     pref_value = user_preferences.get("translation_workers") if isinstance(user_preferences, dict) else None
@@ -1153,6 +1840,17 @@ def refresh_translation_executor(new_worker_count=None):
         user_preferences["translation_workers"] = new_worker_count
     return get_translation_executor()
 
+def drain_queue(q):
+    """Take every pending item from a queue.Queue under one lock (no queue.Empty)."""
+    with q.mutex:
+        items = list(q.queue)
+        q.queue.clear()
+        q.unfinished_tasks = max(0, q.unfinished_tasks - len(items))
+        if q.unfinished_tasks == 0:
+            q.all_tasks_done.notify_all()
+        q.not_full.notify_all()
+    return items
+
 def next_transcription_id():
     """Generate a monotonically increasing transcription identifier."""
     global transcription_sequence
@@ -1160,7 +1858,12 @@ def next_transcription_id():
     return transcription_sequence
 
 def schedule_translation_task(transcription_id, transcription, source_lang_name, target_language, ollama_model, voice, output_device_idx):
-    """Run translation in background and enqueue TTS/results when ready."""
+    """Run translation in background and enqueue TTS/results when ready.
+
+    Returns the translation future so callers can await it instead of polling.
+    With transcription_id None the caller owns the result: nothing is put on
+    the live results queue that check_audio_queue displays.
+    """
     executor = get_translation_executor()
     settings_snapshot = dict(current_settings) if isinstance(current_settings, dict) else {}
 
@@ -1182,20 +1885,31 @@ def schedule_translation_task(transcription_id, transcription, source_lang_name,
 
         if translation and voice and str(voice).lower() != "none":
             # Kick off TTS asynchronously (fire-and-forget)
-            tts_queue.put((
-                translation,
-                voice,
-                settings_snapshot,
-                output_device_idx,
-                None
-            ))
+            enqueue_tts(TtsJob(translation, voice, settings_snapshot, output_device_idx))
         elif translation:
             core.log_message("Voice set to text-only; skipping TTS enqueue.", "DEBUG")
 
         # Notify UI polling loop that translation finished (success or failure)
-        translation_results_queue.put((transcription_id, transcription, translation))
+        if transcription_id is not None:
+            translation_results_queue.put((transcription_id, transcription, translation))
 
     future.add_done_callback(_on_complete)
+    return future
+
+def enqueue_tts(task):
+    """Queue a TTS task without blocking, dropping the oldest pending one when full."""
+    while True:
+        try:
+            tts_queue.put_nowait(task)
+            return
+        except queue.Full:
+            pass
+        try:
+            tts_queue.get_nowait()
+        except queue.Empty:
+            continue
+        tts_queue.task_done()
+        core.log_message("TTS queue full; dropped the oldest pending utterance.", "WARNING")
 
 def get_event_loop():
     """Get or create an event loop for async operations."""
@@ -1224,12 +1938,10 @@ def tts_worker():
                 tts_queue.task_done()
                 continue
                 
-            translation, voice, settings, output_device_idx, result_queue = task
+            translation, voice, output_device_idx = task.text, task.voice, task.output_device_idx
 
             if not voice or str(voice).lower() == "none":
                 core.log_message("TTS worker received text-only task; skipping audio.", "DEBUG")
-                if result_queue is not None:
-                    result_queue.put((True, "Voice disabled; no audio generated"))
                 tts_queue.task_done()
                 continue
 
@@ -1286,14 +1998,9 @@ def tts_worker():
                 else:
                     consecutive_errors += 1
                     core.log_message(f"TTS returned no audio data ({consecutive_errors}/{max_consecutive_errors})", "WARNING")
-
-                if result_queue is not None:
-                    result_queue.put((True, "Audio played successfully"))
             except Exception as e:
                 consecutive_errors += 1
                 core.log_message(f"TTS worker error ({consecutive_errors}/{max_consecutive_errors}): {e}", "ERROR")
-                if result_queue is not None:
-                    result_queue.put((False, str(e)))
                 
                 # If too many consecutive errors, log loud warning
                 if consecutive_errors >= max_consecutive_errors:
@@ -1319,9 +2026,90 @@ def start_tts_worker():
         tts_thread.start()
         core.log_message("TTS worker thread started")
 
+# --- Translation Log Writer ---
+TRANSLATION_LOG_FILE = "translation_log.txt"
+translation_log_queue = queue.Queue()
+translation_log_thread = None
+
+def translation_log_worker():
+    """Append queued log entries through one long-lived handle, flushing once the queue is idle."""
+    try:
+        with open(TRANSLATION_LOG_FILE, "a", encoding="utf-8", buffering=1 << 16) as f:
+            while True:
+                entry = translation_log_queue.get()
+                if entry is None:
+                    break
+                f.write(entry)
+                if translation_log_queue.empty():
+                    f.flush()
+    except Exception as e:
+        core.log_message(f"Translation log writer stopped: {e}", "ERROR")
+
+_log_stamp = (0, "")
+
+def log_timestamp():
+    """Local "%Y-%m-%d %H:%M:%S" stamp, formatted at most once per second."""
+    global _log_stamp
+    now_s = int(time.time())
+    if now_s != _log_stamp[0]:
+        _log_stamp = (now_s, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now_s)))
+    return _log_stamp[1]
+
+def log_translation(entry):
+    """Queue an entry for translation_log.txt without touching the disk on the caller's thread."""
+    global translation_log_thread
+    if translation_log_thread is None or not translation_log_thread.is_alive():
+        translation_log_thread = threading.Thread(target=translation_log_worker, daemon=True)
+        translation_log_thread.start()
+    translation_log_queue.put(entry)
+
+def stop_translation_log(timeout=2.0):
+    """Flush pending entries and close the log file."""
+    if translation_log_thread is not None and translation_log_thread.is_alive():
+        translation_log_queue.put(None)
+        translation_log_thread.join(timeout)
+
+# --- Log Viewer ---
+LOG_VIEW_MAX_BYTES = 1 << 20  # The Logs tab shows at most the last 1 MB of a day's log
+LOG_VIEW_MAX_LINES = 2000  # ...and at most this many lines of it
+LOG_VIEW_BLOCK = 64 * 1024
+_log_view_cache = {}  # path -> (mtime_ns, size, text)
+
+def _read_tail_bytes(f, size, max_lines, max_bytes):
+    """Read blocks backwards from the end until max_lines lines or max_bytes are covered.
+
+    Returns (data, truncated); data always starts at a line boundary.
+    """
+    data = bytearray()
+    pos = size
+    # One extra newline is needed to know the oldest kept line is complete
+    while pos > 0 and len(data) < max_bytes and data.count(b"\n") <= max_lines:
+        step = min(LOG_VIEW_BLOCK, pos, max_bytes - len(data))
+        pos -= step
+        f.seek(pos)
+        data[:0] = f.read(step)
+    lines = data.splitlines(keepends=True)
+    if pos > 0:
+        lines = lines[1:]  # Partial first line
+    return b"".join(lines[-max_lines:]), pos > 0 or len(lines) > max_lines
+
+def read_log_tail(path, max_bytes=LOG_VIEW_MAX_BYTES, max_lines=LOG_VIEW_MAX_LINES):
+    """Return the tail of a log file, re-reading it only when its mtime or size changed."""
+    st = os.stat(path)
+    cached = _log_view_cache.get(path)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+    with open(path, "rb") as f:
+        data, truncated = _read_tail_bytes(f, st.st_size, max_lines, max_bytes)
+    text = data.decode("utf-8", errors="replace")
+    if truncated:
+        text = "[… earlier entries omitted …]\n" + text
+    _log_view_cache[path] = (st.st_mtime_ns, st.st_size, text)
+    return text
+
 # --- Audio Recording Functions ---
 def record_audio(input_device_index, audio_q, stop_ev):
-    """Records audio using sounddevice InputStream at the device's native rate and enqueues raw data for downstream resampling."""
+    """Records audio using sounddevice InputStream at the device's native rate and enqueues mono blocks; the consumer resamples them to TARGET_RATE."""
     channels = 1
     dtype = "float32"
 
@@ -1343,13 +2131,19 @@ def record_audio(input_device_index, audio_q, stop_ev):
             f"Attempting to open sounddevice InputStream on device {input_device_index} at native {native_rate}Hz (will resample to {core.TARGET_RATE}Hz)"
         )
 
-        # Lightweight callback: enqueue (samples, sample_rate)
+        # The ring carries native-rate audio; the consumer resamples each
+        # drained batch in one call, with filter state carried across ticks
+        audio_q.clear()
+        audio_q.resampler = (
+            make_stream_resampler(native_rate, core.TARGET_RATE) if native_rate != core.TARGET_RATE else None
+        )
+
         def _cb(indata, frames, cb_time, status):
             if status:
                 core.log_message(f"Audio Callback Status: {status}", "WARNING")
             try:
-                data = indata.copy().flatten().astype(np.float32)
-                audio_q.put((data, native_rate))
+                # The ring copies straight out of the device buffer
+                audio_q.put(indata[:, 0])
             except Exception as cb_e:
                 core.log_message(f"Audio callback error: {cb_e}", "ERROR")
 
@@ -1365,8 +2159,8 @@ def record_audio(input_device_index, audio_q, stop_ev):
                 f"Sounddevice InputStream started on device {input_device_index} at {native_rate}Hz."
             )
             
-            while not stop_ev.is_set():
-                time.sleep(0.1)
+            # Block until stop is requested; no polling competes with the audio callback
+            stop_ev.wait()
 
             core.log_message("Stop event received, stopping stream...")
 
@@ -1383,7 +2177,70 @@ def audio_callback(indata, frames, time, status, audio_q):
     """Sounddevice callback: Called for each audio block."""
     if status:
         core.log_message(f"Audio Callback Status: {status}", "WARNING")
-    audio_q.put(indata.copy())
+    audio_q.put(indata[:, 0].copy())
+
+
+def _peak_normalize(a):
+    """Scale float32 audio in place so its peak is at most 1.0."""
+    peak = max(float(a.max()), -float(a.min())) if a.shape[0] else 0.0
+    if peak > 1.0:
+        a *= np.float32(1.0 / peak)
+    return a
+
+
+def _peak_normalize_loop(a):
+    """Single-pass peak search + scale, compiled with Numba."""
+    m = 0.0
+    for i in range(a.shape[0]):
+        v = a[i]
+        av = -v if v < 0 else v
+        if av > m:
+            m = av
+    if m > 1.0:
+        inv = 1.0 / m
+        for i in range(a.shape[0]):
+            a[i] *= inv
+    return a
+
+
+# Fused reduction without an np.abs temporary; the NumPy version above is used
+# when Numba isn't installed.
+if njit is not None:
+    try:
+        _peak_normalize_jit = njit(cache=True, nogil=True, fastmath=True)(_peak_normalize_loop)
+        _peak_normalize_jit(np.zeros(1, dtype=np.float32))
+        _peak_normalize = _peak_normalize_jit
+    except Exception as e:
+        core.log_message(f"Numba normalization kernel unavailable, using numpy: {e}", "WARNING")
+
+
+def owned_audio(audio, source):
+    """Contiguous audio safe to modify in place; copied if it still shares memory with source."""
+    audio = np.ascontiguousarray(audio)
+    if np.may_share_memory(audio, source):
+        audio = audio.copy()  # Never scale the caller's array
+    return audio
+
+
+def pcm_to_float32(audio):
+    """Convert browser PCM (usually int16) to float32 in [-1, 1] with one cast and one in-place scale."""
+    audio = np.asarray(audio)
+    if audio.dtype == np.float32:
+        return audio
+    if np.issubdtype(audio.dtype, np.signedinteger):
+        out = audio.astype(np.float32)
+        out *= np.float32(1.0 / (np.iinfo(audio.dtype).max + 1))
+        return out
+    return audio.astype(np.float32)
+
+
+def downmix_to_mono(audio):
+    """Average (samples, channels) audio to mono with a float32 accumulator."""
+    if audio.ndim < 2:
+        return audio
+    mono = np.add.reduce(audio, axis=-1, dtype=np.float32)
+    mono *= np.float32(1.0 / audio.shape[-1])
+    return mono
 
 
 def process_audio_chunk(audio_data, source_language, target_language, ollama_model, selected_voice):
@@ -1394,21 +2251,14 @@ def process_audio_chunk(audio_data, source_language, target_language, ollama_mod
     # Convert audio data to numpy array if needed
     if isinstance(audio_data, dict) and "array" in audio_data:
         audio_data = audio_data["array"]
+    source = audio_data
+    # Ensure audio is float32 (int16 PCM is scaled, not just cast)
+    audio_data = pcm_to_float32(audio_data)
     # If browser gave 2D (samples, channels), make mono
-    try:
-        if hasattr(audio_data, "ndim") and audio_data.ndim > 1:
-            audio_data = np.mean(audio_data, axis=1)
-    except Exception:
-        pass
+    audio_data = downmix_to_mono(audio_data)
     
-    # Ensure audio is float32
-    if audio_data.dtype != np.float32:
-        audio_data = audio_data.astype(np.float32)
-    
-    # Normalize if needed
-    max_val = np.max(np.abs(audio_data))
-    if max_val > 1.0:
-        audio_data = audio_data / max_val
+    # Normalize if needed; the array Gradio handed in is left untouched
+    audio_data = _peak_normalize(owned_audio(audio_data, source))
     
     # Transcribe
     transcription, detected_code = core.transcribe_audio(
@@ -1487,13 +2337,19 @@ def get_audio_devices():
         
         core.log_message(f"Found {len(devices)} audio devices on {platform}. Default input: {default_input_idx}, Default output: {default_output_idx}")
 
+        # Query all host APIs once instead of one PortAudio call per device
+        try:
+            hostapi_names = [api["name"] for api in sd.query_hostapis()]
+        except Exception as e:
+            core.log_message(f"Could not query host APIs: {e}", "WARNING")
+            hostapi_names = []
+
         # Platform-specific device filtering
         for i, dev in enumerate(devices):
             try:
-                hostapi_info = sd.query_hostapis(dev["hostapi"])
-                hostapi_name = hostapi_info["name"] if hostapi_info else "N/A"
-            except Exception:
-                hostapi_name = "Error"
+                hostapi_name = hostapi_names[dev["hostapi"]]
+            except (IndexError, KeyError, TypeError):
+                hostapi_name = "N/A"
 
             device_name = f"{i}: {dev['name']} ({hostapi_name})"
 
@@ -1562,10 +2418,16 @@ def get_audio_devices():
 
 
 # --- Gradio Interface Functions ---
-def process_audio(audio, source_language, target_language, ollama_model, voice):
-    """Process audio from Gradio's audio input."""
+async def process_audio(audio, source_language, target_language, ollama_model, voice):
+    """Process audio from Gradio's audio input.
+
+    Async generator: yields the transcription as soon as Whisper finishes and
+    again when the translation arrives, without holding a Gradio worker thread
+    while translation runs.
+    """
     if audio is None:
-        return "No audio detected", "", None
+        yield "No audio detected", "", None
+        return
 
     # Accept either (sample_rate, data) or raw numpy array/dict from browser
     audio_data = None
@@ -1575,34 +2437,38 @@ def process_audio(audio, source_language, target_language, ollama_model, voice):
         sample_rate = None
         audio_data = audio
     if audio_data is None:
-         return "No audio data received", "", None
+        yield "No audio data received", "", None
+        return
     
     # Ensure TTS worker is running
     start_tts_worker()
     
-    # Use singleton Whisper model
-    whisper_model = get_whisper_model()
+    # Use singleton Whisper model (may load it on first use)
+    whisper_model = await asyncio.to_thread(get_whisper_model)
     
     # Convert audio data to numpy array if needed
     if isinstance(audio_data, dict) and "array" in audio_data:
         audio_data = audio_data["array"]
+    source = audio_data
+    
+    # Ensure audio is float32 (int16 PCM is scaled, not just cast)
+    audio_data = downmix_to_mono(pcm_to_float32(audio_data))
     
-    # Ensure audio is float32
-    if audio_data.dtype != np.float32:
-        audio_data = audio_data.astype(np.float32)
+    # Browser recordings are usually 48 kHz; decimate with the cached polyphase filter
+    if sample_rate and int(sample_rate) != core.TARGET_RATE:
+        audio_data = efficient_resample(audio_data, int(sample_rate), core.TARGET_RATE)
     
-    # Normalize if needed
-    max_val = np.max(np.abs(audio_data))
-    if max_val > 1.0:
-        audio_data = audio_data / max_val
+    # Normalize if needed; the array Gradio handed in is left untouched
+    audio_data = _peak_normalize(owned_audio(audio_data, source))
     
     # Transcribe
-    transcription, detected_code = core.transcribe_audio(
-        audio_data, source_language, whisper_model
+    transcription, detected_code = await asyncio.to_thread(
+        core.transcribe_audio, audio_data, source_language, whisper_model
     )
     
     if not transcription:
-        return "No speech detected", "", None
+        yield "No speech detected", "", None
+        return
     
     # Determine actual source language name for the prompt
     if source_language == "Auto-Detect":
@@ -1612,9 +2478,9 @@ def process_audio(audio, source_language, target_language, ollama_model, voice):
     else:
         actual_source_lang_name = source_language
     
-    transcription_id = next_transcription_id()
-    schedule_translation_task(
-        transcription_id,
+    # No live transcription id: this result is awaited below, not shown by the live tick
+    translation_future = schedule_translation_task(
+        None,
         transcription,
         actual_source_lang_name,
         target_language,
@@ -1622,25 +2488,19 @@ def process_audio(audio, source_language, target_language, ollama_model, voice):
         voice,
         None
     )
+    yield transcription, "Translation pending", None
     
-    # Poll for the corresponding translation result before returning
+    # Await the translation future; TTS is already queued by its done-callback
     try:
-        deadline = time.time() + 5.0
-        while time.time() < deadline:
-            try:
-                tid, trans_text, translation = translation_results_queue.get(timeout=0.1)
-                translation_results_queue.task_done()
-                if tid == transcription_id and translation:
-                    return trans_text, translation, None
-                else:
-                    # Not ours; push back for continuous mode to pick up
-                    translation_results_queue.put((tid, trans_text, translation))
-            except queue.Empty:
-                continue
+        translation = await asyncio.wait_for(asyncio.wrap_future(translation_future), timeout=5.0)
+    except asyncio.TimeoutError:
+        return
     except Exception as e:
         core.log_message(f"Error waiting for translation result: {e}", "ERROR")
+        return
     
-    return transcription, "Translation pending", None
+    if translation:
+        yield transcription, translation, None
 
 
 def start_continuous_recording(source_language, target_language, ollama_model, voice, device_idx):
@@ -1656,6 +2516,8 @@ def start_continuous_recording(source_language, target_language, ollama_model, v
     recording_should_run = True
     recording_params = (source_language, target_language, ollama_model, voice, device_idx)
     stop_event.clear()
+    core.reset_detected_language()
+    refresh_timing_config()
     
     # Start recording thread
     recording_thread = threading.Thread(
@@ -1682,6 +2544,7 @@ def stop_continuous_recording(clear_intent=True):
     if clear_intent:
         recording_should_run = False
         recording_params = None
+        core.reset_detected_language()
     return "Recording stopped."
 
 
@@ -1690,6 +2553,8 @@ audio_buffer = CircularAudioBuffer(max_duration_seconds=20)  # Use circular buff
 silence_counter = 0.0
 is_speaking = False
 last_transcription = ""
+_last_tick_time = None
+MAX_TICK_DT = 1.0  # Seconds; upper bound on one tick's silence increment
 
 # --- Audio Level Monitoring State ---
 last_input_energy = 0.0
@@ -1742,40 +2607,190 @@ def monitor_audio_levels(input_gain, output_volume):
     
     return input_display, output_display, status
 
+# --- Voice Activity Pre-filter ---
+VAD_PREFILTER_THRESHOLD = 0.5
+_vad_available = True
+
+def window_has_speech(audio):
+    """Run Silero VAD (bundled with faster-whisper) over a window before Whisper.
+
+    Only windows in which VAD finds no speech at all are skipped; any error
+    fails open so audio is never dropped because the VAD is unavailable.
+    """
+    global _vad_available
+    if not _vad_available:
+        return True
+    try:
+        from faster_whisper.vad import VadOptions, get_speech_timestamps
+        timestamps = get_speech_timestamps(
+            np.ascontiguousarray(audio, dtype=np.float32),
+            VadOptions(threshold=VAD_PREFILTER_THRESHOLD),
+        )
+        return len(timestamps) > 0
+    except ImportError:
+        _vad_available = False
+        core.log_message("faster-whisper VAD not available; pre-filter disabled.", "WARNING")
+        return True
+    except Exception as e:
+        core.log_message(f"VAD pre-filter error: {e}", "WARNING")
+        return True
+
+# Per-tick speech gate: the same Silero model scores each drained chunk in
+# 512-sample frames. A few frames of the previous chunk are prepended so the
+# model isn't scoring the start of every tick from a cold state.
+VAD_FRAME_SAMPLES = 512
+VAD_CONTEXT_FRAMES = 4
+_chunk_vad_model = None
+_chunk_vad_available = True
+_chunk_vad_context = np.zeros(0, dtype=np.float32)
+
+def chunk_has_speech(audio):
+    """Silero VAD decision for one tick's audio; None when the model is unavailable."""
+    global _chunk_vad_model, _chunk_vad_available, _chunk_vad_context
+    if not _chunk_vad_available or not len(audio):
+        return None
+    try:
+        if _chunk_vad_model is None:
+            from faster_whisper.vad import get_vad_model
+            _chunk_vad_model = get_vad_model()
+        frames = np.concatenate((_chunk_vad_context, audio))
+        pad = (-len(frames)) % VAD_FRAME_SAMPLES
+        if pad:
+            # Pad at the front so the last frame ends on the newest sample
+            frames = np.concatenate((np.zeros(pad, dtype=np.float32), frames))
+        probs = np.asarray(_chunk_vad_model(frames)).reshape(-1)
+        _chunk_vad_context = frames[-VAD_FRAME_SAMPLES * VAD_CONTEXT_FRAMES:]
+        new_frames = -(-len(audio) // VAD_FRAME_SAMPLES)
+        return bool(probs[-new_frames:].max() > VAD_PREFILTER_THRESHOLD)
+    except Exception as e:
+        # Older faster-whisper releases expose a different model API
+        _chunk_vad_available = False
+        core.log_message(f"Silero chunk VAD unavailable ({e}); using the energy gate.", "WARNING")
+        return None
+
+def transcribe_window(audio, source_language, whisper_model):
+    """Transcribe a buffered window, skipping Whisper when VAD finds no speech."""
+    if not window_has_speech(audio):
+        core.log_message("VAD pre-filter: no speech in window, skipping transcription.", "DEBUG")
+        return None, None
+    return core.transcribe_audio(audio, source_language, whisper_model)
+
+# --- Transcription Pipeline ---
+# Whisper runs on a single background worker so the polling tick keeps
+# buffering audio and surfacing finished translations while a window decodes.
+# Capture/resampling (audio callback), transcription (this worker) and
+# translation/TTS (their own workers) then overlap across consecutive windows.
+transcription_executor = None
+pending_transcription = None  # (future, kind, audio_buffer.total_written at submit)
+# Max-size windows cut while the worker is busy wait here and are decoded
+# together (one batched pass on GPU) instead of being overwritten in the buffer
+transcription_backlog = []
+MAX_TRANSCRIPTION_BACKLOG = WHISPER_GPU_BATCH_SIZE
+
+def get_transcription_executor():
+    """Lazy-init the single-thread pool that runs Whisper for live audio."""
+    global transcription_executor
+    if transcription_executor is None:
+        transcription_executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="transcription-worker"
+        )
+    return transcription_executor
+
+_HUSH_PAD = np.zeros(int(core.TARGET_RATE * HUSH_PAD_S), dtype=np.float32)
+
+def submit_transcription(kind, source_language, whisper_model):
+    """Snapshot the buffered window and transcribe it in the background."""
+    global pending_transcription
+    if kind == "end":
+        # The concatenation is the snapshot; the pad stands in for the rest of the pause
+        window = np.concatenate((audio_buffer.get_audio(), _HUSH_PAD))
+    else:
+        window = audio_buffer.snapshot()  # The buffer keeps filling meanwhile
+    future = get_transcription_executor().submit(
+        transcribe_window, window, source_language, whisper_model
+    )
+    pending_transcription = (future, kind, audio_buffer.total_written)
+
+def queue_transcription_window():
+    """Snapshot the buffered window into the backlog while the worker is busy."""
+    transcription_backlog.append(audio_buffer.snapshot())
+    if len(transcription_backlog) > MAX_TRANSCRIPTION_BACKLOG:
+        transcription_backlog.pop(0)
+        core.log_message("Transcription backlog full; dropped the oldest window.", "WARNING")
+
+def transcribe_backlog(windows, source_language, whisper_model):
+    """Worker job: VAD-filter the queued windows and transcribe the rest as one batch."""
+    results = [(None, None)] * len(windows)
+    speech = [i for i, window in enumerate(windows) if window_has_speech(window)]
+    if speech:
+        batch = core.transcribe_audio_batch([windows[i] for i in speech], source_language, whisper_model)
+        for i, result in zip(speech, batch):
+            results[i] = result
+    return results
+
+def submit_transcription_backlog(source_language, whisper_model):
+    """Send every queued window to the worker as a single batch job."""
+    global pending_transcription, transcription_backlog
+    windows, transcription_backlog = transcription_backlog, []
+    future = get_transcription_executor().submit(
+        transcribe_backlog, windows, source_language, whisper_model
+    )
+    pending_transcription = (future, "batch", audio_buffer.total_written)
+
+def trim_transcribed_audio(written_at_submit, overlap_size):
+    """Drop a transcribed window, keeping overlap_size samples of it plus any audio added since submit."""
+    new_samples = max(0, audio_buffer.total_written - written_at_submit)
+    audio_buffer.keep_tail(new_samples + overlap_size)
+
+def dispatch_transcription(transcription, detected_code, source_language, target_language,
+                           ollama_model, voice, output_device_idx):
+    """Hand an accepted transcription to the translation/TTS workers."""
+    # Determine actual source language name for the prompt
+    if source_language == "Auto-Detect":
+        actual_source_lang_name = core.CODE_TO_LANGUAGE.get(detected_code, "English")
+    else:
+        actual_source_lang_name = source_language
+    schedule_translation_task(
+        next_transcription_id(),
+        transcription,
+        actual_source_lang_name,
+        target_language,
+        ollama_model,
+        voice,
+        output_device_idx
+    )
+
+
 def check_audio_queue(source_language, target_language, ollama_model, voice, output_device=None):
     """Check for new audio in the queue and process it using sophisticated buffer management."""
-    core.log_message(f"Checking audio queue with params: {source_language}, {target_language}, {ollama_model}, {voice}, {output_device}")
+    if core.LOG_DEBUG:
+        core.log_message(f"Checking audio queue with params: {source_language}, {target_language}, {ollama_model}, {voice}, {output_device}", "DEBUG")
     
-    global audio_buffer, silence_counter, is_speaking, last_transcription, whisper_model, last_displayed_transcription_id
+    global audio_buffer, silence_counter, is_speaking, last_transcription, last_displayed_transcription_id
+    global last_completed_transcription_id
+    global pending_transcription, _last_tick_time
+    
+    # Silence is timed on the monotonic clock, so slow or irregular ticks don't
+    # skew it; capped so a long pause between sessions can't trigger a flush
+    now = time.monotonic()
+    tick_dt = min(now - _last_tick_time, MAX_TICK_DT) if _last_tick_time is not None else 0.0
+    _last_tick_time = now
     
     # First, surface any completed translations so UI displays them ASAP
     latest_result = None
-    while True:
-        try:
-            result = translation_results_queue.get_nowait()
-            translation_results_queue.task_done()
-            transcription_id, transcription, translation = result
-            if translation:
-                latest_result = result
-        except queue.Empty:
-            break
-        except Exception as e:
-            core.log_message(f"Error draining translation results queue: {e}", "ERROR")
-            break
+    for result in drain_queue(translation_results_queue):
+        last_completed_transcription_id = max(last_completed_transcription_id, result[0])
+        if result[2]:
+            latest_result = result
     if latest_result:
         transcription_id, transcription, translation = latest_result
         if transcription_id > last_displayed_transcription_id:
             last_displayed_transcription_id = transcription_id
             return transcription, translation, None
     
-    # Timing parameters driven by runtime settings
-    MIN_SILENCE_DURATION = float(RUNTIME_PARAMS.get("min_silence_s", 0.6))
-    MIN_SPEECH_DURATION = float(RUNTIME_PARAMS.get("min_speech_s", 1.0))
-    MAX_SPEECH_DURATION = float(RUNTIME_PARAMS.get("max_speech_s", 10.0))
-    BUFFER_OVERLAP = float(RUNTIME_PARAMS.get("overlap_s", 0.5))
-    MIN_SPEECH_SIZE = int(core.TARGET_RATE * MIN_SPEECH_DURATION)
-    MAX_SPEECH_SIZE = int(core.TARGET_RATE * MAX_SPEECH_DURATION)
-    OVERLAP_SIZE = int(core.TARGET_RATE * BUFFER_OVERLAP)
+    # Timing parameters driven by runtime settings (precomputed snapshot)
+    MIN_SILENCE_DURATION, END_SILENCE_DURATION, MIN_SPEECH_SIZE, MAX_SPEECH_SIZE, OVERLAP_SIZE = timing_config
     
     # Get output device index if provided
     output_device_idx = None
@@ -1789,144 +2804,112 @@ def check_audio_queue(source_language, target_language, ollama_model, voice, out
                 output_device_idx = idx
                 break
     
-    # Use singleton Whisper model
-    whisper_model = get_whisper_model()
+    # Use singleton Whisper model; skip this tick while a reload holds the loader
+    whisper_model = get_whisper_model(blocking=False)
+    if whisper_model is None:
+        return None, None, None
     
     # Ensure TTS worker is running
     start_tts_worker()
     
-    # Check if there are new audio chunks in the queue
-    if audio_queue.empty():
-        # No new audio, check if we should process the buffer due to silence timeout
-        if not is_speaking and audio_buffer.data_size > MIN_SPEECH_SIZE and silence_counter > MIN_SILENCE_DURATION:
-            core.log_message("Processing due to silence timeout.", "DEBUG")
-            buffer_audio = audio_buffer.get_audio()
-            transcription, detected_code = core.transcribe_audio(
-                buffer_audio, source_language, whisper_model
-            )
+    # Pick up a window the transcription worker has finished
+    if pending_transcription is not None and pending_transcription[0].done():
+        future, kind, written_at_submit = pending_transcription
+        pending_transcription = None
+        try:
+            result = future.result()
+        except Exception as e:
+            core.log_message(f"Transcription worker error: {e}", "ERROR")
+            result = [] if kind == "batch" else (None, None)
+        
+        if kind == "batch":
+            # Backlogged max-size windows; their audio was trimmed when queued
+            displayed = None
+            for transcription, detected_code in result:
+                if not transcription or transcription == last_transcription:
+                    continue
+                dispatch_transcription(transcription, detected_code, source_language,
+                                       target_language, ollama_model, voice, output_device_idx)
+                last_transcription = displayed = transcription
+            if transcription_backlog:
+                submit_transcription_backlog(source_language, whisper_model)
+            if displayed:
+                return displayed, None, None
+            result = (None, None)
+        transcription, detected_code = result
+        
+        accepted = bool(transcription) and transcription != last_transcription
+        if kind == "end":
+            accepted = accepted and core.is_complete_sentence(transcription)
+        
+        if accepted:
+            dispatch_transcription(transcription, detected_code, source_language,
+                                   target_language, ollama_model, voice, output_device_idx)
             
-            if transcription and transcription != last_transcription:
-                # Determine actual source language name for the prompt
-                if source_language == "Auto-Detect":
-                    actual_source_lang_name = core.CODE_TO_LANGUAGE.get(
-                        detected_code, "English"
-                    )
-                else:
-                    actual_source_lang_name = source_language
-                
-                transcription_id = next_transcription_id()
-                schedule_translation_task(
-                    transcription_id,
-                    transcription,
-                    actual_source_lang_name,
-                    target_language,
-                    ollama_model,
-                    voice,
-                    output_device_idx
-                )
-                
-                # Keep buffer continuity - only clear if buffer is too large
-                if audio_buffer.data_size > MAX_SPEECH_SIZE:
-                    overlap_audio = audio_buffer.get_overlap(BUFFER_OVERLAP)
-                    audio_buffer.clear()
-                    if len(overlap_audio) > 0:
-                        audio_buffer.add_audio(overlap_audio)
-                
-                # Reset speaking state but maintain buffer for continuity
+            if kind == "end":
+                # Keep a portion of the buffer for overlap to prevent word loss
+                trim_transcribed_audio(written_at_submit, OVERLAP_SIZE)
                 is_speaking = False
                 silence_counter = 0.0
+            else:
+                if kind == "silence":
+                    # Keep buffer continuity - only trim if buffer is too large
+                    if audio_buffer.data_size > MAX_SPEECH_SIZE:
+                        trim_transcribed_audio(written_at_submit, OVERLAP_SIZE)
+                    # Reset speaking state but maintain buffer for continuity
+                    is_speaking = False
+                    silence_counter = 0.0
                 last_transcription = transcription
-                
                 return transcription, None, None
-            
+        elif kind == "silence" and audio_buffer.data_size > MAX_SPEECH_SIZE:
             # Only reset buffer if it's getting too large, otherwise keep for continuity
-            if audio_buffer.data_size > MAX_SPEECH_SIZE:
-                audio_buffer.clear()
-                is_speaking = False
-                silence_counter = 0.0
+            trim_transcribed_audio(written_at_submit, 0)
+            is_speaking = False
+            silence_counter = 0.0
+    
+    # Windows queued while the worker was busy go ahead of anything cut this tick
+    if pending_transcription is None and transcription_backlog:
+        submit_transcription_backlog(source_language, whisper_model)
+    
+    # Drain every pending block from the audio ring in one pass and resample
+    # the whole batch at once (one filter call per tick, not per block)
+    audio_chunk = audio_queue.drain()
+    resampler = audio_queue.resampler
+    if resampler is not None and len(audio_chunk):
+        audio_chunk = resampler.process(audio_chunk)
+    
+    if not len(audio_chunk):
+        # No new audio, check if we should process the buffer due to silence timeout
+        if not is_speaking and audio_buffer.data_size > MIN_SPEECH_SIZE and silence_counter > MIN_SILENCE_DURATION:
+            if pending_transcription is None:
+                core.log_message("Processing due to silence timeout.", "DEBUG")
+                submit_transcription("silence", source_language, whisper_model)
         elif not is_speaking:
             # Increment silence counter if not speaking
-            silence_counter += 0.05  # Assuming check interval is ~50ms
+            silence_counter += tick_dt
         
         return None, None, None
     
-    # Collect audio chunks from the queue
-    chunks = []
-    try:
-        while True:
-            chunk = audio_queue.get_nowait()
-            chunks.append(chunk)
-            audio_queue.task_done()
-    except queue.Empty:
-        pass
-    
-    if not chunks:
-        return None, None, None
-    
-    # Prepare and resample chunks to TARGET_RATE if needed, then combine
-    # OPTIMIZATION: Group chunks by sample rate to batch resample (reduces CPU overhead)
-    chunks_by_sr = {}
-    for ch in chunks:
-        try:
-            if isinstance(ch, tuple) and len(ch) == 2:
-                data, sr = ch
-            else:
-                data, sr = ch, core.TARGET_RATE
-            
-            sr = int(sr)
-            if sr not in chunks_by_sr:
-                chunks_by_sr[sr] = []
-            
-            # Just collect raw numpy arrays first
-            chunks_by_sr[sr].append(np.asarray(data, dtype=np.float32).flatten())
-        except Exception as ce:
-            core.log_message(f"Error preparing audio chunk: {ce}", "ERROR")
+    # audio_chunk is at TARGET_RATE from here on
 
-    resampled_parts = []
-    for sr, data_list in chunks_by_sr.items():
-        if not data_list:
-            continue
-        
-        # Concatenate all raw audio for this sample rate first
-        raw_combined = np.concatenate(data_list)
-        
-        if sr != core.TARGET_RATE:
-            try:
-                # Resample the big chunk once (Much faster than resampling many tiny chunks)
-                processed = efficient_resample(raw_combined, sr, core.TARGET_RATE)
-                resampled_parts.append(processed)
-            except Exception as re:
-                core.log_message(f"Batch resample {sr}->{core.TARGET_RATE} failed: {re}", "WARNING")
-                continue
-        else:
-            resampled_parts.append(raw_combined)
-
-    if not resampled_parts:
-        return None, None, None
-        
-    # Final combine of all parts (usually just one part)
-    audio_chunk = np.concatenate(resampled_parts).flatten().astype(np.float32)
+    # Input gain and energy threshold are cached until preferences change
+    min_energy, input_gain = get_live_audio_prefs()
 
     # Apply input gain (software volume)
-    if isinstance(user_preferences, dict):
-        input_gain = float(user_preferences.get("input_gain", 1.0))
-        if input_gain != 1.0:
-            audio_chunk = audio_chunk * input_gain
-
-    actual_duration = len(audio_chunk) / core.TARGET_RATE
-    
-    # Check if this is speech using configured energy threshold
-    min_energy = get_pref_value(
-        "speech_energy_threshold",
-        0.0008,
-        min_value=0.0001,
-        max_value=0.01,
-        cast_type=float
-    )
-    if core.is_speech(audio_chunk, min_threshold=min_energy):
+    if input_gain != 1.0:
+        audio_chunk *= np.float32(input_gain)  # In place on the drained view
+
+    # One energy pass feeds both the speech gate and the input meter
+    chunk_energy = core.audio_energy(audio_chunk)
+    # The energy threshold always applies; Silero VAD, when available, must agree too
+    chunk_speech = chunk_energy > min_energy
+    vad_speech = chunk_has_speech(audio_chunk)  # Called every tick to keep its context current
+    if vad_speech is not None:
+        chunk_speech = chunk_speech and vad_speech
+    if chunk_speech and chunk_energy < core.SPEECH_MAX_ENERGY:
         # Track input energy for audio meter
         global last_input_energy
-        last_input_energy = float(np.abs(audio_chunk).mean())
+        last_input_energy = chunk_energy
         
         if not is_speaking:
             core.log_message("Speech detected...", "DEBUG")
@@ -1938,96 +2921,155 @@ def check_audio_queue(source_language, target_language, ollama_model, voice, out
         # Check if we've reached max buffer size
         if audio_buffer.data_size >= MAX_SPEECH_SIZE:
             core.log_message("Max buffer size reached, processing...", "DEBUG")
-            buffer_audio = audio_buffer.get_audio()
-            transcription, detected_code = core.transcribe_audio(
-                buffer_audio, source_language, whisper_model
-            )
-            
-            if transcription and transcription != last_transcription:
-                # Determine actual source language name for the prompt
-                if source_language == "Auto-Detect":
-                    actual_source_lang_name = core.CODE_TO_LANGUAGE.get(
-                        detected_code, "English"
-                    )
-                else:
-                    actual_source_lang_name = source_language
-                
-                transcription_id = next_transcription_id()
-                schedule_translation_task(
-                    transcription_id,
-                    transcription,
-                    actual_source_lang_name,
-                    target_language,
-                    ollama_model,
-                    voice,
-                    output_device_idx
-                )
-                
-                # Keep a portion of the buffer for overlap to prevent word loss
-                overlap_audio = audio_buffer.get_overlap(BUFFER_OVERLAP)
-                audio_buffer.clear()
-                if len(overlap_audio) > 0:
-                    audio_buffer.add_audio(overlap_audio)
-                
-                last_transcription = transcription
-                
-                return transcription, None, None
+            if pending_transcription is None:
+                submit_transcription("max", source_language, whisper_model)
+            else:
+                queue_transcription_window()
             
             # Keep a portion of the buffer for overlap to prevent word loss
-            overlap_audio = audio_buffer.get_overlap(BUFFER_OVERLAP)
-            audio_buffer.clear()
-            if len(overlap_audio) > 0:
-                audio_buffer.add_audio(overlap_audio)
+            audio_buffer.keep_tail(OVERLAP_SIZE)
     
     elif is_speaking:
         # This chunk is silence but we were speaking before
-        silence_counter += actual_duration
+        silence_counter += tick_dt
         audio_buffer.add_audio(audio_chunk)
         
         # Check if we've had enough silence after speech
-        if silence_counter >= MIN_SILENCE_DURATION and audio_buffer.data_size >= MIN_SPEECH_SIZE:
+        if (silence_counter >= END_SILENCE_DURATION and audio_buffer.data_size >= MIN_SPEECH_SIZE
+                and pending_transcription is None):
             core.log_message("End of speech detected, processing...", "DEBUG")
-            buffer_audio = audio_buffer.get_audio()
-            transcription, detected_code = core.transcribe_audio(
-                buffer_audio, source_language, whisper_model
-            )
-            
-            if transcription and core.is_complete_sentence(transcription) and transcription != last_transcription:
-                # Determine actual source language name for the prompt
-                if source_language == "Auto-Detect":
-                    actual_source_lang_name = core.CODE_TO_LANGUAGE.get(
-                        detected_code, "English"
-                    )
-                else:
-                    actual_source_lang_name = source_language
-                
-                transcription_id = next_transcription_id()
-                schedule_translation_task(
-                    transcription_id,
-                    transcription,
-                    actual_source_lang_name,
-                    target_language,
-                    ollama_model,
-                    voice,
-                    output_device_idx
-                )
-                # Keep a portion of the buffer for overlap to prevent word loss
-                overlap_audio = audio_buffer.get_overlap(BUFFER_OVERLAP)
-                audio_buffer.clear()
-                if len(overlap_audio) > 0:
-                    audio_buffer.add_audio(overlap_audio)
-                
-                is_speaking = False
-                silence_counter = 0.0
+            submit_transcription("end", source_language, whisper_model)
 
     else:
         # Not speech and not speaking, just increment silence counter
-        silence_counter += actual_duration
+        silence_counter += tick_dt
     
     return None, None, None
 
 
+# --- Adaptive UI Polling ---
+# The continuous timer polls fast while speech is being handled and backs off
+# once nothing has happened for a while; audio keeps queuing in the ring meanwhile.
+POLL_INTERVAL_ACTIVE = 0.2
+POLL_INTERVAL_IDLE = 1.0
+IDLE_TICKS_BEFORE_BACKOFF = 10
+_poll_state = {"interval": POLL_INTERVAL_ACTIVE, "idle_ticks": 0}
+
+def pipeline_is_idle():
+    """True when no speech, transcription or translation is in flight."""
+    return (not is_speaking and pending_transcription is None and not transcription_backlog
+            and last_completed_transcription_id >= transcription_sequence)
+
+def reset_poll_interval():
+    """Return to the fast cadence, e.g. when recording starts."""
+    _poll_state["interval"] = POLL_INTERVAL_ACTIVE
+    _poll_state["idle_ticks"] = 0
+    return POLL_INTERVAL_ACTIVE
+
+def next_poll_update(had_output):
+    """Timer update for the next tick; only changes the interval when the cadence switches."""
+    if had_output or not pipeline_is_idle():
+        _poll_state["idle_ticks"] = 0
+        interval = POLL_INTERVAL_ACTIVE
+    else:
+        _poll_state["idle_ticks"] += 1
+        interval = POLL_INTERVAL_IDLE if _poll_state["idle_ticks"] >= IDLE_TICKS_BEFORE_BACKOFF else _poll_state["interval"]
+    if interval == _poll_state["interval"]:
+        return gr.update()
+    _poll_state["interval"] = interval
+    core.log_message(f"UI poll interval set to {interval}s", "DEBUG")
+    return gr.update(value=interval)
+
+
+# --- TTS Voice Labels ---
+# Built once at import; the UI only looks them up when listing voices
+KOKORO_VOICE_COUNTRIES = MappingProxyType({
+    # United States
+    "af_heart": "United States", "af_alloy": "United States", "af_aoede": "United States",
+    "af_bella": "United States", "af_jessica": "United States", "af_kore": "United States",
+    "af_nicole": "United States", "af_nova": "United States", "af_river": "United States",
+    "af_sarah": "United States", "af_sky": "United States", "am_adam": "United States",
+    "am_echo": "United States", "am_eric": "United States", "am_fenrir": "United States",
+    "am_liam": "United States", "am_michael": "United States", "am_onyx": "United States",
+    "am_puck": "United States", "am_santa": "United States",
+    # United Kingdom
+    "bf_alice": "United Kingdom", "bf_emma": "United Kingdom", "bf_isabella": "United Kingdom",
+    "bf_lily": "United Kingdom", "bm_daniel": "United Kingdom", "bm_fable": "United Kingdom",
+    "bm_george": "United Kingdom", "bm_lewis": "United Kingdom",
+    # Japan
+    "jf_alpha": "Japan", "jf_gongitsune": "Japan", "jf_nezumi": "Japan", "jf_tebukuro": "Japan",
+    "jm_kumo": "Japan",
+    # China
+    "zf_xiaobei": "China", "zf_xiaoni": "China", "zf_xiaoxiao": "China", "zf_xiaoyi": "China",
+    "zm_yunjian": "China", "zm_yunxi": "China", "zm_yunxia": "China", "zm_yunyang": "China",
+    # Spain
+    "ef_dora": "Spain", "em_alex": "Spain", "em_santa": "Spain",
+    # France
+    "ff_siwis": "France",
+    # India
+    "hf_alpha": "India", "hf_beta": "India", "hm_omega": "India", "hm_psi": "India",
+    # Italy
+    "if_sara": "Italy", "im_nicola": "Italy",
+    # Brazil
+    "pf_dora": "Brazil", "pm_alex": "Brazil", "pm_santa": "Brazil",
+})
+GOOGLE_LANGUAGE_NAMES = MappingProxyType({
+    "en": "English", "es": "Spanish", "fr": "French", "de": "German", "it": "Italian",
+    "pt": "Portuguese", "ja": "Japanese", "ko": "Korean", "cmn": "Chinese (Mandarin)",
+    "ru": "Russian", "hi": "Hindi", "te": "Telugu", "ta": "Tamil", "bn": "Bengali",
+    "gu": "Gujarati", "kn": "Kannada", "ml": "Malayalam", "mr": "Marathi",
+    "ar": "Arabic", "nl": "Dutch", "pl": "Polish", "tr": "Turkish", "sv": "Swedish",
+    "nb": "Norwegian", "da": "Danish", "fi": "Finnish", "el": "Greek", "cs": "Czech",
+    "sk": "Slovak", "uk": "Ukrainian", "vi": "Vietnamese", "id": "Indonesian",
+    "th": "Thai", "fil": "Filipino", "af": "Afrikaans"
+})
+GOOGLE_COUNTRY_LABELS = MappingProxyType({
+    "US": "US", "GB": "UK", "AU": "AU", "IN": "IN", "ES": "ES", "FR": "FR", "CA": "CA",
+    "DE": "DE", "IT": "IT", "BR": "BR", "PT": "PT", "JP": "JP", "KR": "KR",
+    "CN": "CN", "TW": "TW", "RU": "RU", "XA": "XA", "NL": "NL", "PL": "PL",
+    "TR": "TR", "SE": "SE", "NO": "NO", "DK": "DK", "FI": "FI", "GR": "GR",
+    "CZ": "CZ", "SK": "SK", "UA": "UA", "VN": "VN", "ID": "ID", "TH": "TH", "PH": "PH",
+    "ZA": "ZA"
+})
+
+def _google_voice_label(v):
+    """Readable label for a Google voice id, e.g. "English (US) - Neural2-A"."""
+    parts = v.split("-")
+    lang_code = parts[0] if len(parts) > 0 else ""
+    country_code = parts[1] if len(parts) > 1 else ""
+    voice_type = parts[2] if len(parts) > 2 else ""
+    voice_id = parts[3] if len(parts) > 3 else ""
+
+    language = GOOGLE_LANGUAGE_NAMES.get(lang_code, lang_code.upper())
+    country = GOOGLE_COUNTRY_LABELS.get(country_code, country_code)
+    return f"{language} ({country}) - {voice_type}-{voice_id}" if voice_type else f"{language} ({country})"
+
+_VOICE_CHOICES = {
+    # Google voices sorted alphabetically by label
+    "Google": tuple(sorted(((_google_voice_label(v), v) for v in core.GOOGLE_VOICES), key=lambda x: x[0])),
+    "Kokoro": tuple((f"{v} — {KOKORO_VOICE_COUNTRIES.get(v, 'Unknown')}", v) for v in core.KOKORO_VOICES),
+}
+
+def get_voice_choices(provider):
+    """Labeled (label, value) voice choices for a TTS provider, with "Text Only" first."""
+    return [("Text Only — no TTS", "none")] + list(_VOICE_CHOICES["Google" if provider == "Google" else "Kokoro"])
+
 # --- Gradio UI Setup ---
+STATUS_HTML_TEMPLATE = '<div class="status-wrap"><span class="status-dot {dot}"></span><span class="status-text">{text}</span></div>'
+STATUS_HTML_STARTING = STATUS_HTML_TEMPLATE.format(dot="bad", text="Starting…")
+STATUS_HTML_READY = STATUS_HTML_TEMPLATE.format(dot="ok", text="Ready for transcription")
+STATUS_HTML_TRANSCRIBING = STATUS_HTML_TEMPLATE.format(dot="warn", text="Transcribing…")
+_not_ready_status = ((), STATUS_HTML_TEMPLATE.format(dot="bad", text="Not ready"))
+
+def not_ready_status_html(reasons):
+    """Render the red status light, reusing the last HTML while the reasons are unchanged."""
+    global _not_ready_status
+    reasons = tuple(r for r in reasons if r)
+    if reasons != _not_ready_status[0]:
+        text = "Not ready: " + "; ".join(reasons) if reasons else "Not ready"
+        _not_ready_status = (reasons, STATUS_HTML_TEMPLATE.format(dot="bad", text=text))
+    return _not_ready_status[1]
+
 def create_ui():
     """Create the Gradio web interface."""
     # Get available audio devices
@@ -2250,7 +3292,7 @@ def create_ui():
             """
         )
         status_indicator = gr.HTML(
-            value='<div class="status-wrap"><span class="status-dot bad"></span><span class="status-text">Starting…</span></div>',
+            value=STATUS_HTML_STARTING,
             label="Server Status"
         )
         status_timer = gr.Timer(1.0, active=True)
@@ -2272,30 +3314,25 @@ def create_ui():
             ready = bool(w_loaded and tts_alive and status.get("services_ok", False) and rec_alive)
             transcribing = bool(status.get("transcribing", False))
 
+            # The ready states are prebuilt; only the "Not ready" text varies
             if transcribing and ready:
-                dot_class = "warn"
-                text = "Transcribing…"
-            elif ready:
-                dot_class = "ok"
-                text = "Ready for transcription"
-            else:
-                dot_class = "bad"
-                # Build a short reason
-                reasons = []
-                if not w_loaded:
-                    reasons.append("Whisper not loaded")
-                if not tts_alive:
-                    reasons.append("TTS worker not running")
-                if not status.get("services_ok", False):
-                    detail = status.get("detail", "Services not ready")
-                    reasons.append(detail)
-                if not rec_alive:
-                    reasons.append("Recording stopped")
+                return STATUS_HTML_TRANSCRIBING
+            if ready:
+                return STATUS_HTML_READY
+
+            # Build a short reason
+            reasons = []
+            if not w_loaded:
+                reasons.append("Whisper not loaded")
+            if not tts_alive:
+                reasons.append("TTS worker not running")
+            if not status.get("services_ok", False):
+                detail = status.get("detail", "Services not ready")
+                reasons.append(detail)
+            if not rec_alive:
                 # Recording thread being off is not necessarily an error
-                text = "Not ready: " + "; ".join([r for r in reasons if r]) if reasons else "Not ready"
-
-            html = f'<div class="status-wrap"><span class="status-dot {dot_class}"></span><span class="status-text">{text}</span></div>'
-            return html
+                reasons.append("Recording stopped")
+            return not_ready_status_html(reasons)
 
         status_timer.tick(fn=ui_status, outputs=status_indicator, show_progress=False)
         
@@ -2338,17 +3375,15 @@ def create_ui():
                             interactive=True
                         )
 
-                        # Lazy load models if not yet loaded
-                        global available_ollama_models
-                        if not available_ollama_models:
-                            available_ollama_models = core.fetch_available_models(current_settings=current_settings)
+                        # Lazy load models (cached per provider and server)
+                        available_models = get_available_models(current_settings)
 
                         default_model = user_preferences.get("ollama_model", "")
-                        if not default_model and available_ollama_models:
-                            default_model = available_ollama_models[0]
+                        if not default_model and available_models:
+                            default_model = available_models[0]
                             
                         cont_ollama_model = gr.Dropdown(
-                            choices=available_ollama_models,
+                            choices=available_models,
                             value=default_model,
                             label="AI Translation Model",
                             allow_custom_value=True
@@ -2367,7 +3402,7 @@ def create_ui():
                                 current_settings = file_settings.copy()
                             else:
                                 # Merge: keep file's API keys, update provider
-                                for key in ['openai_api_key', 'groq_api_key', 'grok_api_key', 'mistral_api_key', 'custom_openai_url', 'custom_openai_key']:
+                                for key in TRANSLATION_CREDENTIAL_KEYS:
                                     if key in file_settings:
                                         current_settings[key] = file_settings[key]
                             
@@ -2376,7 +3411,7 @@ def create_ui():
                             user_preferences["translation_provider"] = provider
                             
                             # Fetch new models with the merged settings
-                            new_models = core.fetch_available_models(current_settings=current_settings)
+                            new_models = get_available_models(current_settings)
                             new_val = new_models[0] if new_models else ""
                             core.log_message(f"Provider changed to {provider}, fetched {len(new_models)} models")
                             return gr.update(choices=new_models, value=new_val)
@@ -2396,82 +3431,6 @@ def create_ui():
                             info="Select Kokoro (Local) or Google (Cloud)"
                         )
                         
-                        # Build labeled choices for voices without changing their underlying values
-                        voice_country_map = {
-                            # United States
-                            "af_heart": "United States", "af_alloy": "United States", "af_aoede": "United States",
-                            "af_bella": "United States", "af_jessica": "United States", "af_kore": "United States",
-                            "af_nicole": "United States", "af_nova": "United States", "af_river": "United States",
-                            "af_sarah": "United States", "af_sky": "United States", "am_adam": "United States",
-                            "am_echo": "United States", "am_eric": "United States", "am_fenrir": "United States",
-                            "am_liam": "United States", "am_michael": "United States", "am_onyx": "United States",
-                            "am_puck": "United States", "am_santa": "United States",
-                            # United Kingdom
-                            "bf_alice": "United Kingdom", "bf_emma": "United Kingdom", "bf_isabella": "United Kingdom",
-                            "bf_lily": "United Kingdom", "bm_daniel": "United Kingdom", "bm_fable": "United Kingdom",
-                            "bm_george": "United Kingdom", "bm_lewis": "United Kingdom",
-                            # Japan
-                            "jf_alpha": "Japan", "jf_gongitsune": "Japan", "jf_nezumi": "Japan", "jf_tebukuro": "Japan",
-                            "jm_kumo": "Japan",
-                            # China
-                            "zf_xiaobei": "China", "zf_xiaoni": "China", "zf_xiaoxiao": "China", "zf_xiaoyi": "China",
-                            "zm_yunjian": "China", "zm_yunxi": "China", "zm_yunxia": "China", "zm_yunyang": "China",
-                            # Spain
-                            "ef_dora": "Spain", "em_alex": "Spain", "em_santa": "Spain",
-                            # France
-                            "ff_siwis": "France",
-                            # India
-                            "hf_alpha": "India", "hf_beta": "India", "hm_omega": "India", "hm_psi": "India",
-                            # Italy
-                            "if_sara": "Italy", "im_nicola": "Italy",
-                            # Brazil
-                            "pf_dora": "Brazil", "pm_alex": "Brazil", "pm_santa": "Brazil",
-                        }
-                        # Function to build voice list based on provider
-                        def get_voice_choices(provider):
-                            choices = [("Text Only — no TTS", "none")]
-                            if provider == "Google":
-                                # Language and country mapping for Google voices
-                                lang_map = {
-                                    "en": "English", "es": "Spanish", "fr": "French", "de": "German", "it": "Italian",
-                                    "pt": "Portuguese", "ja": "Japanese", "ko": "Korean", "cmn": "Chinese (Mandarin)",
-                                    "ru": "Russian", "hi": "Hindi", "te": "Telugu", "ta": "Tamil", "bn": "Bengali",
-                                    "gu": "Gujarati", "kn": "Kannada", "ml": "Malayalam", "mr": "Marathi",
-                                    "ar": "Arabic", "nl": "Dutch", "pl": "Polish", "tr": "Turkish", "sv": "Swedish",
-                                    "nb": "Norwegian", "da": "Danish", "fi": "Finnish", "el": "Greek", "cs": "Czech",
-                                    "sk": "Slovak", "uk": "Ukrainian", "vi": "Vietnamese", "id": "Indonesian",
-                                    "th": "Thai", "fil": "Filipino", "af": "Afrikaans"
-                                }
-                                country_map = {
-                                    "US": "US", "GB": "UK", "AU": "AU", "IN": "IN", "ES": "ES", "FR": "FR", "CA": "CA",
-                                    "DE": "DE", "IT": "IT", "BR": "BR", "PT": "PT", "JP": "JP", "KR": "KR",
-                                    "CN": "CN", "TW": "TW", "RU": "RU", "XA": "XA", "NL": "NL", "PL": "PL",
-                                    "TR": "TR", "SE": "SE", "NO": "NO", "DK": "DK", "FI": "FI", "GR": "GR",
-                                    "CZ": "CZ", "SK": "SK", "UA": "UA", "VN": "VN", "ID": "ID", "TH": "TH", "PH": "PH",
-                                    "ZA": "ZA"
-                                }
-                                
-                                for v in core.GOOGLE_VOICES:
-                                    parts = v.split("-")
-                                    lang_code = parts[0] if len(parts) > 0 else ""
-                                    country_code = parts[1] if len(parts) > 1 else ""
-                                    voice_type = parts[2] if len(parts) > 2 else ""
-                                    voice_id = parts[3] if len(parts) > 3 else ""
-                                    
-                                    language = lang_map.get(lang_code, lang_code.upper())
-                                    country = country_map.get(country_code, country_code)
-                                    
-                                    # Create readable label: "English (US) - Neural2-A"
-                                    label = f"{language} ({country}) - {voice_type}-{voice_id}" if voice_type else f"{language} ({country})"
-                                    choices.append((label, v))
-                                
-                                # Sort Google voices alphabetically by label (skip "Text Only" at index 0)
-                                choices[1:] = sorted(choices[1:], key=lambda x: x[0])
-                            else:  # Kokoro
-                                for v in core.KOKORO_VOICES:
-                                    choices.append((f"{v} — {voice_country_map.get(v, 'Unknown')}", v))
-                            return choices
-                        
                         # Build initial voice list
                         labeled_voice_choices = get_voice_choices(default_provider)
                         voice_choice_values = [value for _, value in labeled_voice_choices]
@@ -2496,12 +3455,11 @@ def create_ui():
                             # Auto-save tts_provider to settings.json for persistence
                             try:
                                 if os.path.exists(core.SETTINGS_FILE):
-                                    with open(core.SETTINGS_FILE, "r") as f:
+                                    with open(core.SETTINGS_FILE, "r", encoding="utf-8") as f:
                                         settings = json.load(f)
                                     settings["tts_provider"] = provider
-                                    with open(core.SETTINGS_FILE, "w") as f:
-                                        json.dump(settings, f, indent=4)
-                                    core.log_message(f"Auto-saved TTS provider: {provider}")
+                                    if core.save_settings(settings):
+                                        core.log_message(f"Auto-saved TTS provider: {provider}")
                             except Exception as e:
                                 core.log_message(f"Failed to auto-save TTS provider: {e}", "ERROR")
                             
@@ -2571,10 +3529,10 @@ def create_ui():
                         
                         # Save preferences on slider change
                         def save_audio_preferences(input_gain, output_volume):
-                            global user_preferences
-                            user_preferences["input_gain"] = float(input_gain)
-                            user_preferences["output_volume"] = float(output_volume)
-                            save_user_preferences(user_preferences)
+                            update_user_preferences({
+                                "input_gain": float(input_gain),
+                                "output_volume": float(output_volume),
+                            })
                         
                         input_gain_slider.change(
                             fn=save_audio_preferences,
@@ -2620,8 +3578,7 @@ def create_ui():
                             # If arguments are provided (from Launch button), update preferences first
                             if args and len(args) == 16:
                                 font, font_size, font_color, bg_color, monitor_idx, manual_x, manual_y, width, height, pos_x, pos_y, always_on_top, history_size, hold_seconds, h_align, v_align = args
-                                global user_preferences
-                                user_preferences.update({
+                                update_user_preferences({
                                     "display_font_family": font,
                                     "display_font_size": int(font_size),
                                     "display_font_color": font_color,
@@ -2639,8 +3596,6 @@ def create_ui():
                                     "display_horizontal_align": h_align,
                                     "display_vertical_align": v_align,
                                 })
-                                # Optionally save to disk
-                                save_user_preferences(user_preferences)
 
                             config = get_translation_display_config()
                             # Note: launch() will resolve monitor coordinates including all_monitors for 'm' key cycling
@@ -2692,8 +3647,8 @@ def create_ui():
             # Function to save preferences when starting recording
             def start_and_save_prefs(source_lang, target_lang, trans_provider, model, tts_provider, voice_choice, input_device_name, output_device_name):
                 # Save preferences including device selections
-                global user_preferences, current_settings
-                user_preferences.update({
+                global current_settings
+                update_user_preferences({
                     "source_language": source_lang,
                     "target_language": target_lang,
                     "translation_provider": trans_provider,
@@ -2703,7 +3658,6 @@ def create_ui():
                     "input_device": input_device_name,
                     "output_device": output_device_name
                 })
-                save_user_preferences(user_preferences)
                 
                 # Reload settings from file to get API keys, then merge with UI selections
                 file_settings = core.load_settings()
@@ -2726,11 +3680,11 @@ def create_ui():
                 # Start recording with selected device
                 result = start_with_selected_device(source_lang, target_lang, model, voice_choice, input_device_name, output_device_name)
                 if not result.startswith("Error"):
-                    return [gr.Button(interactive=False), gr.Button(interactive=True), gr.update(active=True)]
+                    return [gr.Button(interactive=False), gr.Button(interactive=True), gr.update(active=True, value=reset_poll_interval())]
                 return [gr.Button(interactive=True), gr.Button(interactive=False), gr.update(active=False)]
             
             # Server-side polling via Gradio Timer (avoids relying on browser JS)
-            continuous_timer = gr.Timer(0.2, active=False)
+            continuous_timer = gr.Timer(POLL_INTERVAL_ACTIVE, active=False)
 
             start_btn.click(
                 fn=start_and_save_prefs,
@@ -2757,7 +3711,8 @@ def create_ui():
             # Function to update UI with new translations
             def continuous_update(source_lang, target_lang, model, voice_choice):
                 nonlocal last_valid_transcription, last_valid_translation
-                core.log_message(f"Continuous update called with: {source_lang}, {target_lang}, {model}, {voice_choice}")
+                if core.LOG_DEBUG:
+                    core.log_message(f"Continuous update called with: {source_lang}, {target_lang}, {model}, {voice_choice}", "DEBUG")
                 try:
                     transcription, translation, audio_file = check_audio_queue(
                         source_lang, target_lang, model, voice_choice, selected_output_device_name
@@ -2766,7 +3721,7 @@ def create_ui():
                     # Sticky UI logic to avoid clearing boxes on transient None/empty values
                     if transcription is None and (translation is None or translation == ""):
                         core.log_message("Sticky UI: no new transcription/translation; keeping last shown values", "DEBUG")
-                        return last_valid_transcription, last_valid_translation
+                        return last_valid_transcription, last_valid_translation, next_poll_update(False)
 
                     # Determine what to display and what to persist as last valid
                     out_transcription = last_valid_transcription
@@ -2790,27 +3745,24 @@ def create_ui():
 
                     # Log translation to file only when we have new non-empty values
                     if transcription:
-                        current_time = time.strftime("%Y-%m-%d %H:%M:%S")
-                        with open("translation_log.txt", "a", encoding="utf-8") as f:
-                            f.write(f"[{current_time}]\nSource: {transcription}\nTranslation: {translation if translation else out_translation}\n\n")
+                        log_translation(f"[{log_timestamp()}]\nSource: {transcription}\nTranslation: {translation if translation else out_translation}\n\n")
 
-                    core.log_message(
-                        f"Continuous update returning: {out_transcription[:30]}..., {out_translation[:30] if out_translation else None}",
-                        "DEBUG",
-                    )
-                    return out_transcription, out_translation
+                    if core.LOG_DEBUG:
+                        core.log_message(
+                            f"Continuous update returning: {out_transcription[:30]}..., {out_translation[:30] if out_translation else None}",
+                            "DEBUG",
+                        )
+                    return out_transcription, out_translation, next_poll_update(True)
                 except Exception as e:
                     core.log_message(f"Error in continuous update: {e}", "ERROR")
-                    return f"Error: {str(e)}", last_valid_translation
+                    return f"Error: {str(e)}", last_valid_translation, gr.update()
             
-            # Set up continuous updates
-            continuous_update_interval = 200  # milliseconds - reduced for more responsive UI
-
+            # Set up continuous updates (interval adapts, see next_poll_update)
             # Register timer tick AFTER defining continuous_update to avoid UnboundLocalError
             continuous_timer.tick(
                 fn=continuous_update,
                 inputs=[cont_source_language, cont_target_language, cont_ollama_model, cont_voice],
-                outputs=[cont_transcription, cont_translation],
+                outputs=[cont_transcription, cont_translation, continuous_timer],
                 show_progress=False
             )
             
@@ -2924,26 +3876,28 @@ def create_ui():
                 try:
                     # Preserve existing keys that aren't in this form
                     if os.path.exists(core.SETTINGS_FILE):
-                        with open(core.SETTINGS_FILE, "r") as f:
+                        with open(core.SETTINGS_FILE, "r", encoding="utf-8") as f:
                             existing = json.load(f)
                             # Merge new with existing, new takes precedence
                             for k, v in new_settings.items():
                                 existing[k] = v
                             new_settings = existing
 
-                    with open(core.SETTINGS_FILE, "w") as f:
-                        json.dump(new_settings, f, indent=4)
+                    if not core.save_settings(new_settings):
+                        yield f"Error saving settings to {core.SETTINGS_FILE}"
+                        return
                     
                     global current_settings
                     current_settings = new_settings
+                    # Report the save before the (possibly slow) model refresh
+                    yield "Settings saved. Refreshing models…"
                     
                     # Refresh Models (using new provider logic and settings)
-                    global available_ollama_models
-                    available_ollama_models = core.fetch_available_models(server_url=translation_url, current_settings=new_settings)
+                    refresh_available_models(new_settings)
                     
-                    return f"Settings saved successfully. Models refreshed."
+                    yield f"Settings saved successfully. Models refreshed."
                 except Exception as e:
-                    return f"Error saving settings: {e}"
+                    yield f"Error saving settings: {e}"
             
             save_btn = gr.Button("Save Server Settings", variant="primary", elem_classes=["orange-button"])
             settings_status = gr.Textbox(label="Status")
@@ -3000,7 +3954,7 @@ def create_ui():
                 monitor_choices = [(f"Monitor {i+1}", str(i)) for i in range(4)]  # fallback
                 if get_monitors:
                     try:
-                        monitors = list(get_monitors())
+                        monitors = cached_monitors()
                         # Sort by X position (left to right) for intuitive numbering
                         sorted_monitors = sorted(enumerate(monitors), key=lambda x: x[1].x)
                         monitor_choices = []
@@ -3121,8 +4075,7 @@ def create_ui():
             display_save_status = gr.Textbox(label="Display Settings Status")
 
             def save_display_settings(font, font_size, font_color, bg_color, monitor_idx, manual_x, manual_y, width, height, pos_x, pos_y, always_on_top, history_size, hold_seconds, h_align, v_align):
-                global user_preferences
-                user_preferences.update({
+                update_user_preferences({
                     "display_font_family": font,
                     "display_font_size": int(font_size),
                     "display_font_color": font_color,
@@ -3140,13 +4093,12 @@ def create_ui():
                     "display_horizontal_align": h_align,
                     "display_vertical_align": v_align,
                 })
-                save_user_preferences(user_preferences)
                 cfg = get_translation_display_config()
                 
                 # Resolve monitor coordinates in main process before sending to display
                 if get_monitors:
                     try:
-                        monitors = get_monitors()
+                        monitors = cached_monitors()
                         # Pass ALL monitor info so 'm' key cycling works
                         all_monitors = []
                         for m in monitors:
@@ -3250,8 +4202,8 @@ def create_ui():
             
             with gr.Row():
                 s_cpu_threads = gr.Slider(
-                    minimum=1, maximum=12, step=1,
-                    value=get_pref_value("cpu_threads", 2, min_value=1, max_value=12, cast_type=int),
+                    minimum=1, maximum=MAX_CPU_THREADS, step=1,
+                    value=get_cpu_threads(),
                     label="CPU Threads (lower = less CPU usage)",
                     info="Threads for compute libs. Lower = less CPU use; higher = faster on multi-core CPUs."
                 )
@@ -3320,41 +4272,41 @@ def create_ui():
             
             # Auto-save status for compute settings
             compute_status = gr.Textbox(label="Compute Settings Status", lines=2, interactive=False)
+            # Both this autosave and Apply reload in the background; the timer reports
+            # the result to whichever status box asked for the reload
+            reload_timer = gr.Timer(2.0, active=False)
+            reload_status_target = gr.State("apply")
             
             def autosave_compute_settings(device, compute_type, whisper_model_size):
-                """Persist compute-related settings immediately without reloading the model to avoid disruptions."""
+                """Persist compute-related settings; Whisper reloads only if they differ from the loaded model."""
                 try:
-                    global user_preferences
-                    user_preferences.update({
+                    update_user_preferences({
                         "compute_device": device,
                         "compute_type": compute_type,
                         "whisper_model_size": str(whisper_model_size),
                     })
-                    save_user_preferences(user_preferences)
-                    was_recording = is_recording_active()
-                    if was_recording:
-                        stop_continuous_recording(clear_intent=False)
-                    reload_whisper_model(force=True)
-                    restart_recording_if_needed(was_recording)
-                    return f"Saved: device={device}, precision={compute_type}, model={whisper_model_size}"
+                    core.WHISPER_MODEL_SIZE = str(whisper_model_size)
+                    precision = resolve_compute_type(resolve_whisper_device(device), compute_type)
+                    if not whisper_reload_needed():
+                        return f"Saved (model already loaded): device={device}, precision={precision}, model={whisper_model_size}", gr.update(), gr.update()
+                    start_whisper_reload()
+                    return (
+                        f"Saved: device={device}, precision={precision}, model={whisper_model_size}\n⏳ Whisper model reloading...",
+                        gr.update(active=True),
+                        "compute",
+                    )
                 except Exception as e:
-                    return f"Error saving compute settings: {e}"
+                    return f"Error saving compute settings: {e}", gr.update(), gr.update()
 
-            # Persist changes when any compute control changes
-            device_dropdown.change(
-                fn=autosave_compute_settings,
-                inputs=[device_dropdown, compute_type_dropdown, whisper_model_dropdown],
-                outputs=[compute_status]
-            )
-            compute_type_dropdown.change(
-                fn=autosave_compute_settings,
-                inputs=[device_dropdown, compute_type_dropdown, whisper_model_dropdown],
-                outputs=[compute_status]
-            )
-            whisper_model_dropdown.change(
+            # Persist changes when any compute control changes. One listener for all
+            # three; while it runs, further changes collapse into a single re-run.
+            gr.on(
+                triggers=[device_dropdown.change, compute_type_dropdown.change, whisper_model_dropdown.change],
                 fn=autosave_compute_settings,
                 inputs=[device_dropdown, compute_type_dropdown, whisper_model_dropdown],
-                outputs=[compute_status]
+                outputs=[compute_status, reload_timer, reload_status_target],
+                trigger_mode="always_last",
+                concurrency_limit=1,
             )
             
             # Preset dropdown hidden - always use Custom mode with manual slider settings
@@ -3379,121 +4331,112 @@ def create_ui():
                 try:
                     messages = []
                     
-                    # DEBUG: Log what we received from the UI
-                    core.log_message(f"DEBUG: VAD checkbox value received: {vad_enabled} (type: {type(vad_enabled)})")
-                    core.log_message(f"DEBUG: Preset selected: {preset_name}")
-                    
                     # Apply preset if not Custom (but don't override VAD checkbox if user manually set it)
-                    if preset_name != "Custom":
-                        if preset_name == "CPU Optimized":
-                            block_ms, overlap_ms = 50, 400
-                            min_sil_ms, min_speech_ms, max_speech_s = 1000, 1800, 6.0
-                            no_speech_th = 0.8
-                            # Don't override vad_enabled - keep user's checkbox value
-                        elif preset_name == "Balanced":
-                            block_ms, overlap_ms = 30, 500
-                            min_sil_ms, min_speech_ms, max_speech_s = 800, 1500, 8.0
-                            no_speech_th = 0.7
-                            # Don't override vad_enabled - keep user's checkbox value
-                        elif preset_name == "Quality Focused":
-                            block_ms, overlap_ms = 20, 600
-                            min_sil_ms, min_speech_ms, max_speech_s = 600, 1000, 12.0
-                            no_speech_th = 0.6
-                            # Don't override vad_enabled - keep user's checkbox value
+                    preset = APPLY_PRESETS.get(preset_name)
+                    if preset is not None:
+                        block_ms, overlap_ms = preset["block_ms"], preset["overlap_ms"]
+                        min_sil_ms, min_speech_ms, max_speech_s = preset["min_silence_ms"], preset["min_speech_ms"], preset["max_speech_s"]
+                        no_speech_th = preset["no_speech"]
                         messages.append(f"Applied {preset_name} preset (VAD filter kept as user set)")
                     
+                    applied = AppliedSettings(
+                        block_duration_ms=int(block_ms),
+                        overlap_ms=int(overlap_ms),
+                        min_silence_ms=int(min_sil_ms),
+                        min_speech_ms=int(min_speech_ms),
+                        max_speech_s=float(max_speech_s),
+                        no_speech_threshold=float(no_speech_th),
+                        vad_filter=bool(vad_enabled),
+                        cpu_threads=max(1, min(MAX_CPU_THREADS, int(cpu_threads))),
+                        processing_batch_size=int(batch_size),
+                        translation_workers=max(1, min(8, int(translation_workers))),
+                        buffer_duration_s=int(buffer_duration),
+                        speech_energy_threshold=float(energy_threshold),
+                        compute_device=device,
+                        compute_type=compute_type,
+                        whisper_model_size=str(whisper_model_size),
+                    )
+                    
                     # Apply timing parameters
                     RUNTIME_PARAMS.update({
-                        "block_duration_ms": int(block_ms),
-                        "overlap_s": float(overlap_ms) / 1000.0,
-                        "min_silence_s": float(min_sil_ms) / 1000.0,
-                        "min_speech_s": float(min_speech_ms) / 1000.0,
-                        "max_speech_s": float(max_speech_s)
+                        "block_duration_ms": applied.block_duration_ms,
+                        "overlap_s": applied.overlap_ms / 1000.0,
+                        "min_silence_s": applied.min_silence_ms / 1000.0,
+                        "min_speech_s": applied.min_speech_ms / 1000.0,
+                        "max_speech_s": applied.max_speech_s
                     })
+                    refresh_timing_config()
                     
                     # Apply Whisper model size
-                    core.WHISPER_MODEL_SIZE = str(whisper_model_size)
+                    core.WHISPER_MODEL_SIZE = applied.whisper_model_size
                     
                     # Apply VAD settings - ensure they're properly set
-                    core.NO_SPEECH_THRESHOLD = float(no_speech_th)
-                    core.VAD_FILTER = bool(vad_enabled)
+                    core.NO_SPEECH_THRESHOLD = applied.no_speech_threshold
+                    core.VAD_FILTER = applied.vad_filter
                     
                     # Log VAD settings for verification
                     core.log_message(f"VAD settings applied: NO_SPEECH_THRESHOLD={core.NO_SPEECH_THRESHOLD}, VAD_FILTER={core.VAD_FILTER}")
                     core.log_message(f"Requested Whisper model size: {core.WHISPER_MODEL_SIZE}")
                     
-                    # Apply CPU settings
-                    os.environ["OMP_NUM_THREADS"] = str(int(cpu_threads))
-                    os.environ["MKL_NUM_THREADS"] = str(int(cpu_threads))
-                    # Enforce thread limits at runtime using threadpoolctl
-                    threadpoolctl.threadpool_limits(limits=int(cpu_threads))
+                    # Apply CPU settings. The env vars are read once at OpenMP/MKL init,
+                    # so they only matter for child processes; in this process CTranslate2
+                    # takes the count (split across its workers) when the model reloads.
+                    thread_count = str(applied.cpu_threads)
+                    if os.environ.get("OMP_NUM_THREADS") != thread_count or os.environ.get("MKL_NUM_THREADS") != thread_count:
+                        os.environ["OMP_NUM_THREADS"] = thread_count
+                        os.environ["MKL_NUM_THREADS"] = thread_count
                     
-                    worker_count = max(1, min(8, int(translation_workers)))
-                    refresh_translation_executor(worker_count)
+                    refresh_translation_executor(applied.translation_workers)
 
                     # Update audio buffer if needed
-                    global audio_buffer
-                    if audio_buffer.max_size != int(core.TARGET_RATE * buffer_duration):
-                        old_audio = audio_buffer.get_audio()
-                        audio_buffer = CircularAudioBuffer(max_duration_seconds=buffer_duration)
-                        if len(old_audio) > 0:
-                            audio_buffer.add_audio(old_audio[-int(core.TARGET_RATE * 2):])
-                    
-                    # Update user preferences
-                    global user_preferences
+                    audio_buffer.resize(applied.buffer_duration_s, keep_seconds=2)
                     
-                    # DEBUG: Log VAD filter before saving
-                    core.log_message(f"DEBUG: About to save vad_filter as: {bool(vad_enabled)}")
+                    # Update user preferences; written off the handler thread, and only if changed
+                    prefs_changed = update_user_preferences(applied._asdict(), delay=0)
                     
-                    user_preferences.update({
-                        "block_duration_ms": int(block_ms),
-                        "overlap_ms": int(overlap_ms),
-                        "min_silence_ms": int(min_sil_ms),
-                        "min_speech_ms": int(min_speech_ms),
-                        "max_speech_s": float(max_speech_s),
-                        "no_speech_threshold": float(no_speech_th),
-                        "vad_filter": bool(vad_enabled),
-                        "cpu_threads": int(cpu_threads),
-                        "processing_batch_size": int(batch_size),
-                        "translation_workers": worker_count,
-                        "buffer_duration_s": int(buffer_duration),
-                        "speech_energy_threshold": float(energy_threshold),
-                        "compute_device": device,
-                        "compute_type": compute_type,
-                        "whisper_model_size": str(whisper_model_size)
-                    })
-                    
-                    # DEBUG: Confirm what was saved
-                    core.log_message(f"DEBUG: Saved vad_filter in user_preferences: {user_preferences.get('vad_filter')}")
+                    if core.LOG_DEBUG:
+                        core.log_message(
+                            f"Apply settings: preset={preset_name}, vad checkbox={vad_enabled!r} ({type(vad_enabled).__name__}), "
+                            f"saved vad_filter={user_preferences.get('vad_filter')}",
+                            "DEBUG",
+                        )
                     
-                    # Force Whisper model reload with new hardware/model settings
-                    try:
-                        was_recording = is_recording_active()
-                        if was_recording:
-                            stop_continuous_recording(clear_intent=False)
-                        new_model = reload_whisper_model(force=True)
-                        actual_device = getattr(new_model.model, 'device', 'unknown')
-                        core.log_message(f"Whisper model reloaded: size={core.WHISPER_MODEL_SIZE}, device={actual_device}, precision={user_preferences.get('compute_type')}")
-                    except Exception as e:
-                        core.log_message(f"Failed to reload Whisper model: {e}", "WARNING")
+                    # Reload Whisper only if device, precision or model size changed;
+                    # the load runs in the background and reload_timer reports the result
+                    precision = resolve_compute_type(resolve_whisper_device(device), compute_type)
+                    model_reloaded = whisper_reload_needed()
+                    if model_reloaded:
+                        start_whisper_reload()
                     else:
-                        restart_recording_if_needed(was_recording)
-                    
-                    # Save all preferences
-                    save_user_preferences(user_preferences)
+                        core.log_message("Whisper model settings unchanged; keeping the loaded model.")
                     
                     messages.extend([
                         "✅ Timing settings applied",
-                        f"✅ VAD settings applied: threshold={float(no_speech_th)}, filter={'ON' if bool(vad_enabled) else 'OFF'}",
+                        f"✅ VAD settings applied: threshold={applied.no_speech_threshold}, filter={'ON' if applied.vad_filter else 'OFF'}",
                         "✅ CPU & translation worker settings applied",
-                        f"✅ Whisper model will reload with {device} + {compute_type}",
-                        "✅ All settings saved to preferences"
+                        f"⏳ Whisper model reloading with {device} + {precision}..." if model_reloaded
+                        else "✅ Whisper model unchanged; kept the loaded model",
+                        "✅ All settings saved to preferences" if prefs_changed
+                        else "✅ Preferences already up to date"
                     ])
                     
-                    return "\n".join(messages)
+                    return (
+                        "\n".join(messages),
+                        gr.update(active=model_reloaded),
+                        "apply" if model_reloaded else gr.update(),
+                    )
                     
                 except Exception as e:
-                    return f"❌ Error applying settings: {e}"
+                    return f"❌ Error applying settings: {e}", gr.update(), gr.update()
+            
+            def poll_whisper_reload(apply_status, compute_status_text, target):
+                """Append the background reload result to the status box that asked for it."""
+                result = whisper_reload_result()
+                if result is None:
+                    return gr.update(), gr.update(), gr.update()
+                if target == "compute":
+                    return gr.update(), f"{compute_status_text}\n{result}", gr.update(active=False)
+                return f"{apply_status}\n{result}", gr.update(), gr.update(active=False)
             
             # Single unified apply button
             apply_all_btn = gr.Button("🚀 Apply & Save All Settings", variant="primary", size="lg")
@@ -3505,7 +4448,14 @@ def create_ui():
                     s_no_speech, s_vad_filter, s_cpu_threads, s_processing_batch, s_translation_workers,
                     s_buffer_size, s_energy_threshold, device_dropdown, compute_type_dropdown, whisper_model_dropdown, preset_dropdown
                 ],
-                outputs=[unified_status]
+                outputs=[unified_status, reload_timer, reload_status_target]
+            )
+            
+            reload_timer.tick(
+                fn=poll_whisper_reload,
+                inputs=[unified_status, compute_status, reload_status_target],
+                outputs=[unified_status, compute_status, reload_timer],
+                show_progress=False
             )
 
             
@@ -3525,12 +4475,10 @@ def create_ui():
             
             def apply_sync_settings(text_delay, audio_delay):
                 try:
-                    global user_preferences
-                    user_preferences.update({
+                    update_user_preferences({
                         "text_display_delay": float(text_delay),
                         "audio_output_delay": float(audio_delay)
                     })
-                    save_user_preferences(user_preferences)
                     return f"Sync settings applied: Text delay {text_delay}s, Audio delay {audio_delay}s"
                 except Exception as e:
                     return f"Error applying sync settings: {e}"
@@ -3554,6 +4502,7 @@ def create_ui():
                         except Exception:
                             pass
                     user_preferences[key] = value
+                    invalidate_prefs_cache()
                 return callback
 
             # Display settings auto-update bindings
@@ -3619,8 +4568,7 @@ def create_ui():
                 
                 log_file = os.path.join(core.LOGS_DIR, f"translation_log_{selected_date}.txt")
                 if os.path.exists(log_file):
-                    with open(log_file, "r", encoding="utf-8") as f:
-                        return f.read()
+                    return read_log_tail(log_file)
                 return f"No logs found for {selected_date}."
             
             def copy_log_to_clipboard(log_content):
@@ -3744,9 +4692,13 @@ def create_ui():
                     if translation_display_manager:
                         translation_display_manager.close()
                     
-                    # Shutdown thread pool executor
+                    # Shutdown thread pool executors
                     if translation_executor:
                         translation_executor.shutdown(wait=False, cancel_futures=True)
+                    if transcription_executor:
+                        transcription_executor.shutdown(wait=False, cancel_futures=True)
+                    _reload_executor.shutdown(wait=False, cancel_futures=True)
+                    stop_translation_log()
                     
                     # Shutdown audio subsystem
                     core.shutdown_audio()
@@ -3833,7 +4785,6 @@ if __name__ == "__main__":
     
     # Start Background Tasks (Cleanup, etc.) - only in main process
     core.log_message("Initializing background tasks...")
-    cleanup_temp_files()
     cleanup_thread = threading.Thread(target=periodic_cleanup, daemon=True)
     cleanup_thread.start()
 
@@ -3867,11 +4818,15 @@ if __name__ == "__main__":
                 print("Closing translation display...")
                 translation_display_manager.close()
                 
-            # 4. Shutdown thread pool executor
+            # 4. Shutdown thread pool executors
             if translation_executor:
                 print("Shutting down translation workers...")
                 translation_executor.shutdown(wait=False, cancel_futures=True)
-            
+            if transcription_executor:
+                transcription_executor.shutdown(wait=False, cancel_futures=True)
+            _reload_executor.shutdown(wait=False, cancel_futures=True)
+            stop_translation_log()
+
             # 5. Shutdown audio subsystem
             print("Releasing audio resources...")
             core.shutdown_audio()
@@ -0,0 +1,133 @@
+import numpy as np
+import main
+import translator_core as core
+
+
+def test_get_audio_returns_latest_samples_after_wrap():
+    buf = main.CircularAudioBuffer(1)
+    size = buf.max_size
+    data = np.arange(size + size // 2, dtype=np.float32)
+    buf.add_audio(data[:size // 2])
+    buf.add_audio(data[size // 2:])
+
+    out = buf.get_audio()
+    assert np.array_equal(out, data[-size:])
+
+    half = buf.get_audio(0.5)
+    assert np.array_equal(half, data[-int(core.TARGET_RATE * 0.5):])
+
+
+def test_get_audio_contiguous_is_view():
+    buf = main.CircularAudioBuffer(1)
+    buf.add_audio(np.ones(1600, dtype=np.float32))
+    out = buf.get_audio()
+    assert len(out) == 1600
+    assert np.shares_memory(out, buf.buffer)
+
+
+def test_overlap_carry_over():
+    buf = main.CircularAudioBuffer(1)
+    data = np.arange(8000, dtype=np.float32)
+    buf.add_audio(data)
+    overlap = buf.get_overlap(0.1)
+    expected = overlap.copy()
+    buf.clear()
+    buf.add_audio(overlap)
+    assert np.array_equal(buf.get_audio(), expected)
+
+
+def test_audio_ring_drain_and_overrun():
+    ring = main.AudioRing(num_slots=4, slot_size=3)
+    ring.put(np.arange(7, dtype=np.float32))
+    assert np.array_equal(ring.drain(), np.arange(7, dtype=np.float32))
+    assert ring.empty()
+
+    for i in range(6):
+        ring.put(np.array([i], dtype=np.float32))
+    # Ring holds 4 slots; newer blocks are dropped until the consumer catches up
+    assert np.array_equal(ring.drain(), np.arange(4, dtype=np.float32))
+    assert len(ring.drain()) == 0
+
+
+def test_total_written_survives_clear():
+    buf = main.CircularAudioBuffer(1)
+    buf.add_audio(np.zeros(1000, dtype=np.float32))
+    buf.clear()
+    buf.add_audio(np.zeros(500, dtype=np.float32))
+    assert buf.data_size == 500
+    assert buf.total_written == 1500
+
+
+def test_audio_ring_drain_reuses_output_buffer():
+    ring = main.AudioRing(num_slots=4, slot_size=4)
+    ring.put(np.ones(6, dtype=np.float32))
+    first = ring.drain()
+    assert np.shares_memory(first, ring._out)
+    ring.put(np.full(2, 2.0, dtype=np.float32))
+    second = ring.drain()
+    assert np.shares_memory(second, first)
+    assert np.array_equal(second, [2.0, 2.0])
+
+
+def test_snapshot_copies_once():
+    buf = main.CircularAudioBuffer(1)
+    size = buf.max_size
+    buf.add_audio(np.arange(1600, dtype=np.float32))
+    snap = buf.snapshot()
+    assert not np.shares_memory(snap, buf.buffer)
+    assert np.array_equal(snap, buf.get_audio())
+
+    # Wrapped data is concatenated into a fresh array; no second copy needed
+    buf.add_audio(np.arange(size, dtype=np.float32))
+    wrapped = buf.snapshot()
+    assert not np.shares_memory(wrapped, buf.buffer)
+    assert np.array_equal(wrapped, np.arange(size, dtype=np.float32))
+
+
+def test_keep_tail_in_place():
+    buf = main.CircularAudioBuffer(1)
+    data = np.arange(20000, dtype=np.float32)
+    buf.add_audio(data)
+    buf.keep_tail(1600)
+    assert buf.data_size == 1600
+    assert np.array_equal(buf.get_audio(), data[-1600:])
+    buf.add_audio(np.ones(400, dtype=np.float32))
+    assert np.array_equal(buf.get_audio()[:1600], data[-1600:])
+    buf.keep_tail(10**6)
+    assert buf.data_size == 2000
+
+
+def test_resize_keeps_newest_audio_across_wrap():
+    buf = main.CircularAudioBuffer(1)
+    data = np.arange(core.TARGET_RATE + 5000, dtype=np.float32)
+    buf.add_audio(data)  # Wraps: write_pos is 5000
+    buf.resize(3, keep_seconds=0.5)
+    keep = int(core.TARGET_RATE * 0.5)
+    assert buf.max_size == core.TARGET_RATE * 3
+    assert np.array_equal(buf.get_audio(), data[-keep:])
+    assert buf.total_written == len(data)
+    buf.add_audio(np.ones(10, dtype=np.float32))
+    assert np.array_equal(buf.get_audio()[:keep], data[-keep:])
+
+
+def test_resize_shrink_reuses_storage():
+    buf = main.CircularAudioBuffer(3)
+    storage = buf.buffer
+    data = np.arange(core.TARGET_RATE * 2, dtype=np.float32)
+    buf.add_audio(data)
+    buf.resize(1, keep_seconds=0.25)
+    assert np.shares_memory(buf.buffer, storage)
+    assert np.array_equal(buf.get_audio(), data[-core.TARGET_RATE // 4:])
+    buf.resize(2)
+    assert np.shares_memory(buf.buffer, storage)
+    assert np.array_equal(buf.get_audio(), data[-core.TARGET_RATE // 4:])
+
+
+def test_resize_in_place_keeps_wrapped_tail():
+    buf = main.CircularAudioBuffer(2)
+    data = np.arange(core.TARGET_RATE * 2 + 3000, dtype=np.float32)
+    buf.add_audio(data)  # Wraps: write_pos is 3000
+    storage = buf.buffer
+    buf.resize(1.5, keep_seconds=1.2)
+    assert np.shares_memory(buf.buffer, storage)
+    assert np.array_equal(buf.get_audio(), data[-int(core.TARGET_RATE * 1.2):])
@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+import main
+
+
+def test_efficient_resample_48k_to_16k():
+    audio = np.sin(np.linspace(0, 100, 48000)).astype(np.float32)
+    out = main.efficient_resample(audio, 48000, 16000)
+    assert out.dtype == np.float32
+    assert len(out) == 16000
+
+
+def test_efficient_resample_same_rate_is_passthrough():
+    audio = np.zeros(1600, dtype=np.float32)
+    assert main.efficient_resample(audio, 16000, 16000) is audio
+
+
+def test_efficient_resample_matches_resample_poly():
+    from scipy.signal import resample_poly
+    audio = np.random.default_rng(0).standard_normal(4410).astype(np.float32)
+    out = main.efficient_resample(audio, 44100, 16000)
+    expected = resample_poly(audio, 160, 441, window=('kaiser', 8.0))
+    assert len(out) == len(expected)
+    assert np.allclose(out, expected, atol=1e-4)
+    # Taps are designed once per rate pair
+    assert (44100, 16000) in main._RESAMPLER_CACHE
+
+
+def test_streaming_resampler_matches_one_shot_resample():
+    audio = np.random.default_rng(1).standard_normal(48000).astype(np.float32)
+    resampler = main.StreamingResampler(48000, 16000)
+    blocks = [resampler.process(audio[i:i + 1440]) for i in range(0, len(audio), 1440)]
+    streamed = np.concatenate(blocks)
+    expected = main.efficient_resample(audio, 48000, 16000)
+    # Only the filter tail at the very end is still pending
+    assert 0 <= len(expected) - len(streamed) < 32
+    assert np.allclose(streamed, expected[:len(streamed)], atol=1e-4)
+
+
+def test_peak_normalize_in_place():
+    audio = np.array([0.5, -4.0, 2.0], dtype=np.float32)
+    out = main._peak_normalize(audio)
+    assert np.allclose(out, [0.125, -1.0, 0.5])
+    quiet = np.array([0.5, -0.25], dtype=np.float32)
+    assert np.array_equal(main._peak_normalize(quiet), [0.5, -0.25])
+
+
+def test_owned_audio_copies_caller_array():
+    audio = np.array([0.5, -4.0, 2.0], dtype=np.float32)
+    owned = main.owned_audio(main.downmix_to_mono(main.pcm_to_float32(audio)), audio)
+    main._peak_normalize(owned)
+    assert np.array_equal(audio, [0.5, -4.0, 2.0])
+    converted = main.pcm_to_float32(np.array([16384], dtype=np.int16))
+    assert main.owned_audio(converted, np.zeros(1, dtype=np.int16)) is converted  # Already a fresh array
+
+
+def test_streaming_resampler_accepts_reused_scratch_buffer():
+    audio = np.random.default_rng(2).standard_normal(48000).astype(np.float32)
+    resampler = main.StreamingResampler(48000, 16000)
+    scratch = np.empty(960, dtype=np.float32)
+    blocks = []
+    for i in range(0, len(audio), 960):
+        np.copyto(scratch, audio[i:i + 960])
+        blocks.append(resampler.process(scratch))
+        scratch.fill(np.nan)  # Next callback overwrites the block
+    streamed = np.concatenate(blocks)
+    expected = main.efficient_resample(audio, 48000, 16000)
+    assert np.allclose(streamed, expected[:len(streamed)], atol=1e-4)
+
+
+def test_pcm_to_float32_scales_int16():
+    pcm = np.array([0, 16384, -32768], dtype=np.int16)
+    out = main.pcm_to_float32(pcm)
+    assert out.dtype == np.float32
+    assert np.array_equal(out, [0.0, 0.5, -1.0])
+    audio = np.zeros(4, dtype=np.float32)
+    assert main.pcm_to_float32(audio) is audio
+
+
+def test_downmix_to_mono_float32():
+    stereo = np.array([[1.0, 0.0], [0.5, 0.5], [-1.0, 1.0]], dtype=np.float32)
+    mono = main.downmix_to_mono(stereo)
+    assert mono.dtype == np.float32
+    assert np.array_equal(mono, [0.5, 0.5, 0.0])
+
+
+def test_soxr_stream_resampler_tracks_polyphase_output():
+    pytest.importorskip("soxr")
+    audio = np.sin(2 * np.pi * 440 * np.arange(48000) / 48000).astype(np.float32)
+    resampler = main.make_stream_resampler(48000, 16000)
+    assert isinstance(resampler, main.SoxrStreamingResampler)
+    streamed = np.concatenate([resampler.process(audio[i:i + 1440]) for i in range(0, len(audio), 1440)])
+    expected = main.efficient_resample(audio, 48000, 16000)
+    assert streamed.dtype == np.float32
+    assert np.allclose(streamed[100:-100], expected[100:len(streamed) - 100], atol=1e-3)
@@ -50,3 +50,16 @@ def test_translate_success():
             result = translate("Hello", "English", "Spanish", "test-model", settings)
             assert result == "Hola"
             mock_client.chat.completions.create.assert_called_once()
+
+
+def test_get_translation_client_reuses_client_per_endpoint():
+    """Same endpoint and key share one client (and its connection pool)."""
+    settings = {
+        "translation_provider": "Ollama",
+        "translation_server": "http://reuse-server:11434"
+    }
+    with patch("translator_core.OpenAI") as mock_openai:
+        first, _, _ = get_translation_client(settings)
+        second, _, _ = get_translation_client(dict(settings))
+        assert first is second
+        mock_openai.assert_called_once()
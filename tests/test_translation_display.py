@@ -0,0 +1,23 @@
+import multiprocessing as mp
+import time
+
+import main
+
+
+def test_send_returns_when_display_stops_reading():
+    manager = main.TranslationDisplayManager()
+    recv_conn, manager._conn = mp.Pipe(duplex=False)
+    manager._start_sender()
+    payload = "x" * 65536
+    try:
+        start = time.monotonic()
+        for _ in range(200):  # Far more than the pipe buffer holds
+            assert manager._send(("text", payload)) is True
+        assert time.monotonic() - start < 2.0
+        assert manager._send(("config", {})) is True
+        texts = [kind for kind, _ in manager._outbox if kind == "text"]
+        assert len(texts) <= main.DISPLAY_OUTBOX_MAX_TEXTS
+        assert manager._outbox[-1] == ("config", {})
+    finally:
+        recv_conn.close()  # Unblocks the sender thread with a broken pipe
+        manager._close_conn()
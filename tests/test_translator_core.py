@@ -12,4 +12,94 @@ def test_clean_language_name():
     assert clean_language_name('🇲🇽 Spanish (Google only)') == 'Spanish'
     assert clean_language_name('Mandarin Chinese') == 'Chinese'
     assert clean_language_name('Brazilian Portuguese') == 'Portuguese'
-    assert clean_language_name('Just Language') == 'Just Language'
\ No newline at end of file
+    assert clean_language_name('Just Language') == 'Just Language'
+
+
+def test_auto_detect_reuses_confident_language():
+    import types
+    import numpy as np
+    import translator_core as core
+
+    class FakeModel:
+        def __init__(self):
+            self.languages = []
+
+        def transcribe(self, audio, language=None, **kwargs):
+            self.languages.append(language)
+            info = types.SimpleNamespace(language=language or "es", language_probability=0.97)
+            return [types.SimpleNamespace(text="Hola hermanos")], info
+
+    model = FakeModel()
+    audio = np.full(1600, 0.1, dtype=np.float32)
+    core.reset_detected_language()
+    try:
+        assert core.transcribe_audio(audio, "Auto-Detect", model) == ("Hola hermanos", "es")
+        assert core.transcribe_audio(audio, "Auto-Detect", model) == ("Hola hermanos", "es")
+        assert model.languages == [None, "es"]
+    finally:
+        core.reset_detected_language()
+
+
+def test_is_speech_uses_mean_abs_energy():
+    import numpy as np
+    from translator_core import audio_energy, is_speech
+    chunk = np.array([0.01, -0.01, 0.01, -0.01], dtype=np.float32)
+    assert audio_energy(chunk) == pytest.approx(0.01)
+    assert is_speech(chunk, min_threshold=0.005) is True
+    assert is_speech(chunk, min_threshold=0.02) is False
+    assert audio_energy(np.zeros(0, dtype=np.float32)) == 0.0
+
+
+def test_transcribe_audio_batch_maps_segments_back_to_windows(monkeypatch):
+    import types
+    import numpy as np
+    import translator_core as core
+
+    class FakeBatchedPipeline:
+        def transcribe(self, audio, clip_timestamps=None, batch_size=None, **kwargs):
+            self.clips = clip_timestamps
+            segments = [
+                types.SimpleNamespace(start=clip["start"] + 0.1, text=f"window {i}")
+                for i, clip in enumerate(clip_timestamps) if i != 1
+            ]
+            return iter(segments), types.SimpleNamespace(language="en")
+
+    monkeypatch.setattr(core, "WHISPER_BATCH_SIZE", 8)
+    model = FakeBatchedPipeline()
+    windows = [np.full(n, 0.1, dtype=np.float32) for n in (16000, 8000, 16000)]
+    results = core.transcribe_audio_batch(windows, "English", model)
+    assert results == [("window 0", "en"), (None, None), ("window 2", "en")]
+    assert model.clips[1] == {"start": 1.0, "end": 1.5}
+
+
+def test_transcribe_audio_batch_gates_windows_and_locks_language(monkeypatch):
+    import types
+    import numpy as np
+    import translator_core as core
+
+    class FakeBatchedPipeline:
+        def transcribe(self, audio, language=None, clip_timestamps=None, **kwargs):
+            self.audio = audio
+            self.clips = clip_timestamps
+            segments = [
+                types.SimpleNamespace(start=clip["start"] + 0.1, text=f"hola {i}")
+                for i, clip in enumerate(clip_timestamps)
+            ]
+            return iter(segments), types.SimpleNamespace(language="es", language_probability=0.97)
+
+    monkeypatch.setattr(core, "WHISPER_BATCH_SIZE", 8)
+    model = FakeBatchedPipeline()
+    windows = [
+        np.full(16000, 2.0, dtype=np.float32),
+        np.zeros(8000, dtype=np.float32),
+        np.full(16000, 0.1, dtype=np.float32),
+    ]
+    core.reset_detected_language()
+    try:
+        results = core.transcribe_audio_batch(windows, "Auto-Detect", model)
+        assert results == [("hola 0", "es"), (None, None), ("hola 1", "es")]
+        assert len(model.clips) == 2
+        assert np.abs(model.audio).max() == pytest.approx(1.0)
+        assert core._session_language == "es"
+    finally:
+        core.reset_detected_language()
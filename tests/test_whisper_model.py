@@ -0,0 +1,45 @@
+import threading
+import time
+
+import pytest
+import main
+
+
+@pytest.fixture
+def no_model(monkeypatch):
+    monkeypatch.setattr(main, "whisper_model", None)
+    monkeypatch.setattr(main, "_loaded_model_sig", None)
+    monkeypatch.setattr(main, "whisper_model_signature", lambda: ("cpu", "int8", "base", 4))
+
+
+def test_concurrent_callers_load_one_model(monkeypatch, no_model):
+    loads = []
+
+    def slow_load():
+        loads.append(object())
+        time.sleep(0.2)
+        return loads[-1], ("cpu", "int8", "base", 4)
+
+    monkeypatch.setattr(main, "_load_whisper_model", slow_load)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(main.get_whisper_model())) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    assert main.get_whisper_model(blocking=False) is None  # Another thread holds the loader
+    for thread in threads:
+        thread.join()
+    assert len(loads) == 1
+    assert results == [loads[0]] * 3
+
+
+def test_failed_load_records_no_signature(monkeypatch, no_model):
+    def failing_load():
+        raise RuntimeError("out of memory")
+
+    monkeypatch.setattr(main, "_load_whisper_model", failing_load)
+    with pytest.raises(RuntimeError):
+        main.reload_whisper_model(force=True)
+    assert main.whisper_model is None
+    assert main._loaded_model_sig is None
+    assert main.whisper_reload_needed()
@@ -11,6 +11,10 @@ import datetime
 import json
 import threading
 from openai import OpenAI
+try:
+    import orjson  # Installed with gradio; stdlib json is the fallback
+except ImportError:
+    orjson = None
 # from faster_whisper import WhisperModel  # Moved to function scope for lazy loading
 
 # --- Configuration ---
@@ -44,6 +48,16 @@ PROVIDER_CONFIGS = {
 # Make these module-level so the app can adjust them without restarting
 NO_SPEECH_THRESHOLD: float = 0.7  # higher = stricter silence detection
 VAD_FILTER: bool = False          # Whisper's internal VAD (may drop soft speech on Linux)
+WHISPER_BATCH_SIZE: int = 0       # >0 when the model is a BatchedInferencePipeline
+LANGUAGE_LOCK_PROBABILITY: float = 0.9  # Auto-Detect reuses a language detected at least this confidently
+
+# Language locked in by Auto-Detect for the current recording session
+_session_language = None
+
+def reset_detected_language():
+    """Forget the Auto-Detect language so the next window detects it again."""
+    global _session_language
+    _session_language = None
 
 WHISPER_MODEL_SIZE = "small"
 # Map display names to Whisper language codes (ISO 639-1)
@@ -389,8 +403,11 @@ TARGET_RATE = 16000
 BLOCK_DURATION_MS = 100
 
 # --- Logging Setup ---
+# Set GOSPEL_DEBUG=1 for DEBUG records; hot paths check LOG_DEBUG before formatting them
+LOG_DEBUG = os.environ.get("GOSPEL_DEBUG") == "1"
 logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    level=logging.DEBUG if LOG_DEBUG else logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
 )
 
 if not os.path.exists(LOGS_DIR):
@@ -436,7 +453,7 @@ def load_settings():
     """Loads settings from SETTINGS_FILE or returns defaults."""
     try:
         if os.path.exists(SETTINGS_FILE):
-            with open(SETTINGS_FILE, "r") as f:
+            with open(SETTINGS_FILE, "r", encoding="utf-8") as f:
                 loaded = json.load(f)
                 # Validate basic structure (can be expanded)
                 if (
@@ -459,10 +476,16 @@ def load_settings():
 
 
 def save_settings(settings):
-    """Saves settings to SETTINGS_FILE."""
+    """Saves settings to SETTINGS_FILE (via a temp file, so a crash can't truncate it)."""
     try:
-        with open(SETTINGS_FILE, "w") as f:
-            json.dump(settings, f, indent=2)
+        if orjson is not None:
+            data = orjson.dumps(settings, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        else:
+            data = (json.dumps(settings, indent=2) + "\n").encode("utf-8")
+        tmp_path = SETTINGS_FILE + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, SETTINGS_FILE)
         log_message(f"Saved settings to {SETTINGS_FILE}")
         return True
     except Exception as e:
@@ -490,6 +513,11 @@ def clean_language_name(language_name):
         return "Portuguese"
     return cleaned.strip()
 
+# One client per (base_url, api_key): each owns an httpx connection pool, so the
+# translation workers share keep-alive connections instead of reconnecting per call
+_translation_clients = {}
+_translation_clients_lock = threading.Lock()
+
 def get_translation_client(current_settings):
     """
     Factory to create an OpenAI-compatible client for the selected provider.
@@ -528,7 +556,11 @@ def get_translation_client(current_settings):
             return None, None, f"API Key required for {provider}"
 
     try:
-        client = OpenAI(base_url=base_url, api_key=api_key)
+        with _translation_clients_lock:
+            client = _translation_clients.get((base_url, api_key))
+            if client is None:
+                client = OpenAI(base_url=base_url, api_key=api_key)
+                _translation_clients[(base_url, api_key)] = client
         return client, None, None
     except Exception as e:
         return None, None, f"Failed to initialize client: {e}"
@@ -685,6 +717,46 @@ def translate(
         return None
 
 
+def _prepare_window(audio):
+    """Float32 1-D window scaled into [-1, 1], or None if it is silent or too quiet to transcribe."""
+    if audio.dtype != np.float32:
+        log_message(
+            f"Incorrect audio dtype: {audio.dtype}, converting.", "WARNING"
+        )
+    # No copy for the usual contiguous 1-D float32 window
+    audio = np.ascontiguousarray(audio, dtype=np.float32).ravel()
+    # One abs pass feeds both the peak check and the energy gate
+    abs_audio = np.abs(audio)
+    max_val = abs_audio.max() if len(audio) else 0.0
+    energy = abs_audio.mean() if len(audio) else 0.0
+    if max_val > 1.0:
+        log_message(
+            f"Audio max abs value {max_val:.3f} > 1.0, normalizing.", "DEBUG"
+        )
+        audio = audio / max_val
+        energy /= max_val
+    elif max_val == 0:
+        log_message("Audio segment is pure silence.", "DEBUG")
+        return None
+
+    if energy < 0.0001:
+        log_message(f"Audio energy ({energy:.4f}) too low, skipping.", "DEBUG")
+        return None
+
+    log_message(
+        f"Transcribing audio segment (shape: {audio.shape}, dtype: {audio.dtype}, energy: {energy:.4f})",
+        "DEBUG",
+    )
+    return audio
+
+def _maybe_lock_session_language(source_language, info):
+    """Under Auto-Detect, keep a confidently detected language for the rest of the session."""
+    global _session_language
+    if LANGUAGE_CODES.get(source_language) is None and not _session_language \
+            and info.language_probability >= LANGUAGE_LOCK_PROBABILITY:
+        _session_language = info.language
+        log_message(f"Auto-Detect locked source language to '{info.language}' for this session.")
+
 def transcribe_audio(audio, source_language, whisper_model=None):
     """Transcribes audio using the Faster Whisper model."""
     # Mark transcribing active
@@ -709,35 +781,21 @@ def transcribe_audio(audio, source_language, whisper_model=None):
         log_message(f"Error loading Whisper model: {e}", "ERROR")
         
     try:
-        if audio.dtype != np.float32:
-            log_message(
-                f"Incorrect audio dtype: {audio.dtype}, converting.", "WARNING"
-            )
-            audio = audio.astype(np.float32)
-        max_val = np.max(np.abs(audio))
-        if max_val > 1.0:
-            log_message(
-                f"Audio max abs value {max_val:.3f} > 1.0, normalizing.", "DEBUG"
-            )
-            audio = audio / max_val
-        elif max_val == 0:
-            log_message("Audio segment is pure silence.", "DEBUG")
+        audio = _prepare_window(audio)
+        if audio is None:
             return None, None
 
-        energy = np.abs(audio).mean()
-        if energy < 0.0001:
-            log_message(f"Audio energy ({energy:.4f}) too low, skipping.", "DEBUG")
-            return None, None
-
-        log_message(
-            f"Transcribing audio segment (shape: {audio.shape}, dtype: {audio.dtype}, energy: {energy:.4f})",
-            "DEBUG",
-        )
         # Determine language code for Whisper using the mapping
         whisper_lang_code = LANGUAGE_CODES.get(
             source_language, None
         )  # Get code from mapping
+        auto_detect = whisper_lang_code is None
+        if auto_detect and _session_language:
+            # Skip Whisper's language-detection pass once the session language is known
+            whisper_lang_code = _session_language
 
+        # Batched pipelines decode the window's segments in parallel
+        batch_kwargs = {"batch_size": WHISPER_BATCH_SIZE} if WHISPER_BATCH_SIZE > 0 else {}
         segments, info = whisper_model.transcribe(
             audio,
             language=whisper_lang_code,  # Use the code (or None for auto-detect)
@@ -747,7 +805,8 @@ def transcribe_audio(audio, source_language, whisper_model=None):
             condition_on_previous_text=False,
             beam_size=1,              # CPU optimization: reduce beam size
             best_of=1,                # CPU optimization: reduce candidates
-            word_timestamps=False     # CPU optimization: disable if not needed
+            word_timestamps=False,    # CPU optimization: disable if not needed
+            **batch_kwargs
         )
         # Get the actual language code detected or used
         detected_lang_code = info.language
@@ -760,6 +819,7 @@ def transcribe_audio(audio, source_language, whisper_model=None):
         if not text:
             log_message(f"Filtered out empty transcription: '{text}'", "DEBUG")
             return None, None  # Return None for both text and lang_code
+        _maybe_lock_session_language(source_language, info)
         log_message(f"Transcription: {text}")
         return text, detected_lang_code  # Return text and detected code
     except Exception as e:
@@ -772,6 +832,84 @@ def transcribe_audio(audio, source_language, whisper_model=None):
             pass
 
 
+
+def transcribe_audio_batch(audios, source_language, whisper_model):
+    """Transcribe several windows; one batched decode when the model is a BatchedInferencePipeline.
+
+    Returns a list of (text, lang_code) tuples in the same order as audios.
+    """
+    if WHISPER_BATCH_SIZE <= 0 or len(audios) < 2:
+        return [transcribe_audio(audio, source_language, whisper_model) for audio in audios]
+
+    # Same normalization and silence gate as transcribe_audio, per window
+    prepared = [_prepare_window(audio) for audio in audios]
+    keep = [i for i, audio in enumerate(prepared) if audio is not None]
+    results = [(None, None)] * len(audios)
+    if len(keep) < 2:
+        for i in keep:
+            results[i] = transcribe_audio(prepared[i], source_language, whisper_model)
+        return results
+    batch = [prepared[i] for i in keep]
+    batch_results = _transcribe_prepared_batch(batch, source_language, whisper_model)
+    for i, result in zip(keep, batch_results):
+        results[i] = result
+    return results
+
+
+def _transcribe_prepared_batch(audios, source_language, whisper_model):
+    """One batched decode of prepared windows, falling back to one call per window on error."""
+    results = None
+    try:
+        transcribing_event.set()
+    except NameError:
+        pass
+    try:
+        # Lay the windows end to end; clip_timestamps makes each one its own batch item
+        lengths = [len(audio) for audio in audios]
+        ends = np.cumsum(lengths) / TARGET_RATE
+        clips = [
+            {"start": float(end) - length / TARGET_RATE, "end": float(end)}
+            for end, length in zip(ends, lengths)
+        ]
+        whisper_lang_code = LANGUAGE_CODES.get(source_language, None) or _session_language
+        segments, info = whisper_model.transcribe(
+            np.concatenate(audios),
+            language=whisper_lang_code,
+            temperature=0.0,
+            no_speech_threshold=NO_SPEECH_THRESHOLD,
+            condition_on_previous_text=False,
+            beam_size=1,
+            best_of=1,
+            word_timestamps=False,
+            clip_timestamps=clips,
+            batch_size=WHISPER_BATCH_SIZE,
+        )
+        texts = [[] for _ in audios]
+        for segment in segments:
+            idx = min(int(np.searchsorted(ends, segment.start, side="right")), len(audios) - 1)
+            texts[idx].append(segment.text)
+        results = []
+        for parts in texts:
+            text = " ".join(parts).strip()
+            results.append((text, info.language) if text else (None, None))
+            if text:
+                log_message(f"Transcription: {text}")
+        log_message(f"Batched transcription of {len(audios)} windows (language: {info.language})", "DEBUG")
+        if any(text for text, _ in results):
+            _maybe_lock_session_language(source_language, info)
+    except Exception as e:
+        log_message(f"Batched transcription error: {e}; transcribing windows one at a time", "WARNING")
+    finally:
+        try:
+            transcribing_event.clear()
+        except NameError:
+            pass
+
+    if results is None:
+        results = [transcribe_audio(audio, source_language, whisper_model) for audio in audios]
+    return results
+
+
 def is_complete_sentence(text):
     """Checks if text seems like a complete sentence (basic heuristic)."""
     if not text:
@@ -783,11 +921,21 @@ def is_complete_sentence(text):
     return False
 
 
-def is_speech(audio_chunk, min_threshold=0.0008, max_threshold=0.6):
+SPEECH_MAX_ENERGY = 0.6  # Mean |amplitude| above this is treated as noise/clipping, not speech
+
+
+def audio_energy(audio_chunk):
+    """Mean absolute amplitude, the unit speech_energy_threshold is calibrated in."""
+    if audio_chunk is None or len(audio_chunk) == 0:
+        return 0.0
+    return float(np.abs(audio_chunk).mean())
+
+
+def is_speech(audio_chunk, min_threshold=0.0008, max_threshold=SPEECH_MAX_ENERGY):
     """Checks if audio chunk energy is within speech range."""
     if audio_chunk is None or len(audio_chunk) == 0:
         return False
-    energy = np.abs(audio_chunk).mean()
+    energy = audio_energy(audio_chunk)
     # More lenient threshold to catch quieter speech
     return min_threshold < energy < max_threshold
 
@@ -1053,13 +1201,22 @@ def shutdown_audio():
     audio_player.close()
 
 
-def fetch_available_models(server_url=None, current_settings=None):
-    """Fetches available models from the configured provider (Ollama, OpenAI, etc.).
-    
-    Args:
-        server_url: Optional server URL for Ollama.
-        current_settings: Optional settings dict. If not provided, loads from file.
-    """
+FALLBACK_MODELS = {
+    "Ollama": ("llama3.2:3b-instruct-q4_K_M",),
+    "OpenAI": ("gpt-4o", "gpt-4o-mini", "gpt-4-turbo", "gpt-3.5-turbo"),
+    # Updated Groq models (as of late 2024)
+    "Groq": ("llama-3.3-70b-versatile", "llama-3.1-8b-instant", "gemma2-9b-it", "mixtral-8x7b-32768", "llama3-70b-8192", "llama3-8b-8192"),
+    "Grok (xAI)": ("grok-beta", "grok-vision-beta"),  # Subject to change
+    "Mistral": ("mistral-large-latest", "mistral-medium-latest", "mistral-small-latest", "open-mistral-7b"),
+}
+
+def fallback_models(provider):
+    """Known-good model names to offer when the provider's list can't be fetched."""
+    # Custom or unknown providers get a placeholder the user can overwrite
+    return list(FALLBACK_MODELS.get(provider, ("custom-model-name",)))
+
+def fetch_provider_models(server_url=None, current_settings=None):
+    """Fetch the provider's live model list; None if it could not be fetched or was empty."""
     if current_settings is None:
         current_settings = load_settings()
     provider = current_settings.get("translation_provider", "Ollama")
@@ -1077,12 +1234,12 @@ def fetch_available_models(server_url=None, current_settings=None):
             model_names = sorted([model["name"] for model in models_data.get("models", [])])
             if not model_names:
                 log_message("No Ollama models found via API.", "WARNING")
-                return ["llama3.2:3b-instruct-q4_K_M"]
+                return None
             log_message(f"Found Ollama models: {', '.join(model_names)}")
             return model_names
         except Exception as e:
             log_message(f"Error fetching Ollama models: {e}", "ERROR")
-            return ["llama3.2:3b-instruct-q4_K_M"]
+            return None
 
     # For OpenAI and compatible APIs, we can also try to fetch models if the API supports it
     # But usually, it's safer to provide a known-good list or allow custom entry
@@ -1102,21 +1259,23 @@ def fetch_available_models(server_url=None, current_settings=None):
                 log_message(f"API returned empty model list for {provider}, using defaults", "WARNING")
         except Exception as e:
             log_message(f"Could not fetch models from {provider} API (using defaults): {e}", "WARNING")
+    return None
 
-    # Fallback defaults for cloud providers
-    log_message(f"Using fallback model list for {provider}")
-    if provider == "OpenAI":
-        return ["gpt-4o", "gpt-4o-mini", "gpt-4-turbo", "gpt-3.5-turbo"]
-    elif provider == "Groq":
-        # Updated Groq models (as of late 2024)
-        return ["llama-3.3-70b-versatile", "llama-3.1-8b-instant", "gemma2-9b-it", "mixtral-8x7b-32768", "llama3-70b-8192", "llama3-8b-8192"]
-    elif provider == "Grok (xAI)":
-        return ["grok-beta", "grok-vision-beta"] # Subject to change
-    elif provider == "Mistral":
-        return ["mistral-large-latest", "mistral-medium-latest", "mistral-small-latest", "open-mistral-7b"]
+def fetch_available_models(server_url=None, current_settings=None):
+    """Fetches available models from the configured provider (Ollama, OpenAI, etc.).
     
-    # Custom or unknown
-    return ["custom-model-name"]
+    Args:
+        server_url: Optional server URL for Ollama.
+        current_settings: Optional settings dict. If not provided, loads from file.
+    """
+    if current_settings is None:
+        current_settings = load_settings()
+    model_names = fetch_provider_models(server_url, current_settings)
+    if model_names:
+        return model_names
+    provider = current_settings.get("translation_provider", "Ollama")
+    log_message(f"Using fallback model list for {provider}")
+    return fallback_models(provider)
 
 
 # --- Health / Status Flags ---